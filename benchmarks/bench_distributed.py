@@ -0,0 +1,67 @@
+"""
+Data-parallel NeuroSymbolicReasoner training scaling benchmark.
+
+Trains the reasoner with 1, 2, 4 and 8 gloo processes on the same data and
+reports throughput, speedup over one process and parallel efficiency.
+Every process uses one intra-op thread, so speedups are only meaningful
+up to the number of physical cores.
+
+Usage:
+    python benchmarks/bench_distributed.py [--processes N ...] [--samples S]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import torch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.reasoning.distributed import train_data_parallel
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, nargs="*", default=[1, 2, 4, 8])
+    parser.add_argument("--samples", type=int, default=16384)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--input-dim", type=int, default=32)
+    parser.add_argument("--hidden-dim", type=int, default=256)
+    parser.add_argument("--bucket-cap-mb", type=float, default=25.0)
+    args = parser.parse_args(argv)
+
+    n_symbols = 8
+    reasoner_kwargs = {
+        "input_dim": args.input_dim,
+        "n_symbols": n_symbols,
+        "hidden_dim": args.hidden_dim,
+        "rules": [f"{i} AND {(i + 1) % n_symbols}" for i in range(n_symbols)]
+    }
+    torch.manual_seed(0)
+    inputs = torch.rand(args.samples, args.input_dim)
+    targets = torch.softmax(torch.randn(args.samples, args.input_dim), dim=1)
+
+    base = None
+    for world_size in args.processes:
+        result = train_data_parallel(
+            reasoner_kwargs, inputs, targets, world_size=world_size,
+            epochs=args.epochs, batch_size=args.batch_size,
+            bucket_cap_mb=args.bucket_cap_mb
+        )
+        throughput = result["samples_per_s"]
+        base = base or throughput
+        speedup = throughput / base
+        print(json.dumps({
+            "processes": world_size,
+            "samples_per_s": throughput,
+            "elapsed_s": result["elapsed_s"],
+            "speedup": speedup,
+            "efficiency": speedup / world_size,
+            "final_loss": result["ranks"][0]["losses"][-1]
+        }), flush=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
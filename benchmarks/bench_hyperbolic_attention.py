@@ -0,0 +1,111 @@
+"""
+Hyperbolic attention CPU benchmark.
+
+Runs HyperbolicAttention over a range of sequence lengths, each in a fresh
+interpreter, and reports latency and peak resident memory above the
+inputs. Chunked attention is compared against a single dense block
+(chunk_size = sequence length), which is skipped above --dense-max.
+
+Usage:
+    python benchmarks/bench_hyperbolic_attention.py [--lengths N ...] [--train]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, resource, time, torch
+from src.manifolds.hyperbolic_attention import HyperbolicAttention, expmap0
+
+torch.manual_seed(0)
+torch.set_num_threads({threads})
+layer = HyperbolicAttention({dim}, chunk_size={chunk_size})
+x = expmap0(0.3 * torch.randn({batch}, {length}, {dim}))
+train = {train}
+layer.train(train)
+
+def run():
+    with torch.set_grad_enabled(train):
+        out = layer(x.requires_grad_(train))
+        if train:
+            out.sum().backward()
+
+run()
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+times = []
+for _ in range({repeats}):
+    start = time.perf_counter()
+    run()
+    times.append(time.perf_counter() - start)
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"latency_s": min(times), "peak_rss_mb": after / 1024, "first_call_peak_mb": before / 1024}}))
+"""
+
+def measure(length: int, chunk_size: int, dim: int = 16, batch: int = 1,
+            train: bool = False, repeats: int = 3, threads: int = 1) -> dict:
+    """
+    Measure one configuration in a fresh interpreter.
+
+    Args:
+        length: Sequence length
+        chunk_size: Query/key block size
+        dim: Ball dimension
+        batch: Batch size
+        train: Include backward in training mode
+        repeats: Timed repetitions (best is reported)
+        threads: torch intra-op threads
+
+    Returns:
+        Dictionary with best latency (s) and peak RSS (MB)
+    """
+    code = _PROBE.format(
+        length=length, chunk_size=chunk_size, dim=dim, batch=batch,
+        train=train, repeats=repeats, threads=threads
+    )
+    baseline = subprocess.run(
+        [sys.executable, "-c", "import resource, torch\n"
+         "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    stats = json.loads(result.stdout)
+    stats["peak_rss_mb"] -= float(baseline.stdout)
+    stats["first_call_peak_mb"] -= float(baseline.stdout)
+    return stats
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lengths", type=int, nargs="*",
+                        default=[256, 512, 1024, 2048, 4096, 8192])
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--dense-max", type=int, default=4096,
+                        help="longest sequence also run as one dense block")
+    parser.add_argument("--dim", type=int, default=16)
+    parser.add_argument("--batch", type=int, default=1)
+    parser.add_argument("--train", action="store_true",
+                        help="time forward and backward in training mode")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    for length in args.lengths:
+        modes = {"chunked": args.chunk_size}
+        if length <= args.dense_max:
+            modes["dense"] = length
+        for mode, chunk_size in modes.items():
+            stats = measure(length, chunk_size, args.dim, args.batch,
+                            args.train, args.repeats, args.threads)
+            print(json.dumps({"length": length, "mode": mode,
+                              "chunk_size": chunk_size, "train": args.train, **stats}))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Cold-start import benchmark.
+
+Each target is imported in a fresh interpreter; the reported time is the
+best wall time over several runs minus that of a bare interpreter. Targets
+that need a heavy backend are budgeted relative to importing that backend
+in the same run, so only the package's own import cost counts against
+them. With --check, the script exits non-zero when a target exceeds its
+budget or loads a heavy backend it should not need.
+
+Usage:
+    python benchmarks/bench_import.py [--check] [--repeats N] [--scale X]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["torch", "pennylane", "qiskit", "geometric_algebra", "numpy"]
+
+# name -> (statement, budget in seconds, forbidden modules, baseline statement).
+# The budget is above a bare interpreter, or above the baseline statement's
+# import time measured in the same run when one is given.
+TARGETS = {
+    "package": (
+        "import src",
+        0.1,
+        ["torch", "pennylane", "qiskit", "numpy"],
+        None
+    ),
+    "dynamic_batch": (
+        "from src.optimizers.dynamic_batch import DynamicBatchSizer",
+        0.5,
+        ["torch", "pennylane", "qiskit"],
+        None
+    ),
+    "instrumentation": (
+        "from src.metrics import instrumentation",
+        0.1,
+        ["torch", "pennylane", "qiskit", "numpy"],
+        None
+    ),
+    "logic_engine": (
+        "from src.reasoning.neuro_symbolic import LogicEngine",
+        0.5,
+        ["pennylane", "qiskit"],
+        "import torch"
+    ),
+    "qite_optimizer": (
+        "from src import QITEOptimizer",
+        0.5,
+        ["pennylane", "qiskit"],
+        "import torch"
+    ),
+}
+
+_PROBE = """
+import json, sys, types
+{statement}
+loaded = [
+    name for name in {heavy!r}
+    if isinstance(sys.modules.get(name), types.ModuleType)
+    and type(sys.modules[name]).__name__ != "_LazyModule"
+]
+print(json.dumps(loaded))
+"""
+
+def _run(code: str) -> tuple:
+    """Run code in a fresh interpreter, returning (wall time, stdout)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return time.perf_counter() - start, result.stdout
+
+def measure(statement: str, repeats: int = 5) -> dict:
+    """
+    Measure cold-start time of an import statement.
+
+    Args:
+        statement: Python statement to time
+        repeats: Number of fresh interpreters to start
+
+    Returns:
+        Dictionary with import time (s) and heavy modules left loaded
+    """
+    baseline = min(_run("pass")[0] for _ in range(repeats))
+    code = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    runs = [_run(code) for _ in range(repeats)]
+    return {
+        "import_s": max(min(t for t, _ in runs) - baseline, 0.0),
+        "loaded": json.loads(runs[0][1])
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--check", action="store_true",
+                        help="fail when a budget or forbidden import is violated")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--scale", type=float,
+                        default=float(os.environ.get("EPSIM_IMPORT_BUDGET_SCALE", 1.0)),
+                        help="multiply every time budget (slow machines)")
+    parser.add_argument("--targets", nargs="*", default=list(TARGETS))
+    args = parser.parse_args(argv)
+
+    failures = []
+    baselines = {}
+    for name in args.targets:
+        statement, budget, forbidden, baseline = TARGETS[name]
+        result = measure(statement, args.repeats)
+        budget *= args.scale
+        if baseline is not None:
+            if baseline not in baselines:
+                baselines[baseline] = measure(baseline, args.repeats)["import_s"]
+            result["baseline_s"] = baselines[baseline]
+            budget += baselines[baseline]
+        leaked = sorted(set(result["loaded"]) & set(forbidden))
+
+        print(json.dumps({"target": name, "budget_s": budget, **result}))
+        if result["import_s"] > budget:
+            failures.append(f"{name}: {result['import_s']:.3f}s > {budget:.3f}s")
+        if leaked:
+            failures.append(f"{name}: loads {', '.join(leaked)}")
+
+    if args.check and failures:
+        print("Import-time regressions:\n  " + "\n  ".join(failures), file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+QITE gradient refinement cost against convergence quality.
+
+Records the quantum gradients of a QITE run on an Ising chain, then refines
+every gradient by minimising the natural-gradient objective
+0.5 x^T F x - g^T x for a fixed ill-conditioned metric F. For each L-BFGS
+iteration budget it reports refinement time and loss evaluations per step
+and the relative error to the exact solve F^-1 g. This is done with the
+persistent (warm) optimizer and with a fresh optimizer per step (cold).
+
+Usage:
+    python benchmarks/bench_refinement.py [--iters N ...] [--steps S]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import torch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.quantum.hamiltonians import PauliTerms
+from src.quantum.qite_optimizer import QITEOptimizer
+
+def record_gradients(n_qubits: int, depth: int, steps: int, seed: int = 0) -> list:
+    """Quantum gradients along a plain QITE descent."""
+    torch.manual_seed(seed)
+    optimizer = QITEOptimizer(n_qubits, depth, learning_rate=0.05)
+    hamiltonian = PauliTerms.nearest_neighbour(n_qubits, 1.0, 0.5)
+    params = torch.rand(n_qubits * (depth + 1), dtype=torch.float64) * 3
+    gradients = []
+    for _ in range(steps):
+        grad = optimizer.compute_imaginary_time_evolution(params, hamiltonian)
+        gradients.append(grad)
+        params = params - optimizer.lr * grad
+    return gradients
+
+def metric(n_params: int, condition: float, seed: int = 0) -> torch.Tensor:
+    """Random SPD matrix with the given condition number."""
+    generator = torch.Generator().manual_seed(seed)
+    q, _ = torch.linalg.qr(torch.randn(n_params, n_params, generator=generator, dtype=torch.float64))
+    eigenvalues = torch.logspace(0, torch.log10(torch.tensor(condition)).item(), n_params,
+                                 dtype=torch.float64)
+    return q @ torch.diag(eigenvalues) @ q.T
+
+def measure(gradients: list, fisher: torch.Tensor, refine_iters: int,
+            n_qubits: int, depth: int, warm: bool) -> dict:
+    """
+    Refine every gradient with one iteration budget.
+
+    Args:
+        gradients: Recorded quantum gradients
+        fisher: Metric of the refinement objective
+        refine_iters: L-BFGS iterations per step
+        n_qubits: Number of qubits of the optimizer
+        depth: Circuit depth of the optimizer
+        warm: Keep the optimizer between steps
+
+    Returns:
+        Dictionary with time (ms) and evaluations per step and the mean and
+        final relative errors
+    """
+    optimizer = QITEOptimizer(n_qubits, depth, beta=0.0, refine_iters=refine_iters)
+    errors = []
+    elapsed = 0.0
+    for grad in gradients:
+        if not warm:
+            optimizer.reset_refinement()
+        loss = lambda x, g=grad: 0.5 * x @ fisher @ x - g @ x
+        start = time.perf_counter()
+        refined = optimizer.refine_gradient(grad, loss)
+        elapsed += time.perf_counter() - start
+        exact = torch.linalg.solve(fisher, grad)
+        errors.append((torch.linalg.norm(refined - exact) / torch.linalg.norm(exact)).item())
+    return {
+        "refine_ms_per_step": 1e3 * elapsed / len(gradients),
+        "evaluations_per_step": optimizer.refine_evaluations / len(gradients),
+        "mean_rel_error": sum(errors) / len(errors),
+        "final_rel_error": errors[-1]
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iters", type=int, nargs="*", default=[0, 1, 2, 5, 10, 20])
+    parser.add_argument("--steps", type=int, default=30)
+    parser.add_argument("--n-qubits", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--condition", type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    gradients = record_gradients(args.n_qubits, args.depth, args.steps)
+    fisher = metric(gradients[0].numel(), args.condition)
+    # Untimed pass so one-off setup costs do not land on the first budget
+    measure(gradients[:2], fisher, 2, args.n_qubits, args.depth, warm=True)
+    for refine_iters in args.iters:
+        for warm in (True, False):
+            stats = measure(gradients, fisher, refine_iters, args.n_qubits, args.depth, warm)
+            print(json.dumps({"refine_iters": refine_iters, "warm": warm, **stats}), flush=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
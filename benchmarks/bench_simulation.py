@@ -0,0 +1,90 @@
+"""
+Policy simulation scaling benchmark.
+
+Runs PolicySimulator for a range of agent counts, each in a fresh
+interpreter, and reports step latency, throughput and peak resident memory
+above a bare torch import, to check that memory grows linearly with the
+number of agents.
+
+Usage:
+    python benchmarks/bench_simulation.py [--agents N ...] [--steps S]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, resource, time, torch
+from src.simulation.policies import BasicPolicy
+from src.simulation.simulator import PolicySimulator
+
+torch.set_num_threads({threads})
+sim = PolicySimulator(agents={agents}, dim={dim}, random_seed=0, chunk_size={chunk_size})
+policy = BasicPolicy(intervention_time={steps} // 2)
+start = time.perf_counter()
+sim.run(policy, time_steps={steps})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "step_s": elapsed / {steps},
+    "agent_steps_per_s": {agents} * {steps} / elapsed,
+    "state_mb": sim.memory_bytes() / 2 ** 20,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+}}))
+"""
+
+_BASELINE = """
+import resource, torch
+from src.simulation.simulator import PolicySimulator
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+"""
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+def measure(agents: int, steps: int = 10, dim: int = 2,
+            chunk_size: int = 65536, threads: int = 1) -> dict:
+    """
+    Measure one agent count in a fresh interpreter.
+
+    Args:
+        agents: Number of agents
+        steps: Simulated steps
+        dim: Manifold dimension
+        chunk_size: Agents advanced per block
+        threads: torch intra-op threads
+
+    Returns:
+        Dictionary with step latency (s), throughput and memory (MB)
+    """
+    stats = json.loads(_run(_PROBE.format(
+        agents=agents, steps=steps, dim=dim, chunk_size=chunk_size, threads=threads
+    )))
+    stats["peak_rss_mb"] -= float(_run(_BASELINE))
+    return stats
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, nargs="*",
+                        default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=2)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    for agents in args.agents:
+        stats = measure(agents, args.steps, args.dim, args.chunk_size, args.threads)
+        print(json.dumps({"agents": agents, "dim": args.dim, **stats}))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
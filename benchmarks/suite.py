@@ -0,0 +1,290 @@
+"""
+Cross-module performance benchmark suite.
+
+Times the hot paths of the package in-process and over a range of sizes:
+
+    qite_gradient      QITEOptimizer gradients vs n_qubits and depth
+    qfi                QuantumFisherEstimator.compute_qfi vs n_qubits
+    christoffel        PolicyManifold Christoffel symbols vs dim
+    transport          PolicyManifold.parallel_transport vs dim
+    logic_infer        LogicEngine.infer vs rule count
+    reasoner_forward   NeuroSymbolicReasoner forward vs batch size
+    batch_sizer        DynamicBatchSizer.compute_batch_size per step
+
+Every case is warmed up once and then timed in rounds whose call count is
+calibrated to --min-time; the median and best time per call are reported.
+Results are printed as JSON lines and can be saved as a baseline; with
+--compare, cases slower than the baseline by more than --threshold are
+reported and the script exits non-zero.
+
+Usage:
+    python benchmarks/suite.py [--groups G ...] [--quick] [--output FILE]
+    python benchmarks/suite.py --compare baseline.json [--threshold 0.2]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import torch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import __version__
+
+Case = Tuple[Dict, Callable[[], object]]
+
+def qite_gradient_cases(quick: bool) -> Iterator[Case]:
+    from src.quantum.hamiltonians import PauliTerms
+    from src.quantum.qite_optimizer import QITEOptimizer
+
+    for n_qubits in ([2, 4] if quick else [2, 4, 6, 8]):
+        for depth in ([1] if quick else [1, 2, 4]):
+            optimizer = QITEOptimizer(n_qubits, depth)
+            hamiltonian = PauliTerms.nearest_neighbour(n_qubits, 1.0, 0.5)
+            params = torch.rand(n_qubits * (depth + 1)) * 3
+            yield ({"n_qubits": n_qubits, "depth": depth},
+                   lambda o=optimizer, p=params, h=hamiltonian:
+                       o.compute_imaginary_time_evolution(p, h))
+
+def qfi_cases(quick: bool) -> Iterator[Case]:
+    # The Fisher circuit is a single RY layer, so only n_qubits varies
+    from src.metrics.quantum_fisher import QuantumFisherEstimator
+
+    for n_qubits in ([2, 3] if quick else [2, 4, 6, 8]):
+        estimator = QuantumFisherEstimator(n_qubits)
+        params = torch.rand(n_qubits) * 3
+        yield {"n_qubits": n_qubits}, lambda e=estimator, p=params: e.compute_qfi(p)
+
+def christoffel_cases(quick: bool) -> Iterator[Case]:
+    from src.manifolds.policy_manifold import PolicyManifold
+
+    for dim in ([2, 4] if quick else [2, 4, 8, 16]):
+        manifold = PolicyManifold(dim)
+        points = torch.randn(256, dim)
+        yield ({"dim": dim, "points": 256},
+               lambda m=manifold, x=points: m._compute_christoffel_symbols(x))
+
+def transport_cases(quick: bool) -> Iterator[Case]:
+    from src.manifolds.policy_manifold import PolicyManifold
+
+    for dim in ([2, 4] if quick else [2, 4, 8, 16]):
+        manifold = PolicyManifold(dim)
+        start, end, vectors = torch.randn(3, 256, dim)
+        yield ({"dim": dim, "batch": 256},
+               lambda m=manifold, v=vectors, x=start, y=end: m.parallel_transport(v, x, y))
+
+def logic_infer_cases(quick: bool) -> Iterator[Case]:
+    from src.reasoning.neuro_symbolic import LogicEngine
+
+    n_symbols = 16
+    for n_rules in ([4, 16] if quick else [4, 16, 64, 256]):
+        rules = []
+        for i in range(n_rules):
+            a, b = i % n_symbols, (i * 7 + 3) % n_symbols
+            rules.append([f"{a} AND {b}", f"{a} OR {b}", f"{a}"][i % 3])
+        engine = LogicEngine(n_symbols, rules)
+        symbolic = torch.rand(256, n_symbols)
+        yield ({"rules": n_rules, "batch": 256},
+               lambda e=engine, s=symbolic: e.infer(s))
+
+def reasoner_forward_cases(quick: bool) -> Iterator[Case]:
+    from src.reasoning.neuro_symbolic import NeuroSymbolicReasoner
+
+    n_symbols = 8
+    reasoner = NeuroSymbolicReasoner(
+        32, n_symbols, hidden_dim=128,
+        rules=[f"{i} AND {(i + 1) % n_symbols}" for i in range(n_symbols)]
+    ).eval()
+
+    def forward(inputs):
+        with torch.no_grad():
+            return reasoner(inputs)
+
+    for batch in ([1, 64] if quick else [1, 16, 256, 4096]):
+        yield {"batch": batch}, lambda x=torch.rand(batch, 32): forward(x)
+
+def batch_sizer_cases(quick: bool) -> Iterator[Case]:
+    from src.optimizers.dynamic_batch import DynamicBatchSizer
+
+    for history_size in ([100] if quick else [100, 1000]):
+        sizer = DynamicBatchSizer(warmup_steps=0, history_size=history_size)
+        for step in range(history_size):
+            sizer.compute_batch_size(1.0 + 0.01 * step, 0.5, 64)
+        yield ({"history_size": history_size},
+               lambda s=sizer: s.compute_batch_size(1.2, 0.5, 64))
+
+GROUPS: Dict[str, Callable[[bool], Iterator[Case]]] = {
+    "qite_gradient": qite_gradient_cases,
+    "qfi": qfi_cases,
+    "christoffel": christoffel_cases,
+    "transport": transport_cases,
+    "logic_infer": logic_infer_cases,
+    "reasoner_forward": reasoner_forward_cases,
+    "batch_sizer": batch_sizer_cases,
+}
+
+def case_id(group: str, params: Dict) -> str:
+    """Stable identifier of a case, e.g. "qfi[n_qubits=4]"."""
+    return f"{group}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+
+def time_call(fn: Callable[[], object], min_time: float = 0.2, repeats: int = 5) -> Dict:
+    """
+    Time a callable.
+
+    Args:
+        fn: Callable to time
+        min_time: Target total duration of all timed rounds (s)
+        repeats: Number of timed rounds
+
+    Returns:
+        Dictionary with median and best time per call (s) and the number
+        of calls per round
+    """
+    fn()
+    round_time = min_time / repeats
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= round_time or number >= 1 << 20:
+            break
+        number *= max(2, min(10, int(round_time / max(elapsed, 1e-9)) + 1))
+
+    samples = [elapsed / number]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "number": number,
+        "repeats": repeats
+    }
+
+def run_suite(groups: List[str], quick: bool = False, min_time: float = 0.2,
+              repeats: int = 5, log: Callable[[Dict], None] = None) -> Dict:
+    """
+    Run benchmark groups.
+
+    Args:
+        groups: Names of groups in GROUPS
+        quick: Use the reduced size grid
+        min_time: Target timed duration per case (s)
+        repeats: Timed rounds per case
+        log: Called with every case's record
+
+    Returns:
+        Baseline document with environment metadata and one record per case
+    """
+    results = {}
+    for group in groups:
+        for params, fn in GROUPS[group](quick):
+            record = {"group": group, "params": params,
+                      **time_call(fn, min_time, repeats)}
+            results[case_id(group, params)] = record
+            if log is not None:
+                log({"case": case_id(group, params), **record})
+    return {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "threads": torch.get_num_threads(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results
+    }
+
+def compare(baseline: Dict, current: Dict, threshold: float = 0.2) -> List[Dict]:
+    """
+    Compare median times of two suite runs.
+
+    Args:
+        baseline: Baseline document
+        current: Document of the run under test
+        threshold: Relative slowdown above which a case regresses
+
+    Returns:
+        One row per case with the time ratio and a status of
+        "regression", "improvement", "ok", "new" or "missing"
+    """
+    old, new = baseline["results"], current["results"]
+    rows = []
+    for case in list(old) + [c for c in new if c not in old]:
+        if case not in new or case not in old:
+            rows.append({"case": case, "status": "missing" if case not in new else "new"})
+            continue
+        ratio = new[case]["median_s"] / old[case]["median_s"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({"case": case, "baseline_s": old[case]["median_s"],
+                     "current_s": new[case]["median_s"], "ratio": ratio, "status": status})
+    return rows
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--groups", nargs="*", default=list(GROUPS), choices=list(GROUPS))
+    parser.add_argument("--quick", action="store_true", help="reduced size grid")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="target timed duration per case (s)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=1, help="torch intra-op threads")
+    parser.add_argument("--output", help="save results as a JSON baseline")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    torch.set_num_threads(args.threads)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    current = run_suite(
+        args.groups, args.quick, args.min_time, args.repeats,
+        log=lambda record: print(json.dumps(record), flush=True)
+    )
+    if args.output:
+        directory = os.path.dirname(os.path.abspath(args.output))
+        os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if baseline is None:
+        return 0
+    # Only cases this run covered take part in the comparison
+    baseline = {**baseline, "results": {
+        case: record for case, record in baseline["results"].items()
+        if record["group"] in args.groups
+    }}
+    rows = compare(baseline, current, args.threshold)
+    for row in rows:
+        print(json.dumps(row))
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print("Performance regressions:\n  " + "\n  ".join(
+            f"{row['case']}: {row['ratio']:.2f}x slower" for row in regressions
+        ), file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,6 @@ setup(
     install_requires=[
         "numpy>=1.24.3",
         "torch>=2.0.1",
-        "geometric-algebra>=0.7.2",
         "scipy>=1.24.0",
         "networkx>=3.1.0",
         "matplotlib>=3.7.1",
@@ -15,9 +14,12 @@ setup(
         "pandas>=2.0.3",
         "scikit-learn>=1.3.0",
         "pennylane>=0.31.0",
-        "qiskit>=0.44.0"
+        "PyYAML>=6.0"
     ],
     extras_require={
+        "qiskit": [
+            "qiskit>=0.44.0"
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
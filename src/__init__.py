@@ -3,6 +3,63 @@ EPSim - Emergent Policy Simulator
 ================================
 
 A quantum-classical hybrid optimization framework for policy manifold learning.
+
+Public classes are imported lazily on first access, so importing the package
+does not load torch or pennylane until a backend is actually used.
 """
 
-__version__ = "0.1.0" 
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+__version__ = "0.1.0"
+
+# Public name -> submodule defining it
+_LAZY_EXPORTS = {
+    "PolicyManifold": ".manifolds.policy_manifold",
+    "HyperbolicAttention": ".manifolds.hyperbolic_attention",
+    "QuantumFisherEstimator": ".metrics.quantum_fisher",
+    "AsyncCheckpointer": ".optimizers.checkpoint",
+    "DynamicBatchSizer": ".optimizers.dynamic_batch",
+    "HybridPrecisionOptimizer": ".optimizers.hybrid_precision",
+    "PauliTerms": ".quantum.hamiltonians",
+    "QuantumOptimizer": ".quantum.optimizer",
+    "QITEOptimizer": ".quantum.qite_optimizer",
+    "QITEPopulation": ".quantum.population",
+    "PolicySimulator": ".simulation.simulator",
+    "Policy": ".simulation.policies",
+    "BasicPolicy": ".simulation.policies",
+    "MultiPolicy": ".simulation.policies",
+    "SymbolicMapper": ".reasoning.neuro_symbolic",
+    "LogicEngine": ".reasoning.neuro_symbolic",
+    "NeuroSymbolicReasoner": ".reasoning.neuro_symbolic",
+}
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
+
+if TYPE_CHECKING:
+    from .manifolds.policy_manifold import PolicyManifold
+    from .manifolds.hyperbolic_attention import HyperbolicAttention
+    from .metrics.quantum_fisher import QuantumFisherEstimator
+    from .optimizers.checkpoint import AsyncCheckpointer
+    from .optimizers.dynamic_batch import DynamicBatchSizer
+    from .optimizers.hybrid_precision import HybridPrecisionOptimizer
+    from .quantum.hamiltonians import PauliTerms
+    from .quantum.optimizer import QuantumOptimizer
+    from .quantum.qite_optimizer import QITEOptimizer
+    from .quantum.population import QITEPopulation
+    from .simulation.simulator import PolicySimulator
+    from .simulation.policies import Policy, BasicPolicy, MultiPolicy
+    from .reasoning.neuro_symbolic import (
+        SymbolicMapper, LogicEngine, NeuroSymbolicReasoner
+    )
+
+def __getattr__(name: str):
+    """Import public classes on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1 @@
+"""Parameter sweeps and the experiment registry."""
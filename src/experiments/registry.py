@@ -0,0 +1,143 @@
+"""
+Registry of experiments runnable from sweep configs.
+An experiment is a function of keyword parameters returning a flat
+dictionary of scalar results. Built-in experiments import their backends
+when called, so resolving a name stays cheap.
+"""
+
+import importlib
+import time
+from typing import Callable, Dict
+
+Experiment = Callable[..., Dict[str, float]]
+
+EXPERIMENTS: Dict[str, Experiment] = {}
+
+def register_experiment(name: str) -> Callable[[Experiment], Experiment]:
+    """
+    Decorator registering an experiment function under a name.
+
+    Args:
+        name: Name used in the `experiment` field of sweep configs
+    """
+    def decorator(fn: Experiment) -> Experiment:
+        EXPERIMENTS[name] = fn
+        return fn
+    return decorator
+
+def get_experiment(name: str) -> Experiment:
+    """
+    Resolve an experiment by registered name or "module:function" path.
+
+    Import paths let worker processes find experiments defined outside
+    the package without relying on registrations made in the parent.
+
+    Args:
+        name: Registered name or import path
+
+    Returns:
+        Experiment function
+    """
+    if name in EXPERIMENTS:
+        return EXPERIMENTS[name]
+    if ":" in name:
+        module, attr = name.split(":", 1)
+        return getattr(importlib.import_module(module), attr)
+    raise KeyError(
+        f"Unknown experiment {name!r}; registered: {sorted(EXPERIMENTS)}"
+    )
+
+@register_experiment("qite")
+def qite_experiment(
+    n_qubits: int = 2,
+    depth: int = 2,
+    beta: float = 0.03,
+    learning_rate: float = 0.01,
+    steps: int = 20,
+    population: int = 1,
+    coupling: float = 1.0,
+    field: float = 0.0,
+    seed: int = 0
+) -> Dict[str, float]:
+    """QITE on a nearest-neighbour Ising chain from random starts."""
+    import torch
+    from ..quantum.hamiltonians import PauliTerms
+    from ..quantum.population import QITEPopulation
+    from ..quantum.qite_optimizer import QITEOptimizer
+
+    torch.manual_seed(seed)
+    optimizer = QITEOptimizer(n_qubits, depth, learning_rate, beta=beta)
+    hamiltonian = PauliTerms.nearest_neighbour(n_qubits, coupling, field)
+    init_params = torch.rand(population, n_qubits * (depth + 1)) * 3
+
+    start = time.perf_counter()
+    members = QITEPopulation(optimizer, init_params)
+    _, energy = members.run(steps, hamiltonian)
+    return {
+        "energy": energy,
+        "gradient_norm": optimizer.gradient_norm,
+        "circuit_executions": optimizer.circuit_executions,
+        "steps_taken": members.step_count,
+        "run_s": time.perf_counter() - start
+    }
+
+@register_experiment("anneal")
+def anneal_experiment(
+    n_qubits: int = 2,
+    steps: int = 100,
+    schedule_power: float = 1.0,
+    trotter_steps: int = 2,
+    adaptive: bool = False,
+    coupling: float = 1.0,
+    field: float = 0.0
+) -> Dict[str, float]:
+    """
+    Adiabatic annealing with schedule s(t) = t ** schedule_power.
+    
+    The energy is the exact <H> of the final state, including the <Z_i Z_j>
+    correlations, so it stays informative for the Z2-symmetric chain
+    (field=0) where every <Z_i> vanishes.
+    """
+    from ..quantum.hamiltonians import PauliTerms
+    from ..quantum.optimizer import QuantumOptimizer
+
+    optimizer = QuantumOptimizer(
+        n_qubits, schedule_fn=lambda t: t ** schedule_power, trotter_steps=trotter_steps
+    )
+    hamiltonian = PauliTerms.nearest_neighbour(n_qubits, coupling, field)
+
+    start = time.perf_counter()
+    optimizer.optimize(hamiltonian, steps, adaptive=adaptive)
+    return {
+        "energy": optimizer.energy(hamiltonian),
+        "evaluations": optimizer.last_run["evaluations"],
+        "converged": optimizer.last_run["converged"],
+        "run_s": time.perf_counter() - start
+    }
+
+@register_experiment("simulation")
+def simulation_experiment(
+    agents: int = 1000,
+    time_steps: int = 100,
+    dim: int = 2,
+    strength: float = 0.5,
+    intervention_time: int = 50,
+    friction: float = 0.1,
+    noise: float = 0.05,
+    seed: int = 0
+) -> Dict[str, float]:
+    """Policy simulation with a single BasicPolicy intervention."""
+    from ..simulation.policies import BasicPolicy
+    from ..simulation.simulator import PolicySimulator
+
+    sim = PolicySimulator(
+        agents=agents, time_steps=time_steps, dim=dim,
+        friction=friction, noise=noise, random_seed=seed
+    )
+    start = time.perf_counter()
+    results = sim.run(BasicPolicy(intervention_time, strength))
+    return {
+        "final_mean_distance": results["mean_distance"][-1].item(),
+        "final_mean_speed": results["mean_speed"][-1].item(),
+        "run_s": time.perf_counter() - start
+    }
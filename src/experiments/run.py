@@ -0,0 +1,415 @@
+"""
+Parallel parameter-sweep runner.
+
+Expands a sweep config into jobs, runs every job in its own worker process
+under resource limits, caches finished results by a hash of experiment,
+parameters and code version, and writes all jobs to one columnar `.npz`.
+
+Config (YAML or JSON):
+
+    experiment: qite            # registered name or "module:function"
+    output: results/qite.npz
+    workers: 4
+    limits: {timeout_s: 600, memory_mb: 4096, cpu_s: 3600, threads: 1}
+    base: {steps: 20}           # parameters shared by every job
+    sweep:                      # Cartesian product
+      n_qubits: [2, 3, 4]
+      depth: [1, 2]
+      beta: [0.01, 0.03]
+    points:                     # optional extra jobs, merged over base
+      - {n_qubits: 6, depth: 1}
+
+Usage:
+    python -m src.experiments.run config.yaml [--workers N] [--force]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import inspect
+import itertools
+import json
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+import traceback
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from .. import __version__
+from .registry import get_experiment
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+PathLike = Union[str, os.PathLike]
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_CACHE_DIR = ".epsim_cache"
+
+_code_version: Optional[str] = None
+
+def load_config(path: PathLike) -> Dict:
+    """Load a sweep config from a YAML or JSON file."""
+    with open(path) as f:
+        if os.fspath(path).endswith(".json"):
+            return json.load(f)
+        import yaml
+        return yaml.safe_load(f)
+
+def expand_sweep(config: Dict) -> List[Dict[str, Any]]:
+    """
+    Expand a sweep config into the parameters of every job.
+
+    Args:
+        config: Config with optional `base`, `sweep` and `points` entries
+
+    Returns:
+        One parameter dictionary per job: the Cartesian product of `sweep`
+        followed by the explicit `points`, each merged over `base`
+    """
+    base = dict(config.get("base") or {})
+    sweep = config.get("sweep") or {}
+    points = config.get("points") or []
+
+    jobs = []
+    if sweep or not points:
+        names = list(sweep)
+        for values in itertools.product(*(sweep[name] for name in names)):
+            jobs.append({**base, **dict(zip(names, values))})
+    jobs.extend({**base, **point} for point in points)
+    return jobs
+
+def code_version() -> str:
+    """Hash of the package version and every source file of the package."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(__version__.encode())
+        for directory, dirs, files in sorted(os.walk(PACKAGE_ROOT)):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    path = os.path.join(directory, name)
+                    digest.update(os.path.relpath(path, PACKAGE_ROOT).encode())
+                    with open(path, "rb") as f:
+                        digest.update(f.read())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+def experiment_version(experiment: str) -> str:
+    """
+    Code version of one experiment.
+
+    Combines `code_version` with a hash of the experiment function's source
+    file when that lies outside the package, so editing a "module:function"
+    experiment invalidates its cached results.
+    """
+    digest = hashlib.sha256(code_version().encode())
+    path = inspect.getsourcefile(get_experiment(experiment))
+    if path and not os.path.abspath(path).startswith(PACKAGE_ROOT + os.sep):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def job_key(experiment: str, params: Dict[str, Any], version: str) -> str:
+    """Cache key of one job."""
+    payload = json.dumps(
+        {"experiment": experiment, "params": params, "code_version": version},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class ResultCache:
+    def __init__(self, directory: PathLike = DEFAULT_CACHE_DIR):
+        """
+        Initialize on-disk cache of finished jobs.
+
+        Args:
+            directory: Directory holding one JSON file per job key
+        """
+        self.directory = os.fspath(directory)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Get the cached record of a job, or None."""
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, record: Dict):
+        """Store a job record atomically."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".job-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(record, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+_THREAD_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+@contextlib.contextmanager
+def _thread_env(threads: Optional[int]):
+    """
+    Set thread-count variables while starting workers.
+
+    Spawned workers copy the environment at start, and numpy/torch read
+    these variables when first imported, which happens before any job code
+    runs, so they must be set in the parent.
+    """
+    if not threads:
+        yield
+        return
+    saved = {var: os.environ.get(var) for var in _THREAD_VARS}
+    os.environ.update({var: str(threads) for var in _THREAD_VARS})
+    try:
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+def _apply_limits(limits: Dict):
+    """Apply per-job resource limits inside a worker process."""
+    if resource is None:
+        return
+    if limits.get("memory_mb"):
+        size = int(limits["memory_mb"] * 2 ** 20)
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+    if limits.get("cpu_s"):
+        seconds = int(limits["cpu_s"])
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+
+def _worker(conn, experiment: str, params: Dict[str, Any], limits: Dict):
+    """Run one job and send ("ok", result) or ("error", traceback)."""
+    try:
+        _apply_limits(limits)
+        fn = get_experiment(experiment)
+        result = fn(**params)
+        conn.send(("ok", {name: _scalar(value) for name, value in result.items()}))
+    except BaseException:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        conn.close()
+
+def _scalar(value: Any) -> Any:
+    """Convert numpy/torch scalars to plain Python values."""
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+def run_jobs(
+    experiment: str,
+    jobs: List[Dict[str, Any]],
+    workers: int = 1,
+    limits: Optional[Dict] = None,
+    cache: Optional[ResultCache] = None,
+    force: bool = False,
+    log: Optional[Callable[[Dict], None]] = None
+) -> List[Dict]:
+    """
+    Run jobs on a local pool of single-use worker processes.
+
+    Every job gets a fresh spawned process, so rlimits apply per job and a
+    crash or timeout only fails that job.
+
+    Args:
+        experiment: Registered experiment name or "module:function"
+        jobs: Parameters of every job
+        workers: Maximum number of concurrent processes
+        limits: Optional timeout_s, memory_mb, cpu_s and threads per job
+        cache: Cache of finished jobs (no caching if None)
+        force: Rerun jobs even if cached
+        log: Called with every finished record
+
+    Returns:
+        One record per job, in job order, with params, status ("ok",
+        "error" or "timeout"), result, error, elapsed_s and cached
+    """
+    limits = dict(limits or {})
+    version = experiment_version(experiment)
+    records: List[Optional[Dict]] = [None] * len(jobs)
+    pending = []
+
+    def finish(index: int, record: Dict):
+        records[index] = record
+        if cache is not None and record["status"] == "ok" and not record["cached"]:
+            cache.put(job_key(experiment, record["params"], version), record)
+        if log is not None:
+            log({"job": index, **record})
+
+    for index, params in enumerate(jobs):
+        cached = None
+        if cache is not None and not force:
+            cached = cache.get(job_key(experiment, params, version))
+        if cached is not None:
+            finish(index, {**cached, "cached": True})
+        else:
+            pending.append(index)
+
+    ctx = mp.get_context("spawn")
+    timeout = limits.get("timeout_s")
+    running: Dict[int, tuple] = {}
+    pending.reverse()
+
+    while pending or running:
+        while pending and len(running) < max(workers, 1):
+            index = pending.pop()
+            receiver, sender = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_worker, args=(sender, experiment, jobs[index], limits), daemon=True
+            )
+            with _thread_env(limits.get("threads")):
+                process.start()
+            sender.close()
+            running[index] = (process, receiver, time.perf_counter())
+
+        wait(
+            [conn for _, conn, _ in running.values()]
+            + [process.sentinel for process, _, _ in running.values()],
+            timeout=0.1
+        )
+
+        for index, (process, receiver, start) in list(running.items()):
+            elapsed = time.perf_counter() - start
+            record = {"params": jobs[index], "result": {}, "error": "",
+                      "elapsed_s": elapsed, "cached": False}
+            # Read liveness first: anything sent before exiting is then already buffered
+            alive = process.is_alive()
+            message = None
+            if receiver.poll():
+                try:
+                    message = receiver.recv()
+                except EOFError:
+                    # Worker closed its end without a result: it is exiting or dead
+                    alive = False
+            if message is not None:
+                status, payload = message
+                record["status"] = status
+                if status == "ok":
+                    record["result"] = payload
+                else:
+                    record["error"] = payload
+                process.join()
+            elif not alive:
+                process.join()
+                record["status"] = "error"
+                record["error"] = f"Worker exited with code {process.exitcode}"
+            elif timeout is not None and elapsed > timeout:
+                process.kill()
+                process.join()
+                record["status"] = "timeout"
+                record["error"] = f"Exceeded {timeout}s"
+            else:
+                continue
+            receiver.close()
+            del running[index]
+            finish(index, record)
+
+    return records
+
+def _column(values: List[Any]) -> np.ndarray:
+    """Build one typed column, filling missing values with NaN or ""."""
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, bool) for v in present):
+        if len(present) == len(values):
+            return np.array(values, dtype=bool)
+        return np.array([np.nan if v is None else float(v) for v in values])
+    if present and all(isinstance(v, int) for v in present) and len(present) == len(values):
+        return np.array(values, dtype=np.int64)
+    if all(isinstance(v, (int, float)) for v in present):
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return np.array(["" if v is None else str(v) for v in values])
+
+def collect(records: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Gather job records into columns.
+
+    Args:
+        records: Records from `run_jobs`
+
+    Returns:
+        One array per parameter, per result and for status, error,
+        elapsed_s and cached
+    """
+    param_names = list(dict.fromkeys(n for r in records for n in r["params"]))
+    result_names = list(dict.fromkeys(n for r in records for n in r["result"]))
+    meta_names = ["status", "error", "elapsed_s", "cached"]
+    clashes = set(result_names) & (set(param_names) | set(meta_names))
+    if clashes:
+        raise ValueError(f"Result names clash with parameter or meta columns: {sorted(clashes)}")
+
+    columns = {}
+    for name in param_names:
+        columns[name] = _column([r["params"].get(name) for r in records])
+    for name in result_names:
+        columns[name] = _column([r["result"].get(name) for r in records])
+    for name in meta_names:
+        columns[name] = _column([r[name] for r in records])
+    return columns
+
+def save_results(columns: Dict[str, np.ndarray], path: PathLike):
+    """Write columns to a single `.npz` file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    np.savez(path, **columns)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("config", help="YAML or JSON sweep config")
+    parser.add_argument("--workers", type=int, help="override the config's worker count")
+    parser.add_argument("--output", help="override the config's output file")
+    parser.add_argument("--cache-dir", help="override the config's cache directory")
+    parser.add_argument("--force", action="store_true", help="ignore cached results")
+    parser.add_argument("--dry-run", action="store_true", help="list jobs without running")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    experiment = config["experiment"]
+    jobs = expand_sweep(config)
+
+    if args.dry_run:
+        for params in jobs:
+            print(json.dumps(params))
+        return 0
+
+    workers = args.workers or config.get("workers") or os.cpu_count() or 1
+    output = args.output or config.get("output") or os.path.join("results", f"{experiment}.npz")
+    cache = ResultCache(args.cache_dir or config.get("cache_dir") or DEFAULT_CACHE_DIR)
+    limits = {"threads": 1, **(config.get("limits") or {})}
+
+    def log(record: Dict):
+        print(json.dumps({
+            "job": record["job"], "status": record["status"],
+            "cached": record["cached"], "elapsed_s": round(record["elapsed_s"], 3),
+            **record["params"]
+        }), flush=True)
+
+    records = run_jobs(experiment, jobs, workers, limits, cache, args.force, log)
+    save_results(collect(records), output)
+
+    failed = [r for r in records if r["status"] != "ok"]
+    for record in failed:
+        print(f"{record['status']}: {record['params']}\n{record['error']}", file=sys.stderr)
+    print(f"{len(records) - len(failed)}/{len(records)} jobs ok, results in {output}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+Deferred imports for heavy optional backends.
+Modules created here are registered immediately but only executed on
+first attribute access.
+"""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily.
+
+    Args:
+        name: Absolute module name, e.g. "pennylane"
+
+    Returns:
+        Module that loads itself on first attribute access
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        # Let the regular import machinery raise ModuleNotFoundError
+        return importlib.import_module(name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1 @@
+"""Policy manifolds and differential geometry."""
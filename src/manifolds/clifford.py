@@ -0,0 +1,426 @@
+"""
+Vectorised geometric algebra kernel.
+Basis blades are bitmasks, products are gathered from cached Cayley
+(sign, index) tables and evaluated on batched torch tensors. Multivectors
+store only the blades they use, so low-grade objects stay small.
+"""
+
+import torch
+from typing import Dict, Optional, Sequence, Tuple
+
+Blades = Tuple[int, ...]
+
+PRODUCTS = ("geometric", "outer", "inner")
+
+# Largest left x right x output table contracted as a dense matmul
+_DENSE_TABLE_MAX = 1 << 16
+
+def _popcount(x: int) -> int:
+    return bin(x).count("1")
+
+class CliffordAlgebra:
+    def __init__(self, signature: Sequence[float]):
+        """
+        Initialize geometric algebra with a diagonal metric.
+
+        Args:
+            signature: Square of every basis vector, e.g. [1, 1, 1, -1]
+        """
+        self.signature = tuple(float(s) for s in signature)
+        self.n = len(self.signature)
+        self.n_blades = 1 << self.n
+        self.grades = tuple(_popcount(b) for b in range(self.n_blades))
+
+        self._cayley: Optional[Tuple[torch.Tensor, torch.Tensor]] = None
+        self._tables: Dict[Tuple, Tuple] = {}
+
+    def blades_of_grade(self, *grades: int) -> Blades:
+        """Blades of the given grades, in canonical order."""
+        return tuple(b for b in range(self.n_blades) if self.grades[b] in grades)
+
+    def _blade_signs(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+        """
+        Signs of the basis blade products a * b = sign * (a ^ b).
+
+        The sign combines the parity of swaps needed to sort the basis
+        vectors into canonical order with the squares of shared vectors.
+
+        Args:
+            a: Left blade bitmasks (long tensor)
+            b: Right blade bitmasks, broadcastable against a
+
+        Returns:
+            Float tensor of signs (0 for null basis vectors)
+        """
+        a, b = torch.broadcast_tensors(a, b)
+        swaps = torch.zeros_like(a)
+        metric = torch.ones(a.shape)
+        below = torch.zeros_like(b)
+        for i in range(self.n):
+            a_i = (a >> i) & 1
+            b_i = (b >> i) & 1
+            # Every vector of a at position i passes the vectors of b below i
+            swaps += a_i * below
+            below += b_i
+            metric = torch.where((a_i & b_i).bool(), metric * self.signature[i], metric)
+        return torch.where(swaps % 2 == 1, -metric, metric)
+
+    def cayley_table(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Full Cayley table of the algebra, built once on first use.
+
+        Returns:
+            (sign, index) of shape (2^n, 2^n): blade a * blade b
+            = sign[a, b] * blade index[a, b]
+        """
+        if self._cayley is None:
+            blades = torch.arange(self.n_blades)
+            self._cayley = (
+                self._blade_signs(blades[:, None], blades[None, :]),
+                blades[:, None] ^ blades[None, :]
+            )
+        return self._cayley
+
+    def _product_table(
+        self,
+        left: Blades,
+        right: Blades,
+        kind: str,
+        grades: Optional[Tuple[int, ...]]
+    ) -> Tuple:
+        """
+        Gather/scatter table of a product restricted to the given blades.
+
+        Only the left x right slice of the Cayley table is evaluated, so
+        sparse operands stay cheap even in high-dimensional algebras.
+
+        Returns:
+            Output blades and, for every contributing pair, the left and
+            right value positions, output position and sign
+        """
+        key = (left, right, kind, grades)
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+
+        a = torch.tensor(left, dtype=torch.long)[:, None]
+        b = torch.tensor(right, dtype=torch.long)[None, :]
+        sign = self._blade_signs(a, b)
+        out = a ^ b
+
+        keep = sign != 0
+        if kind == "outer":
+            keep &= (a & b) == 0
+        elif kind == "inner":
+            # Left contraction: a must be contained in b
+            keep &= (a & ~b) == 0
+        if grades is not None:
+            grade_ok = torch.tensor([self.grades[k] in grades for k in range(self.n_blades)])
+            keep &= grade_ok[out]
+
+        ix, iy = torch.nonzero(keep, as_tuple=True)
+        out = out[ix, iy]
+        out_blades = tuple(torch.unique(out).tolist())
+        iout = torch.searchsorted(torch.tensor(out_blades, dtype=torch.long), out)
+
+        # Small products contract faster as one matmul against a dense table
+        bilinear = None
+        if len(left) * len(right) * len(out_blades) <= _DENSE_TABLE_MAX:
+            bilinear = torch.zeros(len(left) * len(right), len(out_blades))
+            bilinear[ix * len(right) + iy, iout] = sign[ix, iy]
+
+        table = (out_blades, ix, iy, iout, sign[ix, iy], bilinear)
+        self._tables[key] = table
+        return table
+
+    def product(
+        self,
+        x: "Multivector",
+        y: "Multivector",
+        kind: str = "geometric",
+        grades: Optional[Sequence[int]] = None
+    ) -> "Multivector":
+        """
+        Product of two batched multivectors.
+
+        Small blade sets are contracted as one matmul of the pairwise
+        coefficient products against a dense table; larger ones as one
+        gather-multiply-scatter over the contributing pairs.
+
+        Args:
+            x: Left operand, values of shape (..., len(x.blades))
+            y: Right operand, broadcastable against x
+            kind: "geometric", "outer" (wedge) or "inner" (left contraction)
+            grades: Only compute these grades of the result (all if None)
+
+        Returns:
+            Multivector holding only the blades the product can reach
+        """
+        if kind not in PRODUCTS:
+            raise ValueError(f"Unknown product {kind!r}, expected one of {PRODUCTS}")
+
+        grades = tuple(sorted(grades)) if grades is not None else None
+        out_blades, ix, iy, iout, sign, bilinear = self._product_table(
+            x.blades, y.blades, kind, grades
+        )
+        device = x.values.device
+        if bilinear is not None:
+            pairs = (x.values.unsqueeze(-1) * y.values.unsqueeze(-2)).flatten(-2)
+            values = pairs @ bilinear.to(device=device, dtype=pairs.dtype)
+            return Multivector(self, values, out_blades)
+
+        terms = (
+            x.values[..., ix.to(device)]
+            * y.values[..., iy.to(device)]
+            * sign.to(device=device, dtype=x.values.dtype)
+        )
+        out = terms.new_zeros(terms.shape[:-1] + (len(out_blades),))
+        return Multivector(self, out.index_add(-1, iout.to(device), terms), out_blades)
+
+    def multivector(self, values: torch.Tensor, blades: Blades) -> "Multivector":
+        """Wrap values of shape (..., len(blades)) as a sparse multivector."""
+        return Multivector(self, values, tuple(blades))
+
+    def scalar(self, values: torch.Tensor) -> "Multivector":
+        """Batched scalar multivector from values of shape (...)."""
+        return Multivector(self, values.unsqueeze(-1), (0,))
+
+    def vector(self, values: torch.Tensor) -> "Multivector":
+        """Batched grade-1 multivector from values of shape (..., n)."""
+        return Multivector(self, values, tuple(1 << i for i in range(self.n)))
+
+class Multivector:
+    def __init__(self, algebra: CliffordAlgebra, values: torch.Tensor, blades: Blades):
+        """
+        Initialize sparse batched multivector.
+
+        Args:
+            algebra: Algebra the multivector belongs to
+            values: Coefficients of shape (..., len(blades))
+            blades: Bitmask of every stored basis blade
+        """
+        self.algebra = algebra
+        self.values = values
+        self.blades = blades
+
+    def __mul__(self, other: "Multivector") -> "Multivector":
+        return self.algebra.product(self, other, "geometric")
+
+    def __xor__(self, other: "Multivector") -> "Multivector":
+        return self.algebra.product(self, other, "outer")
+
+    def __or__(self, other: "Multivector") -> "Multivector":
+        return self.algebra.product(self, other, "inner")
+
+    def __add__(self, other: "Multivector") -> "Multivector":
+        return self._combine(other, 1.0)
+
+    def __sub__(self, other: "Multivector") -> "Multivector":
+        return self._combine(other, -1.0)
+
+    def __neg__(self) -> "Multivector":
+        return Multivector(self.algebra, -self.values, self.blades)
+
+    def _combine(self, other: "Multivector", scale: float) -> "Multivector":
+        """Sum over the union of both blade sets."""
+        if self.blades == other.blades:
+            return Multivector(self.algebra, self.values + scale * other.values, self.blades)
+        blades = tuple(sorted(set(self.blades) | set(other.blades)))
+        return self.expand(blades) + other.expand(blades).scale(scale)
+
+    def scale(self, factor) -> "Multivector":
+        """Multiply by a scalar or a tensor broadcastable to the batch shape."""
+        if isinstance(factor, torch.Tensor):
+            factor = factor.unsqueeze(-1)
+        return Multivector(self.algebra, self.values * factor, self.blades)
+
+    def expand(self, blades: Blades) -> "Multivector":
+        """Re-index onto a superset of blades, filling new ones with zeros."""
+        position = {b: k for k, b in enumerate(blades)}
+        index = torch.tensor([position[b] for b in self.blades], device=self.values.device)
+        values = self.values.new_zeros(self.values.shape[:-1] + (len(blades),))
+        values = values.index_copy(-1, index, self.values)
+        return Multivector(self.algebra, values, blades)
+
+    def reverse(self) -> "Multivector":
+        """Reversion: blades of grade r change sign by (-1)^(r(r-1)/2)."""
+        signs = torch.tensor(
+            [(-1.0) ** (g * (g - 1) // 2) for g in (self.algebra.grades[b] for b in self.blades)],
+            dtype=self.values.dtype, device=self.values.device
+        )
+        return Multivector(self.algebra, self.values * signs, self.blades)
+
+    def grade(self, *grades: int) -> "Multivector":
+        """Keep only the blades of the given grades."""
+        keep = [k for k, b in enumerate(self.blades) if self.algebra.grades[b] in grades]
+        index = torch.tensor(keep, dtype=torch.long, device=self.values.device)
+        return Multivector(
+            self.algebra,
+            self.values.index_select(-1, index),
+            tuple(self.blades[k] for k in keep)
+        )
+
+    def component(self, blade: int) -> torch.Tensor:
+        """Coefficient of a single blade (zeros if not stored)."""
+        if blade in self.blades:
+            return self.values[..., self.blades.index(blade)]
+        return self.values.new_zeros(self.values.shape[:-1])
+
+    def to_dense(self) -> torch.Tensor:
+        """Coefficients of all 2^n blades, shape (..., 2^n)."""
+        return self.expand(tuple(range(self.algebra.n_blades))).values
+
+    def __repr__(self) -> str:
+        return f"Multivector(blades={self.blades}, shape={tuple(self.values.shape)})"
+
+class ConformalMetric:
+    def __init__(self, dim: int):
+        """
+        Initialize conformal model of Euclidean space.
+
+        Points x in R^dim are embedded as null vectors
+        X = x + |x|^2/2 e_inf + e_o of the algebra with signature
+        (1, ..., 1, 1, -1), where e_inf = e_- + e_+ and e_o = (e_- - e_+)/2.
+
+        Args:
+            dim: Dimension of the embedded Euclidean space
+        """
+        self.dim = dim
+        self.algebra = CliffordAlgebra([1.0] * dim + [1.0, -1.0])
+        self.e_plus = 1 << dim
+        self.e_minus = 1 << (dim + 1)
+        self._euclidean = tuple(1 << i for i in range(dim))
+        self._point_blades = self._euclidean + (self.e_plus, self.e_minus)
+
+    def _e_inf(self, like: torch.Tensor) -> Multivector:
+        """Point at infinity, broadcastable against `like` of shape (..., dim)."""
+        values = like.new_tensor([1.0, 1.0])
+        return self.algebra.multivector(values, (self.e_plus, self.e_minus))
+
+    def up(self, x: torch.Tensor) -> Multivector:
+        """
+        Embed Euclidean points as conformal null vectors.
+
+        Args:
+            x: Points of shape (..., dim)
+
+        Returns:
+            Grade-1 multivectors of shape (..., dim + 2)
+        """
+        half_sq = 0.5 * torch.sum(x * x, dim=-1, keepdim=True)
+        values = torch.cat([x, half_sq - 0.5, half_sq + 0.5], dim=-1)
+        return self.algebra.multivector(values, self._point_blades)
+
+    def down(self, X: Multivector) -> torch.Tensor:
+        """
+        Project conformal vectors back to Euclidean points.
+
+        Args:
+            X: Grade-1 multivectors (need not be normalised)
+
+        Returns:
+            Points of shape (..., dim)
+        """
+        euclidean = torch.stack([X.component(b) for b in self._euclidean], dim=-1)
+        # -X . e_inf = e_- coefficient - e_+ coefficient
+        weight = X.component(self.e_minus) - X.component(self.e_plus)
+        return euclidean / weight.unsqueeze(-1)
+
+    def translator(self, t: torch.Tensor) -> Multivector:
+        """
+        Versor translating points by t: T = 1 - t e_inf / 2.
+
+        Args:
+            t: Translations of shape (..., dim)
+
+        Returns:
+            Batched translators (scalar plus e_i e_+ and e_i e_- bivectors)
+        """
+        half = -0.5 * t
+        values = torch.cat([torch.ones_like(t[..., :1]), half, half], dim=-1)
+        blades = (0,) + tuple(b | self.e_plus for b in self._euclidean) \
+            + tuple(b | self.e_minus for b in self._euclidean)
+        return self.algebra.multivector(values, blades)
+
+    def exp_map(self, point: torch.Tensor, tangent: torch.Tensor) -> torch.Tensor:
+        """
+        Exponential map as the versor sandwich T X ~T.
+
+        Args:
+            point: Base points of shape (..., dim)
+            tangent: Tangent vectors at the base points, shape (..., dim)
+
+        Returns:
+            End points of shape (..., dim)
+        """
+        T = self.translator(tangent)
+        # Only the grade-1 part of the sandwich survives
+        moved = self.algebra.product(T * self.up(point), T.reverse(), grades=(1,))
+        return self.down(moved)
+
+    def log_map(self, point: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        """
+        Logarithmic map: tangent vector at `point` whose geodesic reaches `target`.
+
+        Translators compose additively, so the generator of the versor
+        taking up(point) to up(target) is the Euclidean displacement.
+
+        Args:
+            point: Base points of shape (..., dim)
+            target: Target points of shape (..., dim)
+
+        Returns:
+            Tangent vectors of shape (..., dim)
+        """
+        return target - point
+
+    def distance(self, p: torch.Tensor, q: torch.Tensor) -> torch.Tensor:
+        """Geodesic distance from the conformal inner product, |p - q|^2 = -2 P . Q."""
+        inner = (self.up(p) | self.up(q)).component(0)
+        return torch.sqrt(torch.clamp(-2.0 * inner, min=0.0))
+
+    def _tangent_basis(self, point: torch.Tensor) -> Multivector:
+        """Derivatives dX/dx_i = e_i + x_i e_inf, shape (..., dim, dim + 2)."""
+        eye = torch.eye(self.dim, dtype=point.dtype, device=point.device)
+        eye = eye.expand(point.shape[:-1] + (self.dim, self.dim))
+        coord = point.unsqueeze(-1)
+        values = torch.cat([eye, coord, coord], dim=-1)
+        return self.algebra.multivector(values, self._point_blades)
+
+    def compute_metric_tensor(self, point: torch.Tensor) -> torch.Tensor:
+        """
+        Pullback metric g_ij = dX/dx_i . dX/dx_j of the conformal embedding.
+
+        Args:
+            point: Points of shape (..., dim)
+
+        Returns:
+            Metric tensors of shape (..., dim, dim)
+        """
+        basis = self._tangent_basis(point)
+        left = self.algebra.multivector(basis.values.unsqueeze(-2), basis.blades)
+        right = self.algebra.multivector(basis.values.unsqueeze(-3), basis.blades)
+        return (left | right).component(0)
+
+    def metric_derivatives(self, point: torch.Tensor) -> torch.Tensor:
+        """
+        Derivatives dg_ij/dx_k of the pullback metric.
+
+        Uses d^2X/dx_k dx_i = delta_ki e_inf, so
+        dg_ij/dx_k = delta_ki e_inf . dX/dx_j + delta_kj dX/dx_i . e_inf.
+
+        Args:
+            point: Points of shape (..., dim)
+
+        Returns:
+            Derivatives of shape (..., dim, dim, dim), indexed [i, j, k]
+        """
+        basis = self._tangent_basis(point)
+        # e_inf . dX/dx_j for every j, shape (..., dim)
+        e_inf_dot = (self._e_inf(point) | basis).component(0)
+        eye = torch.eye(self.dim, dtype=point.dtype, device=point.device)
+        # [i, j, k]: delta_ki a_j + delta_kj a_i
+        return (
+            eye[:, None, :] * e_inf_dot[..., None, :, None]
+            + eye[None, :, :] * e_inf_dot[..., :, None, None]
+        )
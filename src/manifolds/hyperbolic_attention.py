@@ -0,0 +1,274 @@
+"""
+Hyperbolic attention on the Poincaré ball.
+Möbius operations and distances are vectorised over leading batch
+dimensions, and attention scores are streamed in query/key chunks with an
+online softmax, so memory grows as O(N * chunk) instead of O(N^2).
+"""
+
+import torch
+import torch.nn as nn
+from torch.utils.checkpoint import checkpoint
+from typing import Optional
+
+# Distance kept from the ball boundary, per dtype
+_BALL_EPS = {torch.float32: 4e-3, torch.float64: 1e-5}
+_MIN_NORM = 1e-15
+
+def _ball_eps(x: torch.Tensor) -> float:
+    return _BALL_EPS.get(x.dtype, 4e-3)
+
+def _norm(x: torch.Tensor) -> torch.Tensor:
+    return torch.linalg.norm(x, dim=-1, keepdim=True).clamp_min(_MIN_NORM)
+
+def _artanh(x: torch.Tensor) -> torch.Tensor:
+    x = x.clamp(-1 + 1e-7, 1 - 1e-7)
+    return 0.5 * (torch.log1p(x) - torch.log1p(-x))
+
+def _arcosh1p(u: torch.Tensor) -> torch.Tensor:
+    """arcosh(1 + u) for u >= 0, without rounding 1 + u first."""
+    u = u.clamp_min(0.0)
+    return torch.log1p(u + torch.sqrt((u * (u + 2)).clamp_min(_MIN_NORM)))
+
+def project(x: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """
+    Pull points back inside the ball of radius 1/sqrt(c).
+
+    Args:
+        x: Points of shape (..., d)
+        c: Curvature magnitude
+
+    Returns:
+        Points with norm at most (1 - eps) / sqrt(c)
+    """
+    norm = _norm(x)
+    max_norm = (1 - _ball_eps(x)) / c ** 0.5
+    return torch.where(norm > max_norm, x / norm * max_norm, x)
+
+def mobius_add(x: torch.Tensor, y: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """
+    Möbius addition x ⊕ y.
+
+    Args:
+        x: Points of shape (..., d)
+        y: Points broadcastable against x
+        c: Curvature magnitude
+
+    Returns:
+        Sum on the ball
+    """
+    xy = torch.sum(x * y, dim=-1, keepdim=True)
+    x2 = torch.sum(x * x, dim=-1, keepdim=True)
+    y2 = torch.sum(y * y, dim=-1, keepdim=True)
+    num = (1 + 2 * c * xy + c * y2) * x + (1 - c * x2) * y
+    den = 1 + 2 * c * xy + c ** 2 * x2 * y2
+    return num / den.clamp_min(_MIN_NORM)
+
+def expmap0(v: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """Map tangent vectors at the origin onto the ball."""
+    sqrt_c = c ** 0.5
+    norm = _norm(v)
+    return project(torch.tanh(sqrt_c * norm) * v / (sqrt_c * norm), c)
+
+def logmap0(y: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """Map points on the ball to tangent vectors at the origin."""
+    sqrt_c = c ** 0.5
+    norm = _norm(y)
+    return _artanh(sqrt_c * norm) * y / (sqrt_c * norm)
+
+def mobius_matvec(weight: torch.Tensor, x: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """
+    Möbius matrix-vector product M ⊗ x.
+
+    Args:
+        weight: Matrix of shape (d_out, d_in)
+        x: Points of shape (..., d_in)
+        c: Curvature magnitude
+
+    Returns:
+        Points of shape (..., d_out)
+    """
+    sqrt_c = c ** 0.5
+    mx = x @ weight.T
+    x_norm = _norm(x)
+    mx_norm = _norm(mx)
+    res = torch.tanh(mx_norm / x_norm * _artanh(sqrt_c * x_norm)) * mx / (mx_norm * sqrt_c)
+    zero = (mx == 0).all(dim=-1, keepdim=True)
+    return project(torch.where(zero, torch.zeros_like(res), res), c)
+
+def distance(x: torch.Tensor, y: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """
+    Geodesic distance between matching points.
+
+    Args:
+        x: Points of shape (..., d)
+        y: Points broadcastable against x
+        c: Curvature magnitude
+
+    Returns:
+        Distances of shape (...)
+    """
+    sq = torch.sum((x - y) ** 2, dim=-1)
+    x2 = torch.sum(x * x, dim=-1)
+    y2 = torch.sum(y * y, dim=-1)
+    denom = ((1 - c * x2) * (1 - c * y2)).clamp_min(_MIN_NORM)
+    return _arcosh1p(2 * c * sq / denom) / c ** 0.5
+
+def pairwise_distance(x: torch.Tensor, y: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """
+    Geodesic distances between all pairs of two point sets.
+
+    d(x, y) = arcosh(1 + 2c|x - y|^2 / ((1 - c|x|^2)(1 - c|y|^2))) / sqrt(c),
+    with |x - y|^2 expanded into a matmul.
+
+    Args:
+        x: Points of shape (..., N, d)
+        y: Points of shape (..., M, d)
+        c: Curvature magnitude
+
+    Returns:
+        Distances of shape (..., N, M)
+    """
+    x2 = torch.sum(x * x, dim=-1, keepdim=True)
+    y2 = torch.sum(y * y, dim=-1, keepdim=True).transpose(-1, -2)
+    sq = (x2 + y2 - 2 * x @ y.transpose(-1, -2)).clamp_min(0.0)
+    denom = ((1 - c * x2) * (1 - c * y2)).clamp_min(_MIN_NORM)
+    return _arcosh1p(2 * c * sq / denom) / c ** 0.5
+
+def to_klein(x: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """Map Poincaré ball points to the Klein model."""
+    return 2 * x / (1 + c * torch.sum(x * x, dim=-1, keepdim=True))
+
+def from_klein(x: torch.Tensor, c: float = 1.0) -> torch.Tensor:
+    """Map Klein model points to the Poincaré ball."""
+    x2 = torch.sum(x * x, dim=-1, keepdim=True)
+    return x / (1 + torch.sqrt((1 - c * x2).clamp_min(0.0)))
+
+class HyperbolicAttention(nn.Module):
+    def __init__(
+        self,
+        dim: int,
+        curvature: float = 1.0,
+        chunk_size: int = 256,
+        checkpoint_chunks: bool = True
+    ):
+        """
+        Initialize hyperbolic attention layer.
+
+        Scores are -beta * d(q, k) - offset; values are aggregated with the
+        Einstein midpoint in the Klein model, whose weights softmax(s) * gamma
+        fold into the online softmax as an extra log(gamma) term.
+
+        Args:
+            dim: Dimension of the Poincaré ball
+            curvature: Curvature magnitude c (ball radius 1/sqrt(c))
+            chunk_size: Queries and keys processed per block
+            checkpoint_chunks: Recompute query blocks in backward, keeping
+                training memory O(N * chunk) as well
+        """
+        super().__init__()
+        self.dim = dim
+        self.curvature = curvature
+        self.chunk_size = chunk_size
+        self.checkpoint_chunks = checkpoint_chunks
+
+        self.q_proj = nn.Linear(dim, dim, bias=False)
+        self.k_proj = nn.Linear(dim, dim, bias=False)
+        self.v_proj = nn.Linear(dim, dim, bias=False)
+        self.beta = nn.Parameter(torch.ones(1))
+        self.offset = nn.Parameter(torch.zeros(1))
+
+    def _attend(
+        self,
+        q: torch.Tensor,
+        k: torch.Tensor,
+        v_klein: torch.Tensor,
+        log_gamma: torch.Tensor,
+        key_mask: Optional[torch.Tensor]
+    ) -> torch.Tensor:
+        """
+        Attend one query block to all keys, one key block at a time.
+
+        Args:
+            q: Query points of shape (..., Q, d)
+            k: Key points of shape (..., N, d)
+            v_klein: Values in the Klein model, shape (..., N, d)
+            log_gamma: Log Lorentz factors of the values, shape (..., N)
+            key_mask: Optional boolean mask of shape (..., N), False = ignore
+
+        Returns:
+            Einstein midpoints on the Poincaré ball, shape (..., Q, d)
+        """
+        c = self.curvature
+        running_max = q.new_full(q.shape[:-1], float("-inf"))
+        num = q.new_zeros(q.shape[:-1] + v_klein.shape[-1:])
+        den = q.new_zeros(q.shape[:-1])
+
+        for start in range(0, k.shape[-2], self.chunk_size):
+            end = start + self.chunk_size
+            logits = (
+                -self.beta * pairwise_distance(q, k[..., start:end, :], c)
+                - self.offset
+                + log_gamma[..., None, start:end]
+            )
+            if key_mask is not None:
+                logits = logits.masked_fill(~key_mask[..., None, start:end], float("-inf"))
+
+            new_max = torch.maximum(running_max, logits.amax(dim=-1))
+            # Fully masked rows keep a -inf maximum; shift them by 0 instead
+            shift = torch.where(torch.isfinite(new_max), new_max, torch.zeros_like(new_max))
+            rescale = torch.exp(running_max - shift)
+            weights = torch.exp(logits - shift.unsqueeze(-1))
+
+            num = num * rescale.unsqueeze(-1) + weights @ v_klein[..., start:end, :]
+            den = den * rescale + weights.sum(dim=-1)
+            running_max = new_max
+
+        midpoint = num / den.clamp_min(_MIN_NORM).unsqueeze(-1)
+        return from_klein(midpoint, c)
+
+    def forward(
+        self,
+        query: torch.Tensor,
+        key: Optional[torch.Tensor] = None,
+        value: Optional[torch.Tensor] = None,
+        key_mask: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
+        """
+        Attend from query points to key/value points on the ball.
+
+        Args:
+            query: Points of shape (..., Nq, dim)
+            key: Points of shape (..., Nk, dim), defaults to query
+            value: Points of shape (..., Nk, dim), defaults to key
+            key_mask: Optional boolean mask of shape (..., Nk), False = ignore
+
+        Returns:
+            Attended points of shape (..., Nq, dim)
+        """
+        c = self.curvature
+        key = query if key is None else key
+        value = key if value is None else value
+
+        q = mobius_matvec(self.q_proj.weight, query, c)
+        k = mobius_matvec(self.k_proj.weight, key, c)
+        v_klein = to_klein(mobius_matvec(self.v_proj.weight, value, c), c)
+        log_gamma = -0.5 * torch.log(
+            (1 - c * torch.sum(v_klein * v_klein, dim=-1)).clamp_min(_MIN_NORM)
+        )
+
+        use_checkpoint = (
+            self.checkpoint_chunks and self.training and torch.is_grad_enabled()
+        )
+        blocks = []
+        for start in range(0, q.shape[-2], self.chunk_size):
+            q_block = q[..., start:start + self.chunk_size, :]
+            if use_checkpoint:
+                block = checkpoint(
+                    self._attend, q_block, k, v_klein, log_gamma, key_mask,
+                    use_reentrant=False
+                )
+            else:
+                block = self._attend(q_block, k, v_klein, log_gamma, key_mask)
+            blocks.append(block)
+
+        return project(torch.cat(blocks, dim=-2), c)
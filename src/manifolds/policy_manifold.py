@@ -1,18 +1,20 @@
 import torch
 import numpy as np
 from typing import Tuple, Optional
-import geometric_algebra as ga
+from .clifford import ConformalMetric
 
 class PolicyManifold:
-    def __init__(self, dim: int):
+    def __init__(self, dim: int, n_transport_steps: int = 16):
         """
         Initialize policy manifold with given dimension
         
         Args:
             dim: Dimension of the manifold
+            n_transport_steps: Geodesic segments used to integrate transport
         """
         self.dim = dim
-        self.metric = ga.ConformalMetric(dim)
+        self.n_transport_steps = n_transport_steps
+        self.metric = ConformalMetric(dim)
         
     def parallel_transport(self, tensor: torch.Tensor, 
                          start_point: torch.Tensor,
@@ -25,10 +27,12 @@ class PolicyManifold:
         (\dot{\gamma} + \frac{\nabla_{\dot{\gamma}}\dot{\gamma}}{|\dot{\gamma}|^2})
         $$
         
+        All arguments may carry matching leading batch dimensions.
+        
         Args:
-            tensor: Tensor to transport
-            start_point: Starting point on manifold
-            end_point: Ending point on manifold
+            tensor: Tensor to transport, shape (..., dim)
+            start_point: Starting point on manifold, shape (..., dim)
+            end_point: Ending point on manifold, shape (..., dim)
             
         Returns:
             Transported tensor
@@ -36,8 +40,8 @@ class PolicyManifold:
         gamma = self._compute_geodesic(start_point, end_point)
         gamma_dot = self._compute_geodesic_velocity(gamma)
         
-        # Compute connection coefficients
-        christoffel = self._compute_christoffel_symbols(gamma)
+        # Compute connection coefficients at the start of every segment
+        christoffel = self._compute_christoffel_symbols(gamma[:-1])
         
         # Apply parallel transport equation
         transported = self._apply_transport(tensor, gamma_dot, christoffel)
@@ -45,23 +49,65 @@ class PolicyManifold:
         return transported
         
     def _compute_geodesic(self, p1: torch.Tensor, p2: torch.Tensor) -> torch.Tensor:
-        """Compute geodesic path between two points"""
-        # Use exponential map to compute geodesic
+        """
+        Compute geodesic path between two points
+        
+        Returns:
+            Sampled points of shape (n_transport_steps + 1, ..., dim)
+        """
+        # Use exponential map for the interior samples, all in one batch
         log_map = self.metric.log_map(p1, p2)
-        return self.metric.exp_map(p1, log_map)
+        p1, p2 = p1.expand_as(log_map), p2.expand_as(log_map)
+        t = torch.linspace(0.0, 1.0, self.n_transport_steps + 1, dtype=log_map.dtype)[1:-1]
+        t = t.reshape((-1,) + (1,) * log_map.dim())
+        interior = self.metric.exp_map(p1.unsqueeze(0), t * log_map)
+        return torch.cat([p1.unsqueeze(0), interior, p2.unsqueeze(0)])
+    
+    def _compute_geodesic_velocity(self, gamma: torch.Tensor) -> torch.Tensor:
+        """Velocity of every geodesic segment, scaled by the segment length in t"""
+        return gamma[1:] - gamma[:-1]
     
     def _compute_christoffel_symbols(self, point: torch.Tensor) -> torch.Tensor:
-        """Compute Christoffel symbols at a point"""
+        """
+        Compute Christoffel symbols at a point
+        
+        Args:
+            point: Points of shape (..., dim)
+            
+        Returns:
+            Symbols of shape (..., dim, dim, dim), [i, j, k] = Gamma^k_ij
+        """
         metric = self.metric.compute_metric_tensor(point)
-        metric_grad = torch.autograd.grad(metric, point, 
-                                        create_graph=True)[0]
+        # [a, b, c] = d g_ab / d x_c
+        metric_grad = self.metric.metric_derivatives(point)
         
-        # Compute symbols using metric and its derivatives
-        symbols = torch.zeros(self.dim, self.dim, self.dim)
-        for i in range(self.dim):
-            for j in range(self.dim):
-                for k in range(self.dim):
-                    symbols[i,j,k] = 0.5 * (metric_grad[j,k,i] + 
-                                          metric_grad[i,k,j] - 
-                                          metric_grad[i,j,k])
-        return symbols 
\ No newline at end of file
+        # Gamma_ijl = (d_i g_jl + d_j g_il - d_l g_ij) / 2, all indices at once
+        batch = tuple(range(metric_grad.dim() - 3))
+        lowered = 0.5 * (
+            metric_grad.permute(*batch, -1, -3, -2)
+            + metric_grad.transpose(-1, -2)
+            - metric_grad
+        )
+        # Raise the last index with the inverse metric
+        return torch.einsum("...ijl,...lk->...ijk", lowered, torch.linalg.inv(metric))
+    
+    def _apply_transport(self, tensor: torch.Tensor,
+                         gamma_dot: torch.Tensor,
+                         christoffel: torch.Tensor) -> torch.Tensor:
+        """
+        Integrate dv^k = -Gamma^k_ij dgamma^i v^j along the sampled geodesic
+        
+        Args:
+            tensor: Tensor to transport, shape (..., dim)
+            gamma_dot: Segment velocities, shape (n_steps, ..., dim)
+            christoffel: Symbols per segment, shape (n_steps, ..., dim, dim, dim)
+            
+        Returns:
+            Transported tensor
+        """
+        transported = tensor
+        for step in range(gamma_dot.shape[0]):
+            transported = transported - torch.einsum(
+                "...ijk,...i,...j->...k", christoffel[step], gamma_dot[step], transported
+            )
+        return transported
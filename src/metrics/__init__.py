@@ -0,0 +1 @@
+"""Quantum information metrics and runtime instrumentation."""
@@ -0,0 +1,187 @@
+"""
+Lightweight hot-path instrumentation.
+Counts QNode executions and shots, times quantum and classical phases and
+records measured values, with a single flag check when disabled.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+class _NullTimer:
+    """Shared no-op context manager returned while instrumentation is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class _Timer:
+    """Context manager adding elapsed wall time to a named timer."""
+
+    __slots__ = ("registry", "name", "start")
+
+    def __init__(self, registry: "Instrumentation", name: str):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+class Instrumentation:
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize instrumentation registry.
+
+        Args:
+            enabled: Whether to collect measurements
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all counters, timers and recorded values."""
+        with self._lock:
+            self.counters: Dict[str, float] = {}
+            self.timers: Dict[str, list] = {}
+            self.values: Dict[str, float] = {}
+
+    def count(self, name: str, n: float = 1):
+        """Increment a counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_time(self, name: str, seconds: float):
+        """Add one timed interval to a timer."""
+        with self._lock:
+            entry = self.timers.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def timer(self, name: str):
+        """Context manager timing a phase; a shared no-op when disabled."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def record(self, name: str, value: float):
+        """Record the latest value of a measured quantity."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.values[name] = float(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a JSON-serialisable copy of all measurements."""
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "timers": {
+                    name: {"calls": calls, "total_s": total}
+                    for name, (calls, total) in self.timers.items()
+                },
+                "values": dict(self.values)
+            }
+
+INSTRUMENTATION = Instrumentation(
+    enabled=os.environ.get("EPSIM_INSTRUMENTATION", "0") not in ("", "0")
+)
+
+def enable():
+    """Start collecting measurements."""
+    INSTRUMENTATION.enabled = True
+
+def disable():
+    """Stop collecting measurements."""
+    INSTRUMENTATION.enabled = False
+
+def is_enabled() -> bool:
+    """Whether measurements are being collected."""
+    return INSTRUMENTATION.enabled
+
+def count(name: str, n: float = 1):
+    """Increment a counter of the global registry."""
+    if INSTRUMENTATION.enabled:
+        INSTRUMENTATION.count(name, n)
+
+def timer(name: str):
+    """Time a phase in the global registry."""
+    if not INSTRUMENTATION.enabled:
+        return _NULL_TIMER
+    return _Timer(INSTRUMENTATION, name)
+
+def record(name: str, value: float):
+    """Record a measured value in the global registry."""
+    if INSTRUMENTATION.enabled:
+        INSTRUMENTATION.record(name, value)
+
+def timed(name: str) -> Callable:
+    """Decorator timing every call of a function under `name`."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not INSTRUMENTATION.enabled:
+                return fn(*args, **kwargs)
+            with _Timer(INSTRUMENTATION, name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def snapshot() -> Dict[str, Any]:
+    """Get all measurements of the global registry."""
+    return INSTRUMENTATION.snapshot()
+
+def reset():
+    """Clear the global registry."""
+    INSTRUMENTATION.reset()
+
+@contextmanager
+def collecting() -> Iterator[Instrumentation]:
+    """Collect measurements inside a block, restoring the previous state."""
+    previous = INSTRUMENTATION.enabled
+    INSTRUMENTATION.enabled = True
+    try:
+        yield INSTRUMENTATION
+    finally:
+        INSTRUMENTATION.enabled = previous
+
+class JSONLinesSink:
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        Initialize JSON-lines sink.
+
+        Args:
+            path: File that snapshots are appended to, one JSON object per line
+        """
+        self.path = path
+
+    def write(self, record: Optional[Dict] = None, **tags):
+        """
+        Append one record.
+
+        Args:
+            record: Measurements to write (a snapshot of the global registry if None)
+            **tags: Extra fields stored alongside, e.g. run id or step
+        """
+        line = {"time": time.time(), **tags, **(record or snapshot())}
+        with open(self.path, "a") as f:
+            f.write(json.dumps(line) + "\n")
+
+def export_jsonl(path: Union[str, os.PathLike], **tags):
+    """Append a snapshot of the global registry to a JSON-lines file."""
+    JSONLinesSink(path).write(**tags)
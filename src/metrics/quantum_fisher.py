@@ -4,9 +4,10 @@ Implements efficient estimation of QFI for convergence analysis.
 """
 
 import torch
-import pennylane as qml
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+from ..quantum.circuit_cache import CompiledCircuit, get_circuit
+from . import instrumentation
 
 class QuantumFisherEstimator:
     def __init__(
@@ -25,27 +26,20 @@ class QuantumFisherEstimator:
         """
         self.n_qubits = n_qubits
         self.n_shots = n_shots
-        self.dev = qml.device(device, wires=n_qubits, shots=n_shots)
+        self.device_name = device
         
-        # Initialize quantum circuit
+        # Initialize quantum circuit (shared with every estimator of this shape)
         self.circuit = self._create_circuit()
+        self.dev = self.circuit.device
         
-    def _create_circuit(self) -> qml.QNode:
-        """Create parameterized quantum circuit."""
-        @qml.qnode(self.dev)
-        def circuit(params):
-            # State preparation
-            for i in range(self.n_qubits):
-                qml.RY(params[i], wires=i)
-                
-            # Entangling layer
-            for i in range(self.n_qubits-1):
-                qml.CNOT(wires=[i, i+1])
-                
-            # Measurement layer
-            return [qml.expval(qml.PauliZ(i)) for i in range(self.n_qubits)]
-            
-        return circuit
+        # Number of circuits evaluated by this estimator
+        self.circuit_executions = 0
+        
+    def _create_circuit(self) -> CompiledCircuit:
+        """Create parameterized quantum circuit (RY layer and CNOT chain)."""
+        return get_circuit(
+            "fisher", self.n_qubits, 0, self.device_name, self.n_shots
+        )
         
     def compute_qfi(
         self,
@@ -78,6 +72,7 @@ class QuantumFisherEstimator:
             
             # Diagonal element
             qfi[i,i] = torch.sum((exp_plus - exp_minus)**2) / (4 * epsilon**2)
+            self.circuit_executions += 2
             
         # Compute off-diagonal elements
         for i in range(n_params):
@@ -103,6 +98,7 @@ class QuantumFisherEstimator:
                     (exp_i_plus - exp_i_minus) * (exp_j_plus - exp_j_minus)
                 ) / (4 * epsilon**2)
                 qfi[j,i] = qfi[i,j]
+                self.circuit_executions += 4
                 
         return qfi
         
@@ -126,11 +122,14 @@ class QuantumFisherEstimator:
         # Compute QFI
         qfi = self.compute_qfi(params)
         
-        # Add damping for numerical stability
-        qfi_damped = qfi + damping * torch.eye(len(params))
+        with instrumentation.timer("fisher.classical"):
+            # Add damping for numerical stability
+            qfi_damped = qfi + damping * torch.eye(len(params))
+            
+            # Compute natural gradient
+            nat_grad = torch.linalg.solve(qfi_damped, grad)
         
-        # Compute natural gradient
-        nat_grad = torch.linalg.solve(qfi_damped, grad)
+        instrumentation.record("fisher.natural_gradient_norm", torch.norm(nat_grad).item())
         
         return nat_grad
         
@@ -152,7 +151,8 @@ class QuantumFisherEstimator:
         metrics = {
             "qfi_condition_number": torch.linalg.cond(qfi).item(),
             "qfi_trace": torch.trace(qfi).item(),
-            "qfi_max_eigenvalue": torch.max(torch.linalg.eigvals(qfi).real).item()
+            "qfi_max_eigenvalue": torch.max(torch.linalg.eigvals(qfi).real).item(),
+            "circuit_executions": self.circuit_executions
         }
         
         return metrics 
\ No newline at end of file
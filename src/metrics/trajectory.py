@@ -0,0 +1,148 @@
+"""
+Streaming trajectory recorder for long optimization runs.
+Writes fixed-width records in chunks to an append-only `.npy` file and
+memory-maps finished runs for zero-copy analysis.
+"""
+
+import os
+import numpy as np
+from typing import Dict, Tuple, Union
+
+# Field spec: dtype, or (dtype, shape) for array-valued fields
+FieldSpec = Union[str, np.dtype, Tuple[Union[str, np.dtype], Tuple[int, ...]]]
+
+_MAGIC = b"\x93NUMPY"
+_MAX_ROWS_DIGITS = 20
+_ALIGNMENT = 64
+
+def _record_dtype(fields: Dict[str, FieldSpec]) -> np.dtype:
+    """Build a structured record dtype from a field spec."""
+    spec = []
+    for name, field in fields.items():
+        if isinstance(field, tuple):
+            spec.append((name, field[0], field[1]))
+        else:
+            spec.append((name, field))
+    return np.dtype(spec)
+
+def _header(dtype: np.dtype, n_rows: int, size: int = 0) -> bytes:
+    """
+    Encode an `.npy` header for `n_rows` records, padded to a fixed size.
+
+    The header is padded as if the row count had 20 digits, so rewriting
+    it with the final count never shifts the data that follows.
+    """
+    descr = np.lib.format.dtype_to_descr(dtype)
+    body = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (descr, n_rows)
+    if size == 0:
+        longest = len(body) - len(str(n_rows)) + _MAX_ROWS_DIGITS
+        size = -(-(len(_MAGIC) + 6 + longest + 1) // _ALIGNMENT) * _ALIGNMENT
+    version = (1, 0) if size - 10 < 2 ** 16 else (2, 0)
+    prefix_len = 10 if version == (1, 0) else 12
+    body = body.ljust(size - prefix_len - 1) + "\n"
+    length = len(body).to_bytes(2 if version == (1, 0) else 4, "little")
+    return _MAGIC + bytes(version) + length + body.encode("latin1")
+
+class TrajectoryRecorder:
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        fields: Dict[str, FieldSpec],
+        chunk_size: int = 4096
+    ):
+        """
+        Initialize trajectory recorder.
+
+        Only one chunk of records is kept in memory; full chunks are
+        appended to the file and the header row count is updated.
+
+        Args:
+            path: Output `.npy` file
+            fields: Field name -> dtype or (dtype, shape)
+            chunk_size: Number of records buffered before writing
+        """
+        self.path = os.fspath(path)
+        self.dtype = _record_dtype(fields)
+        self.chunk_size = chunk_size
+
+        self._buffer = np.zeros(chunk_size, dtype=self.dtype)
+        self._pending = 0
+        self._written = 0
+
+        self._file = open(self.path, "wb")
+        self._header_size = len(_header(self.dtype, 0))
+        self._file.write(_header(self.dtype, 0))
+
+    def __len__(self) -> int:
+        return self._written + self._pending
+
+    def append(self, **values):
+        """
+        Append one record.
+
+        Args:
+            **values: Value for every field (missing fields are zero)
+        """
+        for name, value in values.items():
+            self._buffer[name][self._pending] = value
+        self._pending += 1
+        if self._pending == self.chunk_size:
+            self.flush()
+
+    def extend(self, **columns):
+        """
+        Append several records given as equal-length columns.
+
+        Args:
+            **columns: Array of values for every field
+        """
+        n_rows = len(next(iter(columns.values())))
+        start = 0
+        while start < n_rows:
+            take = min(self.chunk_size - self._pending, n_rows - start)
+            block = self._buffer[self._pending:self._pending + take]
+            for name, column in columns.items():
+                block[name] = column[start:start + take]
+            self._pending += take
+            start += take
+            if self._pending == self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        """Write buffered records and update the header row count."""
+        if self._pending:
+            self._file.write(self._buffer[:self._pending].tobytes())
+            self._written += self._pending
+            self._pending = 0
+            self._buffer.fill(0)
+
+        end = self._file.tell()
+        self._file.seek(0)
+        self._file.write(_header(self.dtype, self._written, self._header_size))
+        self._file.seek(end)
+        self._file.flush()
+
+    def close(self):
+        """Flush remaining records and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+def load_trajectory(path: Union[str, os.PathLike]) -> np.memmap:
+    """
+    Memory-map a recorded trajectory without copying it into RAM.
+
+    Args:
+        path: `.npy` file written by TrajectoryRecorder
+
+    Returns:
+        Read-only structured array; index columns by field name
+    """
+    return np.load(path, mmap_mode="r")
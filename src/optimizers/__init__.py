@@ -0,0 +1 @@
+"""Classical and hybrid optimizers."""
@@ -0,0 +1,128 @@
+"""
+Atomic, asynchronous checkpointing of optimizer state.
+State is snapshotted on the calling thread and serialised on a background
+thread, so the optimization loop only pays for an in-memory copy.
+"""
+
+import os
+import queue
+import tempfile
+import threading
+import torch
+from typing import Any, Dict, Optional, Union
+
+PathLike = Union[str, os.PathLike]
+
+def _snapshot(state: Any) -> Any:
+    """Copy a state tree so later in-place updates cannot leak into it."""
+    if isinstance(state, torch.Tensor):
+        return state.detach().cpu().clone()
+    if isinstance(state, dict):
+        return type(state)((k, _snapshot(v)) for k, v in state.items())
+    if isinstance(state, (list, tuple)):
+        return type(state)(_snapshot(v) for v in state)
+    return state
+
+def save_checkpoint(state: Dict, path: PathLike):
+    """
+    Write a checkpoint atomically.
+
+    The state is written to a temporary file in the target directory,
+    flushed to disk and renamed over `path`, so readers only ever see a
+    complete checkpoint.
+
+    Args:
+        state: State dictionary (tensors, containers and primitives)
+        path: Checkpoint file
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".ckpt-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            torch.save(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def load_checkpoint(path: PathLike) -> Dict:
+    """
+    Load a checkpoint written by `save_checkpoint` or `AsyncCheckpointer`.
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        State dictionary
+    """
+    return torch.load(path, map_location="cpu", weights_only=True)
+
+class AsyncCheckpointer:
+    def __init__(self, max_pending: int = 2):
+        """
+        Initialize asynchronous checkpoint writer.
+
+        Args:
+            max_pending: Snapshots queued before `save` blocks the caller
+        """
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._worker, name="epsim-checkpoint", daemon=True
+        )
+        self._thread.start()
+
+    def _worker(self):
+        """Write queued snapshots until the sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                state, path = item
+                save_checkpoint(state, path)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Background checkpoint write failed") from error
+
+    def save(self, state: Dict, path: PathLike):
+        """
+        Snapshot state and schedule it to be written to `path`.
+
+        Args:
+            state: State dictionary, e.g. from `state_dict()`
+            path: Checkpoint file
+        """
+        self._raise_pending_error()
+        if not self._thread.is_alive():
+            raise RuntimeError("AsyncCheckpointer is closed")
+        self._queue.put((_snapshot(state), os.fspath(path)))
+
+    def wait(self):
+        """Block until every scheduled checkpoint has been written."""
+        self._queue.join()
+        self._raise_pending_error()
+
+    def close(self):
+        """Write outstanding checkpoints and stop the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_pending_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
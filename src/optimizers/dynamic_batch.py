@@ -3,9 +3,12 @@ Dynamic batch size adjustment strategy implementation.
 Adapts batch size based on gradient statistics and training dynamics.
 """
 
-import torch
 import numpy as np
+from collections import deque
+from itertools import islice
 from typing import Dict, Tuple, Optional
+from ..metrics import instrumentation
+from ..metrics.trajectory import TrajectoryRecorder
 
 class DynamicBatchSizer:
     def __init__(
@@ -13,7 +16,9 @@ class DynamicBatchSizer:
         b_min: int = 32,
         b_max: int = 512,
         alpha: float = 0.1,
-        warmup_steps: int = 100
+        warmup_steps: int = 100,
+        history_size: int = 100,
+        recorder: Optional[TrajectoryRecorder] = None
     ):
         """
         Initialize dynamic batch sizer.
@@ -23,17 +28,23 @@ class DynamicBatchSizer:
             b_max: Maximum batch size
             alpha: Adaptation rate
             warmup_steps: Number of warmup steps
+            history_size: Number of recent steps kept in memory
+            recorder: Optional sink receiving every step (see
+                `trajectory_fields`) for runs longer than the history
         """
         self.b_min = b_min
         self.b_max = b_max
         self.alpha = alpha
         self.warmup_steps = warmup_steps
+        self.history_size = history_size
+        self.recorder = recorder
         
         # Initialize tracking variables
         self.step_count = 0
-        self.grad_history = []
-        self.batch_history = []
+        self.grad_history = deque(maxlen=history_size)
+        self.batch_history = deque(maxlen=history_size)
         
+    @instrumentation.timed("batch_sizer.classical")
     def compute_batch_size(
         self,
         grad_norm: float,
@@ -54,6 +65,13 @@ class DynamicBatchSizer:
         self.step_count += 1
         self.grad_history.append(grad_norm)
         self.batch_history.append(current_batch)
+        if self.recorder is not None:
+            self.recorder.append(
+                step=self.step_count,
+                grad_norm=grad_norm,
+                loss=loss_value,
+                batch_size=current_batch
+            )
         
         # During warmup, use linear schedule
         if self.step_count < self.warmup_steps:
@@ -62,7 +80,8 @@ class DynamicBatchSizer:
             
         # Compute gradient variance
         if len(self.grad_history) > 10:
-            grad_var = np.var(self.grad_history[-10:])
+            # Only the 10 most recent norms, without copying the history
+            grad_var = np.var(np.fromiter(islice(reversed(self.grad_history), 10), float, 10))
         else:
             grad_var = 0
             
@@ -81,9 +100,9 @@ class DynamicBatchSizer:
         """Get current metrics for monitoring."""
         if len(self.grad_history) > 0:
             metrics = {
-                "avg_batch_size": np.mean(self.batch_history[-100:]),
-                "grad_variance": np.var(self.grad_history[-100:]),
-                "batch_efficiency": len(set(self.batch_history[-100:])) / 100
+                "avg_batch_size": np.mean(self.batch_history),
+                "grad_variance": np.var(self.grad_history),
+                "batch_efficiency": len(set(self.batch_history)) / self.history_size
             }
         else:
             metrics = {
@@ -94,8 +113,39 @@ class DynamicBatchSizer:
             
         return metrics
         
+    def state_dict(self) -> Dict:
+        """Get sizer state for checkpointing."""
+        return {
+            "b_min": self.b_min,
+            "b_max": self.b_max,
+            "alpha": self.alpha,
+            "warmup_steps": self.warmup_steps,
+            "step_count": self.step_count,
+            "grad_history": [float(g) for g in self.grad_history],
+            "batch_history": [int(b) for b in self.batch_history]
+        }
+        
+    def load_state_dict(self, state: Dict):
+        """
+        Restore sizer state.
+        
+        Args:
+            state: State from `state_dict`
+        """
+        self.b_min = state["b_min"]
+        self.b_max = state["b_max"]
+        self.alpha = state["alpha"]
+        self.warmup_steps = state["warmup_steps"]
+        self.step_count = state["step_count"]
+        self.grad_history = deque(state["grad_history"], maxlen=self.history_size)
+        self.batch_history = deque(state["batch_history"], maxlen=self.history_size)
+        
     def reset_stats(self):
         """Reset tracking statistics."""
         self.step_count = 0
-        self.grad_history = []
-        self.batch_history = [] 
\ No newline at end of file
+        self.grad_history.clear()
+        self.batch_history.clear()
+        
+    def trajectory_fields(self) -> Dict:
+        """Record layout written to the recorder at every step."""
+        return {"step": "i8", "grad_norm": "f8", "loss": "f8", "batch_size": "i8"} 
\ No newline at end of file
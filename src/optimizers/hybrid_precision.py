@@ -4,9 +4,10 @@ Combines FP16 quantum and FP32 classical computations for optimal performance.
 """
 
 import torch
-import pennylane as qml
 from typing import Dict, Tuple, Optional
 import numpy as np
+from ..quantum.circuit_cache import CompiledCircuit, get_circuit
+from ..metrics import instrumentation
 
 class HybridPrecisionOptimizer:
     def __init__(
@@ -25,7 +26,7 @@ class HybridPrecisionOptimizer:
             learning_rate: Learning rate for classical optimization
             beta: Error correction coefficient
         """
-        self.dev = qml.device(quantum_device, wires=n_qubits)
+        self.device_name = quantum_device
         self.n_qubits = n_qubits
         self.lr = learning_rate
         self.beta = beta
@@ -33,25 +34,24 @@ class HybridPrecisionOptimizer:
         # Initialize quantum and classical components
         self.quantum_grad = self._init_quantum_layer()
         self.classical_grad = self._init_classical_layer()
+        self.dev = self.quantum_grad.device
         
-    def _init_quantum_layer(self) -> qml.QNode:
-        """Initialize quantum computation layer with FP16 precision."""
-        @qml.qnode(self.dev, interface="torch", diff_method="parameter-shift")
-        def quantum_circuit(inputs, weights):
-            # Encode inputs
-            for i in range(self.n_qubits):
-                qml.RY(inputs[i], wires=i)
-            
-            # Parameterized quantum layers
-            for layer in range(2):
-                for i in range(self.n_qubits):
-                    qml.RZ(weights[layer, i], wires=i)
-                for i in range(self.n_qubits-1):
-                    qml.CNOT(wires=[i, i+1])
-            
-            return [qml.expval(qml.PauliZ(i)) for i in range(self.n_qubits)]
+        # Measured statistics of the latest step
+        self.step_count = 0
+        self.last_metrics = {}
+        
+    def _init_quantum_layer(self) -> CompiledCircuit:
+        """
+        Initialize quantum computation layer with FP16 precision.
         
-        return quantum_circuit
+        Inputs are encoded with RY rotations, followed by two layers of
+        RZ rotations and a CNOT chain; the encoding and first RZ layer are
+        fused into one rotation per wire by the circuit cache.
+        """
+        return get_circuit(
+            "hybrid", self.n_qubits, 2, self.device_name,
+            interface="torch", diff_method="parameter-shift"
+        )
         
     def _init_classical_layer(self) -> torch.nn.Module:
         """Initialize classical neural network with FP32 precision."""
@@ -79,15 +79,16 @@ class HybridPrecisionOptimizer:
             Tuple of quantum and classical gradients
         """
         # Quantum forward pass (FP16)
-        with torch.cuda.amp.autocast():
+        with instrumentation.timer("hybrid.quantum"), torch.cuda.amp.autocast():
             q_out = self.quantum_grad(inputs.half(), weights.half())
             q_loss = loss_fn(q_out)
             q_grad = torch.autograd.grad(q_loss, weights)[0]
         
         # Classical forward pass (FP32)
-        c_out = self.classical_grad(inputs)
-        c_loss = loss_fn(c_out)
-        c_grad = torch.autograd.grad(c_loss, self.classical_grad.parameters())[0]
+        with instrumentation.timer("hybrid.classical"):
+            c_out = self.classical_grad(inputs)
+            c_loss = loss_fn(c_out)
+            c_grad = torch.autograd.grad(c_loss, self.classical_grad.parameters())[0]
         
         # Apply error correction
         q_grad = q_grad * self.beta
@@ -155,4 +156,42 @@ class HybridPrecisionOptimizer:
             "combined_grad_norm": torch.norm(combined_grad).item()
         }
         
-        return weights, metrics 
\ No newline at end of file
+        self.step_count += 1
+        self.last_metrics = metrics
+        for name, value in metrics.items():
+            instrumentation.record(f"hybrid.{name}", value)
+        
+        return weights, metrics
+        
+    def state_dict(self) -> Dict:
+        """Get optimizer state, including the classical network, for checkpointing."""
+        return {
+            "n_qubits": self.n_qubits,
+            "lr": self.lr,
+            "beta": self.beta,
+            "classical": self.classical_grad.state_dict(),
+            "step_count": self.step_count,
+            "last_metrics": dict(self.last_metrics)
+        }
+        
+    def load_state_dict(self, state: Dict):
+        """
+        Restore optimizer state.
+        
+        Args:
+            state: State from `state_dict` of an optimizer with the same qubit count
+        """
+        if state["n_qubits"] != self.n_qubits:
+            raise ValueError(
+                f"Checkpoint is for n_qubits={state['n_qubits']}, "
+                f"optimizer has n_qubits={self.n_qubits}"
+            )
+        self.lr = state["lr"]
+        self.beta = state["beta"]
+        self.classical_grad.load_state_dict(state["classical"])
+        self.step_count = state["step_count"]
+        self.last_metrics = dict(state["last_metrics"])
+        
+    def get_metrics(self) -> Dict:
+        """Get metrics measured at the latest step."""
+        return {"step_count": self.step_count, **self.last_metrics} 
\ No newline at end of file
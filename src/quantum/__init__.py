@@ -0,0 +1 @@
+"""Quantum optimizers, Hamiltonians and circuit compilation."""
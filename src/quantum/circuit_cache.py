@@ -0,0 +1,380 @@
+"""
+Process-wide compiled circuit cache.
+Builds each structurally distinct ansatz once and fuses consecutive
+single-qubit rotations into one unitary per wire.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..lazy import lazy_import
+from ..metrics import instrumentation
+
+# Loaded on first circuit compilation
+qml = lazy_import("pennylane")
+
+# An angle source is (argument position, index into that argument); a term is
+# a tuple of sources whose values are summed to give one rotation angle.
+Source = Tuple[int, Hashable]
+Term = Tuple[Source, ...]
+
+_ROTATION_AXES = {"RY": "Y", "RZ": "Z"}
+
+
+class Gate:
+    """Single operation of the circuit intermediate representation."""
+
+    __slots__ = ("name", "wires", "terms")
+
+    def __init__(self, name: str, wires: Tuple[int, ...], terms: Tuple = ()):
+        """
+        Initialize gate.
+
+        Args:
+            name: Gate name ("RY", "RZ", "CNOT", "Rot" or "Fused")
+            wires: Wires the gate acts on
+            terms: Angle terms; for "Fused" a tuple of (axis, term) pairs
+        """
+        self.name = name
+        self.wires = wires
+        self.terms = terms
+
+    def __repr__(self) -> str:
+        return f"Gate({self.name!r}, wires={self.wires}, terms={self.terms})"
+
+
+def _qite_gates(n_qubits: int, depth: int) -> List[Gate]:
+    """Gate list of the QITE ansatz (`QITEOptimizer`)."""
+    gates = [Gate("RY", (i,), (((0, i),),)) for i in range(n_qubits)]
+    for d in range(depth):
+        for i in range(0, n_qubits - 1, 2):
+            gates.append(Gate("CNOT", (i, i + 1)))
+        for i in range(n_qubits):
+            index = n_qubits + d * n_qubits + i
+            gates.append(Gate("RZ", (i,), (((0, index),),)))
+        for i in range(1, n_qubits - 1, 2):
+            gates.append(Gate("CNOT", (i, i + 1)))
+    return gates
+
+
+def _fisher_gates(n_qubits: int, depth: int) -> List[Gate]:
+    """Gate list of the QFI estimation ansatz (`QuantumFisherEstimator`)."""
+    gates = [Gate("RY", (i,), (((0, i),),)) for i in range(n_qubits)]
+    for i in range(n_qubits - 1):
+        gates.append(Gate("CNOT", (i, i + 1)))
+    return gates
+
+
+def _hybrid_gates(n_qubits: int, depth: int) -> List[Gate]:
+    """Gate list of the hybrid precision ansatz (`HybridPrecisionOptimizer`)."""
+    gates = [Gate("RY", (i,), (((0, i),),)) for i in range(n_qubits)]
+    for layer in range(depth):
+        for i in range(n_qubits):
+            gates.append(Gate("RZ", (i,), (((1, (layer, i)),),)))
+        for i in range(n_qubits - 1):
+            gates.append(Gate("CNOT", (i, i + 1)))
+    return gates
+
+
+ANSATZE: Dict[str, Callable[[int, int], List[Gate]]] = {
+    "qite": _qite_gates,
+    "fisher": _fisher_gates,
+    "hybrid": _hybrid_gates,
+}
+
+
+def register_ansatz(name: str, builder: Callable[[int, int], List[Gate]]):
+    """
+    Register a gate-list builder under an ansatz name.
+
+    Args:
+        name: Ansatz name used as part of the cache key
+        builder: Function mapping (n_qubits, depth) to a list of gates
+    """
+    ANSATZE[name] = builder
+
+
+def _merge_axis_runs(run: List[Tuple[str, Term]]) -> List[Tuple[str, Term]]:
+    """Merge adjacent rotations about the same axis by summing their angles."""
+    merged: List[Tuple[str, Term]] = []
+    for axis, term in run:
+        if merged and merged[-1][0] == axis:
+            merged[-1] = (axis, merged[-1][1] + term)
+        else:
+            merged.append((axis, term))
+    return merged
+
+
+def _fuse_run(wire: int, run: List[Tuple[str, Term]]) -> Gate:
+    """Fuse a run of single-qubit rotations on one wire into a single gate."""
+    run = _merge_axis_runs(run)
+    axes = "".join(axis for axis, _ in run)
+
+    if len(run) == 1:
+        return Gate("R" + axes, (wire,), (run[0][1],))
+
+    # Rot(phi, theta, omega) = RZ(omega) RY(theta) RZ(phi) covers every
+    # alternating run of at most three rotations that fits the ZYZ pattern.
+    if axes in ("ZY", "YZ", "ZYZ"):
+        padded = {"ZY": "ZY_", "YZ": "_YZ", "ZYZ": "ZYZ"}[axes]
+        terms = []
+        position = 0
+        for slot in padded:
+            if slot == "_":
+                terms.append(())
+            else:
+                terms.append(run[position][1])
+                position += 1
+        return Gate("Rot", (wire,), tuple(terms))
+
+    return Gate("Fused", (wire,), tuple(run))
+
+
+def fuse_single_qubit_rotations(gates: List[Gate]) -> List[Gate]:
+    """
+    Fuse consecutive single-qubit rotations on each wire.
+
+    Rotations on a wire are accumulated until a multi-qubit gate touches
+    that wire, at which point the pending run is emitted as one gate.
+
+    Args:
+        gates: Gate list containing RY, RZ and CNOT gates
+
+    Returns:
+        Equivalent gate list with at most one rotation between entanglers
+    """
+    pending: Dict[int, List[Tuple[str, Term]]] = {}
+    fused: List[Gate] = []
+
+    def flush(wire: int):
+        run = pending.pop(wire, None)
+        if run:
+            fused.append(_fuse_run(wire, run))
+
+    for gate in gates:
+        if gate.name in _ROTATION_AXES:
+            wire = gate.wires[0]
+            pending.setdefault(wire, []).append(
+                (_ROTATION_AXES[gate.name], gate.terms[0])
+            )
+        else:
+            for wire in gate.wires:
+                flush(wire)
+            fused.append(gate)
+
+    for wire in sorted(pending):
+        flush(wire)
+
+    return fused
+
+
+def _gather(args: Tuple, source: Source):
+    """Read one angle from the circuit arguments, keeping any batch dims."""
+    position, index = source
+    if isinstance(index, tuple):
+        return args[position][(Ellipsis,) + index]
+    return args[position][..., index]
+
+
+def _angle(args: Tuple, term: Term, reference):
+    """Evaluate an angle term; empty terms become zeros shaped like `reference`."""
+    if not term:
+        return qml.math.zeros_like(reference)
+    total = _gather(args, term[0])
+    for source in term[1:]:
+        total = total + _gather(args, source)
+    return total
+
+
+def _fused_matrix(args: Tuple, run: Tuple[Tuple[str, Term], ...]):
+    """Matrix product of a run that does not fit a single Rot gate."""
+    matrix = None
+    for axis, term in run:
+        angle = _angle(args, term, None)
+        factor = (qml.RY if axis == "Y" else qml.RZ).compute_matrix(angle)
+        matrix = factor if matrix is None else qml.math.matmul(factor, matrix)
+    return matrix
+
+
+class CompiledCircuit:
+    """Fused gate list bound to a device and QNode."""
+
+    def __init__(
+        self,
+        ansatz: str,
+        n_qubits: int,
+        depth: int,
+        device: str,
+        shots: Optional[int],
+        qnode_kwargs: Dict
+    ):
+        """
+        Compile circuit.
+
+        Args:
+            ansatz: Registered ansatz name
+            n_qubits: Number of qubits
+            depth: Number of layers
+            device: Quantum device name
+            shots: Number of measurement shots (None for analytic)
+            qnode_kwargs: Extra keyword arguments for `qml.QNode`
+        """
+        self.ansatz = ansatz
+        self.n_qubits = n_qubits
+        self.depth = depth
+        self.shots = shots
+        self.gates = fuse_single_qubit_rotations(ANSATZE[ansatz](n_qubits, depth))
+
+        if shots is None:
+            self.device = qml.device(device, wires=n_qubits)
+        else:
+            self.device = qml.device(device, wires=n_qubits, shots=shots)
+        self.qnode = qml.QNode(self._apply, self.device, **qnode_kwargs)
+
+    def _queue(self, *args):
+        """Queue the fused gate list on the active tape."""
+        for gate in self.gates:
+            if gate.name == "CNOT":
+                qml.CNOT(wires=list(gate.wires))
+            elif gate.name == "Fused":
+                qml.QubitUnitary(_fused_matrix(args, gate.terms), wires=gate.wires)
+            else:
+                reference = _gather(args, next(t for t in gate.terms if t)[0])
+                angles = [_angle(args, term, reference) for term in gate.terms]
+                getattr(qml, gate.name)(*angles, wires=gate.wires[0])
+
+    def _apply(self, *args):
+        """Quantum function measuring PauliZ on every wire."""
+        self._queue(*args)
+        return [qml.expval(qml.PauliZ(i)) for i in range(self.n_qubits)]
+
+    def __call__(self, *args):
+        if not instrumentation.is_enabled():
+            return self.qnode(*args)
+
+        # Broadcast calls simulate one circuit per leading batch entry
+        shape = qml.math.shape(args[0])
+        executions = 1
+        for size in shape[:-1]:
+            executions *= size
+        instrumentation.count("qnode.calls")
+        instrumentation.count("qnode.executions", executions)
+        if self.shots is not None:
+            instrumentation.count("qnode.shots", executions * self.shots)
+        with instrumentation.timer(f"qnode.{self.ansatz}"):
+            return self.qnode(*args)
+
+
+class CircuitCache:
+    """Bounded LRU cache of compiled circuits, safe to share between threads."""
+
+    def __init__(self, maxsize: int = 64):
+        """
+        Initialize circuit cache.
+
+        Args:
+            maxsize: Maximum number of compiled circuits kept alive
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, CompiledCircuit]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        ansatz: str,
+        n_qubits: int,
+        depth: int = 0,
+        device: str = "default.qubit",
+        shots: Optional[int] = None,
+        **qnode_kwargs
+    ) -> CompiledCircuit:
+        """
+        Return the compiled circuit for a shape, compiling it on first use.
+
+        Args:
+            ansatz: Registered ansatz name
+            n_qubits: Number of qubits
+            depth: Number of layers
+            device: Quantum device name
+            shots: Number of measurement shots (None for analytic)
+            **qnode_kwargs: Extra keyword arguments for `qml.QNode`
+
+        Returns:
+            Compiled circuit
+        """
+        key = (
+            ansatz, n_qubits, depth, device, shots,
+            tuple(sorted(qnode_kwargs.items()))
+        )
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = CompiledCircuit(
+            ansatz, n_qubits, depth, device, shots, qnode_kwargs
+        )
+
+        with self._lock:
+            # Another thread may have compiled the same key meanwhile
+            compiled = self._entries.setdefault(key, compiled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        """Drop all compiled circuits and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
+
+_CACHE = CircuitCache()
+
+
+def get_circuit(
+    ansatz: str,
+    n_qubits: int,
+    depth: int = 0,
+    device: str = "default.qubit",
+    shots: Optional[int] = None,
+    **qnode_kwargs
+) -> CompiledCircuit:
+    """Look up a compiled circuit in the process-wide cache."""
+    return _CACHE.get(ansatz, n_qubits, depth, device, shots, **qnode_kwargs)
+
+
+def set_cache_size(maxsize: int):
+    """Resize the process-wide cache, evicting least recently used entries."""
+    with _CACHE._lock:
+        _CACHE.maxsize = maxsize
+        while len(_CACHE._entries) > maxsize:
+            _CACHE._entries.popitem(last=False)
+
+
+def clear_cache():
+    """Clear the process-wide cache."""
+    _CACHE.clear()
+
+
+def cache_info() -> Dict:
+    """Get statistics of the process-wide cache."""
+    return _CACHE.info()
@@ -0,0 +1,190 @@
+"""
+Structured Hamiltonian representations for QITE evolution.
+Supports dense matrices, torch sparse COO/CSR tensors and compact
+Pauli-Z term lists evaluated term-wise.
+"""
+
+import torch
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+# A Pauli term is (coefficient, wires): one wire for Z_i, two wires for Z_i Z_j
+PauliTerm = Tuple[float, Sequence[int]]
+
+_SPARSE_LAYOUTS = (torch.sparse_coo, torch.sparse_csr)
+
+class PauliTerms:
+    def __init__(self, terms: Iterable[PauliTerm], n_qubits: Optional[int] = None):
+        """
+        Initialize Pauli term list.
+
+        Acting on a vector of PauliZ expectations, a term c Z_i contributes
+        c <Z_i> to entry i and a coupling c Z_i Z_j contributes c <Z_j> to
+        entry i and c <Z_i> to entry j. This matches the dense matrix with
+        H[i, i] = c and H[i, j] = H[j, i] = c respectively.
+
+        Args:
+            terms: Iterable of (coefficient, wires) pairs
+            n_qubits: Number of qubits (inferred from the largest wire if None)
+        """
+        rows: List[int] = []
+        cols: List[int] = []
+        values: List[float] = []
+
+        for coeff, wires in terms:
+            wires = tuple(int(w) for w in wires)
+            if len(wires) == 1 or (len(wires) == 2 and wires[0] == wires[1]):
+                rows.append(wires[0])
+                cols.append(wires[0])
+                values.append(float(coeff))
+            elif len(wires) == 2:
+                rows.extend(wires)
+                cols.extend(wires[::-1])
+                values.extend([float(coeff)] * 2)
+            else:
+                raise ValueError(
+                    f"Only Z and ZZ terms are supported, got wires {wires}"
+                )
+
+        self.rows = torch.tensor(rows, dtype=torch.long)
+        self.cols = torch.tensor(cols, dtype=torch.long)
+        self.values = torch.tensor(values, dtype=torch.float64)
+        self.n_qubits = n_qubits if n_qubits is not None else (
+            int(max(rows)) + 1 if rows else 0
+        )
+
+    @classmethod
+    def nearest_neighbour(
+        cls,
+        n_qubits: int,
+        coupling: float = 1.0,
+        field: float = 0.0,
+        periodic: bool = False
+    ) -> "PauliTerms":
+        """
+        Build an Ising chain with nearest-neighbour ZZ couplings.
+
+        Args:
+            n_qubits: Number of qubits
+            coupling: Coefficient of every Z_i Z_{i+1} term
+            field: Coefficient of every Z_i term
+            periodic: Whether to couple the last qubit to the first
+
+        Returns:
+            Pauli term list
+        """
+        terms = [(coupling, (i, i + 1)) for i in range(n_qubits - 1)]
+        if periodic and n_qubits > 2:
+            terms.append((coupling, (n_qubits - 1, 0)))
+        if field:
+            terms.extend((field, (i,)) for i in range(n_qubits))
+        return cls(terms, n_qubits)
+
+    @classmethod
+    def from_dense(cls, matrix: torch.Tensor, tol: float = 0.0) -> "PauliTerms":
+        """
+        Extract Z/ZZ terms from a symmetric coupling matrix.
+
+        Args:
+            matrix: Symmetric (n, n) matrix
+            tol: Entries with magnitude at or below this are dropped
+
+        Returns:
+            Pauli term list
+        """
+        upper = torch.triu(matrix)
+        idx = torch.nonzero(upper.abs() > tol)
+        terms = [
+            (upper[i, j].item(), (i,) if i == j else (i, j))
+            for i, j in idx.tolist()
+        ]
+        return cls(terms, matrix.shape[0])
+
+    def terms(self) -> List[Tuple[float, Tuple[int, ...]]]:
+        """Get the (coefficient, wires) terms, one per coupling."""
+        upper = self.rows <= self.cols
+        return [
+            (value, (row,) if row == col else (row, col))
+            for row, col, value in zip(
+                self.rows[upper].tolist(),
+                self.cols[upper].tolist(),
+                self.values[upper].tolist()
+            )
+        ]
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored matrix entries."""
+        return len(self.values)
+
+    def apply(self, exp_vals: torch.Tensor) -> torch.Tensor:
+        """
+        Evaluate the Hamiltonian term-wise on PauliZ expectations.
+
+        Args:
+            exp_vals: Expectations of shape (..., n_qubits)
+
+        Returns:
+            Evolved state of the same shape, in O(nnz) time and memory
+        """
+        values = self.values.to(exp_vals.dtype)
+        contributions = exp_vals[..., self.cols] * values
+        evolved = torch.zeros_like(exp_vals)
+        return evolved.index_add_(-1, self.rows, contributions)
+
+    def to_sparse(self, layout: torch.layout = torch.sparse_coo) -> torch.Tensor:
+        """Convert to a torch sparse tensor of shape (n_qubits, n_qubits)."""
+        matrix = torch.sparse_coo_tensor(
+            torch.stack([self.rows, self.cols]),
+            self.values,
+            (self.n_qubits, self.n_qubits)
+        ).coalesce()
+        if layout == torch.sparse_csr:
+            return matrix.to_sparse_csr()
+        return matrix
+
+    def to_dense(self) -> torch.Tensor:
+        """Convert to a dense (n_qubits, n_qubits) matrix."""
+        return self.to_sparse().to_dense()
+
+HamiltonianLike = Union[torch.Tensor, PauliTerms, Sequence[PauliTerm]]
+
+def as_hamiltonian(hamiltonian: HamiltonianLike) -> Union[torch.Tensor, PauliTerms]:
+    """
+    Normalise a Hamiltonian argument, compiling term lists once.
+
+    Args:
+        hamiltonian: Dense or sparse tensor, PauliTerms, or list of terms
+
+    Returns:
+        Tensor or PauliTerms
+    """
+    if isinstance(hamiltonian, (torch.Tensor, PauliTerms)):
+        return hamiltonian
+    return PauliTerms(hamiltonian)
+
+def apply_hamiltonian(
+    hamiltonian: HamiltonianLike,
+    exp_vals: torch.Tensor
+) -> torch.Tensor:
+    """
+    Apply a Hamiltonian to a batch of PauliZ expectation vectors.
+
+    Dispatches to term-wise evaluation for Pauli term lists, sparse matmul
+    for COO/CSR tensors and dense matmul otherwise.
+
+    Args:
+        hamiltonian: Dense or sparse tensor, PauliTerms, or list of terms
+        exp_vals: Expectations of shape (K, n_qubits)
+
+    Returns:
+        Evolved state H <Z> for every row, shape (K, n_qubits)
+    """
+    hamiltonian = as_hamiltonian(hamiltonian)
+
+    if isinstance(hamiltonian, PauliTerms):
+        return hamiltonian.apply(exp_vals)
+
+    hamiltonian = hamiltonian.to(exp_vals.dtype)
+    if hamiltonian.layout in _SPARSE_LAYOUTS:
+        return torch.sparse.mm(hamiltonian, exp_vals.T).T
+    return torch.matmul(exp_vals, hamiltonian.T)
@@ -1,32 +1,67 @@
-import pennylane as qml
 import torch
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 import numpy as np
+from ..lazy import lazy_import
+from .hamiltonians import HamiltonianLike, PauliTerms, as_hamiltonian
+from ..metrics import instrumentation
+from ..metrics.trajectory import TrajectoryRecorder
+
+qml = lazy_import("pennylane")
 
 class QuantumOptimizer:
     def __init__(self, n_qubits: int, 
-                 schedule_fn: Optional[Callable] = None):
+                 schedule_fn: Optional[Callable] = None,
+                 trotter_steps: int = 2,
+                 anneal_time: float = 10.0):
         """
         Initialize quantum optimizer
         
         Args:
             n_qubits: Number of qubits to use
             schedule_fn: Annealing schedule function
+            trotter_steps: Trotter steps per evolution under H(s)
+            anneal_time: Total evolution time of one anneal; a step of
+                dt in normalised time evolves for anneal_time * dt
         """
         self.n_qubits = n_qubits
         self.schedule_fn = schedule_fn or self._default_schedule
+        self.anneal_time = anneal_time
         
         # Initialize quantum device
         self.dev = qml.device("default.qubit", wires=n_qubits)
         
-    def optimize(self, hamiltonian: torch.Tensor, 
-                steps: int = 1000) -> torch.Tensor:
+        # Trotter steps per evolution of H(s)
+        self.trotter_steps = trotter_steps
+        
+        # Number of annealing circuits evaluated, in total and by the last run
+        self.circuit_executions = 0
+        self.last_run = {}
+        
+        # State vector reached by the last anneal
+        self.state: Optional[np.ndarray] = None
+        
+    def optimize(self, hamiltonian: HamiltonianLike, 
+                steps: int = 1000,
+                recorder: Optional[TrajectoryRecorder] = None,
+                adaptive: bool = False,
+                tol: float = 1e-4,
+                max_change: float = 0.02,
+                max_dt: float = 0.1) -> torch.Tensor:
         """
         Perform quantum optimization using adiabatic evolution
         
         Args:
-            hamiltonian: Problem Hamiltonian
+            hamiltonian: Problem Hamiltonian as a coupling matrix (dense or
+                sparse) or Pauli-Z terms
             steps: Number of annealing steps
+            recorder: Optional sink receiving every step's schedule value and
+                expectations (see `trajectory_fields`); only the final step
+                is kept in memory
+            adaptive: Adapt the step to how fast the expectations move and
+                stop early once converged (see `_anneal_adaptive`)
+            tol: Convergence tolerance of the adaptive mode
+            max_change: Largest expectation change accepted per adaptive step
+            max_dt: Largest adaptive step in normalised time
             
         Returns:
             Optimized parameters
@@ -34,40 +69,239 @@ class QuantumOptimizer:
         # Convert to PennyLane observables
         h_problem = self._convert_hamiltonian(hamiltonian)
         h_initial = self._create_initial_hamiltonian()
+        problem_coeffs, problem_ops = h_problem.terms()
+        initial_coeffs, initial_ops = h_initial.terms()
+        
+        wires = range(self.n_qubits)
         
         # Define quantum circuit
         @qml.qnode(self.dev)
-        def circuit(s):
-            # Prepare initial state
-            for i in range(self.n_qubits):
-                qml.Hadamard(wires=i)
+        def circuit(state, s, duration):
+            # Continue from the state reached by the previous step
+            qml.StatePrep(state, wires=wires)
                 
-            # Time evolution
-            qml.Hamiltonian(
-                coeffs=[(1-s), s],
-                observables=[h_initial, h_problem]
+            # Time evolution under H(s) = (1-s) H_initial + s H_problem
+            h_s = qml.Hamiltonian(
+                [s * c for c in problem_coeffs] + [(1 - s) * c for c in initial_coeffs],
+                list(problem_ops) + list(initial_ops)
             )
+            qml.ApproxTimeEvolution(h_s, duration, self.trotter_steps)
             
-            return [qml.expval(qml.PauliZ(i)) for i in range(self.n_qubits)]
+            return qml.state()
+        
+        def evolve(state: np.ndarray, s: float, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+            state = np.asarray(circuit(state, s, self.anneal_time * dt))
+            return state, self._z_expectations(state)
+        
+        # Every anneal starts from the Hadamard state |+>^n
+        initial_state = np.full(2 ** self.n_qubits, 2 ** (-self.n_qubits / 2), dtype=complex)
             
         # Run annealing
-        results = []
+        with instrumentation.timer("annealer.quantum"):
+            if adaptive:
+                self.state, result, evaluations = self._anneal_adaptive(
+                    evolve, initial_state, steps, tol, max_change, max_dt, recorder
+                )
+            else:
+                self.state, result, evaluations = self._anneal_fixed(
+                    evolve, initial_state, steps, recorder
+                )
+        
+        self.circuit_executions += evaluations
+        instrumentation.count("qnode.calls", evaluations)
+        instrumentation.count("qnode.executions", evaluations)
+            
+        return torch.tensor(result)
+    
+    def energy(self, hamiltonian: HamiltonianLike) -> float:
+        """
+        Exact expectation of a Z/ZZ Hamiltonian in the last annealed state.
+        
+        Unlike products of single-qubit expectations, this includes the
+        correlations <Z_i Z_j> of the coupling terms.
+        
+        Args:
+            hamiltonian: Coupling matrix (dense or sparse) or Pauli-Z terms
+            
+        Returns:
+            Energy <psi|H|psi>
+        """
+        if self.state is None:
+            raise RuntimeError("optimize has not been run")
+        h = as_hamiltonian(hamiltonian)
+        if isinstance(h, torch.Tensor):
+            h = PauliTerms.from_dense(h if h.layout == torch.strided else h.to_dense())
+        
+        probs = (np.abs(self.state) ** 2).reshape((2,) * self.n_qubits)
+        signs = np.array([1.0, -1.0])
+        energy = 0.0
+        for coeff, wires in h.terms():
+            values = probs
+            for wire in wires:
+                shape = [1] * self.n_qubits
+                shape[wire] = 2
+                values = values * signs.reshape(shape)
+            energy += coeff * values.sum()
+        return float(energy)
+    
+    def _z_expectations(self, state: np.ndarray) -> np.ndarray:
+        """PauliZ expectation of every wire of a state vector."""
+        probs = (np.abs(state) ** 2).reshape((2,) * self.n_qubits)
+        expvals = np.empty(self.n_qubits)
+        for i in range(self.n_qubits):
+            marginal = np.moveaxis(probs, i, 0).reshape(2, -1).sum(axis=1)
+            expvals[i] = marginal[0] - marginal[1]
+        return expvals
+    
+    def _anneal_fixed(
+        self,
+        evolve: Callable,
+        state: np.ndarray,
+        steps: int,
+        recorder: Optional[TrajectoryRecorder] = None
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Evolve under H(s) for 1 / steps at every point t = k / steps."""
+        result = None
         for t in range(steps):
             s = self.schedule_fn(t/steps)
-            results.append(circuit(s))
+            state, result = evolve(state, s, 1 / steps)
+            if recorder is not None:
+                recorder.append(step=t, s=s, expvals=result)
+        
+        self.last_run = {
+            "evaluations": steps,
+            "fixed_evaluations": steps,
+            "evaluations_saved": 0,
+            "final_t": (steps - 1) / steps,
+            "converged": False
+        }
+        return state, result, steps
+    
+    def _anneal_adaptive(
+        self,
+        evolve: Callable,
+        state: np.ndarray,
+        steps: int,
+        tol: float,
+        max_change: float,
+        max_dt: float,
+        recorder: Optional[TrajectoryRecorder] = None,
+        patience: int = 2
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Anneal with a step size adapted to the expectation dynamics.
+        
+        Every accepted step evolves the current state under H(s) at the
+        step's end for the step's duration. The step in normalised time t
+        grows while the expectations change by less than `max_change` per
+        step and shrinks (rejecting the step) when they change faster, so
+        steps are large on the flat ends of the schedule and fine near the
+        sigmoid midpoint. The run
+        stops early once the estimated remaining change, |de/ds| times the
+        schedule distance left to travel, stays below `tol` for `patience`
+        accepted steps. Steps are never finer than the fixed 1 / steps grid
+        and end at the same final time.
+        
+        Args:
+            evolve: Maps (state, s, dt) to the evolved state and its PauliZ
+                expectations
+            state: Initial state vector
+            steps: Number of steps of the fixed schedule
+            tol: Convergence tolerance on the remaining expectation change
+            max_change: Largest expectation change accepted per step
+            max_dt: Largest step in normalised time
+            recorder: Optional trajectory sink for accepted steps
+            patience: Consecutive converged steps before stopping
+            
+        Returns:
+            Final state, its expectations and number of circuit evaluations
+        """
+        dt_min = 1 / steps
+        t_end = (steps - 1) / steps
+        s_end = self.schedule_fn(t_end)
+        
+        t = 0.0
+        s = self.schedule_fn(t)
+        state, result = evolve(state, s, dt_min)
+        evaluations = 1
+        accepted = 1
+        calm_steps = 0
+        converged = False
+        dt = dt_min
+        if recorder is not None:
+            recorder.append(step=0, s=s, expvals=result)
+        
+        while t < t_end and not converged:
+            t_next = min(t + dt, t_end)
+            s_next = self.schedule_fn(t_next)
+            candidate_state, candidate = evolve(state, s_next, t_next - t)
+            evaluations += 1
+            change = float(np.max(np.abs(candidate - result)))
             
-        return torch.tensor(results[-1])
+            # Reject and refine when the expectations move too fast
+            if change > max_change and dt > dt_min:
+                dt = max(dt / 2, dt_min)
+                continue
+            
+            rate = change / max(abs(s_next - s), 1e-12)
+            t, s, state, result = t_next, s_next, candidate_state, candidate
+            if recorder is not None:
+                recorder.append(step=accepted, s=s, expvals=result)
+            accepted += 1
+            
+            # Early stop once the extrapolated remaining change is negligible
+            calm_steps = calm_steps + 1 if rate * abs(s_end - s) < tol else 0
+            converged = calm_steps >= patience
+            
+            growth = min(max(0.9 * max_change / max(change, 1e-12), 0.5), 2.0)
+            dt = min(max(dt * growth, dt_min), max_dt)
+        
+        self.last_run = {
+            "evaluations": evaluations,
+            "fixed_evaluations": steps,
+            "evaluations_saved": steps - evaluations,
+            "final_t": t,
+            "converged": converged
+        }
+        return state, result, evaluations
+    
+    def trajectory_fields(self) -> Dict:
+        """Record layout written to a TrajectoryRecorder by `optimize`."""
+        return {"step": "i8", "s": "f8", "expvals": ("f8", (self.n_qubits,))}
+    
+    def get_metrics(self) -> Dict:
+        """Get annealing metrics, including evaluations saved by the last run."""
+        return {
+            "qubit_count": self.n_qubits,
+            "circuit_executions": self.circuit_executions,
+            **self.last_run
+        }
     
     def _default_schedule(self, t: float) -> float:
         """Default annealing schedule"""
         return 1 / (1 + np.exp(-8*(t-0.5)))
     
-    def _convert_hamiltonian(self, h: torch.Tensor) -> qml.Hamiltonian:
-        """Convert torch tensor to PennyLane Hamiltonian"""
-        # Implementation depends on Hamiltonian format
-        pass
+    def _convert_hamiltonian(self, h: HamiltonianLike) -> "qml.Hamiltonian":
+        """
+        Convert torch tensor to PennyLane Hamiltonian
+        
+        A coupling matrix H maps to sum_i H_ii Z_i + sum_{i<j} H_ij Z_i Z_j,
+        matching the Pauli-term convention of QITE evolution.
+        """
+        h = as_hamiltonian(h)
+        if isinstance(h, torch.Tensor):
+            h = PauliTerms.from_dense(h if h.layout == torch.strided else h.to_dense())
+        
+        coeffs, obs = [], []
+        for coeff, wires in h.terms():
+            coeffs.append(coeff)
+            if len(wires) == 1:
+                obs.append(qml.PauliZ(wires[0]))
+            else:
+                obs.append(qml.PauliZ(wires[0]) @ qml.PauliZ(wires[1]))
+        return qml.Hamiltonian(coeffs, obs)
     
-    def _create_initial_hamiltonian(self) -> qml.Hamiltonian:
+    def _create_initial_hamiltonian(self) -> "qml.Hamiltonian":
         """Create initial Hamiltonian"""
         coeffs = [1.0] * self.n_qubits
         obs = [qml.PauliX(i) for i in range(self.n_qubits)]
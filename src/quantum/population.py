@@ -0,0 +1,188 @@
+"""
+Vectorised multi-start population mode for QITE optimization.
+Evolves K parameter vectors as one (K, P) tensor so every imaginary-time
+gradient of a step comes from a single batched simulation.
+"""
+
+import torch
+from typing import Dict, Optional, Tuple
+from .hamiltonians import HamiltonianLike, as_hamiltonian
+from .qite_optimizer import QITEOptimizer
+from ..metrics import instrumentation
+
+class QITEPopulation:
+    def __init__(
+        self,
+        optimizer: QITEOptimizer,
+        init_params: torch.Tensor,
+        tol: float = 1e-4,
+        patience: int = 3
+    ):
+        """
+        Initialize multi-start population.
+
+        Args:
+            optimizer: QITE optimizer providing circuit and learning rate
+            init_params: Initial parameters of shape (K, P)
+            tol: Gradient norm below which a member counts as converged
+            patience: Consecutive converged steps before a member stops
+        """
+        if init_params.dim() != 2:
+            raise ValueError("init_params must have shape (K, P)")
+
+        self.optimizer = optimizer
+        self.tol = tol
+        self.patience = patience
+
+        n_members = init_params.shape[0]
+        self.params = init_params.detach().clone()
+        self.energies = torch.full((n_members,), float("inf"), dtype=self.params.dtype)
+        self.grad_norms = torch.full((n_members,), float("inf"), dtype=self.params.dtype)
+
+        # Member status: active members are still being stepped
+        self.active = torch.ones(n_members, dtype=torch.bool)
+        self.converged = torch.zeros(n_members, dtype=torch.bool)
+        self.culled = torch.zeros(n_members, dtype=torch.bool)
+        self.calm_steps = torch.zeros(n_members, dtype=torch.long)
+        self.step_count = 0
+
+    @property
+    def size(self) -> int:
+        """Number of members in the population."""
+        return self.params.shape[0]
+
+    def step(self, hamiltonian: Optional[HamiltonianLike] = None) -> Dict:
+        """
+        Advance every active member by one gradient step.
+
+        Args:
+            hamiltonian: Optional Hamiltonian (dense, sparse or Pauli terms)
+
+        Returns:
+            Step metrics
+        """
+        idx = torch.nonzero(self.active).squeeze(1)
+        if len(idx) > 0:
+            energy, grad = self.optimizer._evolution_terms(
+                self.params[idx], hamiltonian
+            )
+            grad_norm = torch.linalg.norm(grad, dim=1)
+
+            self.params[idx] -= self.optimizer.lr * grad
+            self.energies[idx] = energy
+            self.grad_norms[idx] = grad_norm
+
+            # Mean over the members stepped, as for a batched optimizer call
+            self.optimizer.gradient_norm = grad_norm.mean().item()
+            instrumentation.record("qite.gradient_norm", self.optimizer.gradient_norm)
+
+            # Per-member early termination
+            calm = grad_norm < self.tol
+            self.calm_steps[idx] = torch.where(
+                calm, self.calm_steps[idx] + 1, torch.zeros_like(self.calm_steps[idx])
+            )
+            done = idx[self.calm_steps[idx] >= self.patience]
+            self.converged[done] = True
+            self.active[done] = False
+
+        self.step_count += 1
+        return self.get_metrics()
+
+    def cull(self, fraction: float = 0.5, min_active: int = 1) -> torch.Tensor:
+        """
+        Stop the worst active members by energy.
+
+        Args:
+            fraction: Fraction of active members to remove
+            min_active: Number of active members always kept
+
+        Returns:
+            Indices of culled members
+        """
+        idx = torch.nonzero(self.active).squeeze(1)
+        n_cull = min(int(len(idx) * fraction), max(len(idx) - min_active, 0))
+        if n_cull == 0:
+            return idx[:0]
+
+        worst = idx[torch.argsort(self.energies[idx], descending=True)[:n_cull]]
+        self.active[worst] = False
+        self.culled[worst] = True
+        return worst
+
+    def run(
+        self,
+        steps: int,
+        hamiltonian: Optional[HamiltonianLike] = None,
+        cull_every: int = 0,
+        cull_fraction: float = 0.5,
+        min_active: int = 1
+    ) -> Tuple[torch.Tensor, float]:
+        """
+        Run the population until every member stops or `steps` is reached.
+
+        Args:
+            steps: Maximum number of steps
+            hamiltonian: Optional Hamiltonian (dense, sparse or Pauli terms)
+            cull_every: Cull poor members every this many steps (0 disables)
+            cull_fraction: Fraction of active members removed per cull
+            min_active: Number of active members never culled
+
+        Returns:
+            Best parameters and their energy
+        """
+        if hamiltonian is not None:
+            hamiltonian = as_hamiltonian(hamiltonian)
+
+        for t in range(1, steps + 1):
+            self.step(hamiltonian)
+            if not self.active.any():
+                break
+            if cull_every and t % cull_every == 0:
+                self.cull(cull_fraction, min_active)
+
+        return self.best()
+
+    def best(self) -> Tuple[torch.Tensor, float]:
+        """Get parameters and energy of the lowest-energy non-culled member."""
+        energies = self.energies.masked_fill(self.culled, float("inf"))
+        i = int(torch.argmin(energies))
+        return self.params[i].clone(), energies[i].item()
+
+    def state_dict(self) -> Dict:
+        """Get population state for checkpointing (excluding the optimizer)."""
+        return {
+            "params": self.params,
+            "energies": self.energies,
+            "grad_norms": self.grad_norms,
+            "active": self.active,
+            "converged": self.converged,
+            "culled": self.culled,
+            "calm_steps": self.calm_steps,
+            "step_count": self.step_count,
+            "tol": self.tol,
+            "patience": self.patience
+        }
+
+    def load_state_dict(self, state: Dict):
+        """
+        Restore population state.
+
+        Args:
+            state: State from `state_dict`
+        """
+        for name in ("params", "energies", "grad_norms", "active",
+                     "converged", "culled", "calm_steps"):
+            setattr(self, name, state[name].clone())
+        self.step_count = state["step_count"]
+        self.tol = state["tol"]
+        self.patience = state["patience"]
+
+    def get_metrics(self) -> Dict:
+        """Get population metrics."""
+        return {
+            "step": self.step_count,
+            "active_members": int(self.active.sum()),
+            "converged_members": int(self.converged.sum()),
+            "culled_members": int(self.culled.sum()),
+            "best_energy": self.best()[1]
+        }
@@ -4,10 +4,15 @@ Based on IonQ-ORNL joint research for efficient quantum gradient estimation.
 """
 
 import torch
-import pennylane as qml
 import numpy as np
-from typing import Dict, Tuple, Optional
-from ..optimizers.hybrid_precision import HybridPrecisionOptimizer
+from collections import deque
+from typing import Callable, Dict, Tuple, Optional
+from .circuit_cache import CompiledCircuit, get_circuit
+from .hamiltonians import HamiltonianLike, apply_hamiltonian
+from ..metrics import instrumentation
+
+# Curvature pairs kept by the gradient refinement
+REFINE_HISTORY = 20
 
 class QITEOptimizer:
     def __init__(
@@ -16,7 +21,8 @@ class QITEOptimizer:
         depth: int = 2,
         learning_rate: float = 0.01,
         device: str = "default.qubit",
-        beta: float = 0.03  # Error control parameter
+        beta: float = 0.03,  # Error control parameter
+        refine_iters: int = 20
     ):
         """
         Initialize QITE optimizer.
@@ -27,86 +33,161 @@ class QITEOptimizer:
             learning_rate: Learning rate
             device: Quantum device name
             beta: Error control parameter
+            refine_iters: L-BFGS iteration budget of every `refine_gradient`
+                call (0 disables classical refinement)
         """
         self.n_qubits = n_qubits
         self.depth = depth
         self.lr = learning_rate
         self.beta = beta
+        self.refine_iters = refine_iters
         
-        # Initialize quantum device
-        self.dev = qml.device(device, wires=n_qubits)
+        self.device_name = device
         
-        # Create quantum circuit
+        # Create quantum circuit (shared with every optimizer of this shape)
         self.circuit = self._create_efficient_circuit()
+        self.dev = self.circuit.device
+        
+        # Classical gradient refinement: the last refined gradient and the
+        # L-BFGS curvature pairs, kept across calls to warm-start the next
+        self.refined: Optional[torch.Tensor] = None
+        self.curvature: deque = deque(maxlen=REFINE_HISTORY)
         
-        # Classical optimizer for gradient refinement
-        self.classical_opt = torch.optim.LBFGS([torch.zeros(1)])
+        # Measured statistics reported by get_metrics
+        self.circuit_executions = 0
+        self.gradient_evaluations = 0
+        self.gradient_norm = 0.0
+        self.refined_gradient_norm = 0.0
+        self.refine_evaluations = 0
         
-    def _create_efficient_circuit(self) -> qml.QNode:
-        """Create optimized quantum circuit with reduced depth."""
-        @qml.qnode(self.dev)
-        def circuit(params):
-            # Initial state preparation
-            for i in range(self.n_qubits):
-                qml.RY(params[i], wires=i)
+    def _create_efficient_circuit(self) -> CompiledCircuit:
+        """
+        Create optimized quantum circuit with reduced depth.
+        
+        The ansatz is an RY layer followed by `depth` blocks of even-odd
+        CNOTs, RZ rotations and odd-even CNOTs. Compiled circuits are cached
+        per shape, with consecutive rotations fused per wire.
+        """
+        return get_circuit("qite", self.n_qubits, self.depth, self.device_name)
+        
+    def _expectations(self, params: torch.Tensor) -> torch.Tensor:
+        """Evaluate PauliZ expectations for a (B, P) batch in one broadcast call."""
+        exp_vals = torch.stack(list(self.circuit(params)), dim=-1)
+        return exp_vals.reshape(-1, self.n_qubits)
+        
+    def _evolution_terms(
+        self,
+        params: torch.Tensor,
+        hamiltonian: Optional[HamiltonianLike] = None,
+        epsilon: float = 0.01
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Compute energies and imaginary-time gradients for a batch of parameters.
+        
+        The unshifted and all ±epsilon shifted parameter sets of every member
+        are stacked into a single (K * (2P + 1), P) broadcast circuit call.
+        
+        Args:
+            params: Circuit parameters of shape (K, P)
+            hamiltonian: Optional Hamiltonian (dense, sparse or Pauli terms)
+            epsilon: Finite shift applied to each parameter
             
-            # Efficient entangling layers
-            for d in range(self.depth):
-                # Even-odd pairing for CNOT gates
-                for i in range(0, self.n_qubits-1, 2):
-                    qml.CNOT(wires=[i, i+1])
-                # Parameterized rotations
-                for i in range(self.n_qubits):
-                    qml.RZ(params[self.n_qubits + d*self.n_qubits + i], wires=i)
-                # Odd-even pairing
-                for i in range(1, self.n_qubits-1, 2):
-                    qml.CNOT(wires=[i, i+1])
+        Returns:
+            Tuple of energies (K,) and gradients (K, P)
+        """
+        n_members, n_params = params.shape
+        shifts = epsilon * torch.eye(n_params, dtype=params.dtype)
+        shifted = params.unsqueeze(1)
+        stacked = torch.cat([
+            params,
+            (shifted + shifts).reshape(-1, n_params),
+            (shifted - shifts).reshape(-1, n_params)
+        ])
+        
+        exp_all = self._expectations(stacked)
+        self.circuit_executions += stacked.shape[0]
+        self.gradient_evaluations += n_members
+        
+        with instrumentation.timer("qite.classical"):
+            exp_vals = exp_all[:n_members]
+            exp_plus, exp_minus = exp_all[n_members:].reshape(
+                2, n_members, n_params, self.n_qubits
+            )
             
-            return [qml.expval(qml.PauliZ(i)) for i in range(self.n_qubits)]
+            # If Hamiltonian is provided, use it for evolution
+            if hamiltonian is not None:
+                evolved_state = apply_hamiltonian(hamiltonian, exp_vals)
+            else:
+                # Use default evolution
+                evolved_state = -torch.log(exp_vals + 1e-8)
             
-        return circuit
+            # Central-difference gradient of every parameter at once
+            grad = torch.sum(
+                evolved_state.unsqueeze(1) * (exp_plus - exp_minus), dim=-1
+            ) / (2 * epsilon)
+            energy = torch.sum(evolved_state * exp_vals, dim=-1)
+        
+        return energy.to(params.dtype), grad.to(params.dtype)
         
     def compute_imaginary_time_evolution(
         self,
         params: torch.Tensor,
-        hamiltonian: Optional[torch.Tensor] = None
+        hamiltonian: Optional[HamiltonianLike] = None
     ) -> torch.Tensor:
         """
         Compute quantum gradient using imaginary time evolution.
         
         Args:
-            params: Circuit parameters
-            hamiltonian: Optional Hamiltonian matrix
+            params: Circuit parameters of shape (P,), or (K, P) to evaluate
+                K parameter sets in one batched simulation
+            hamiltonian: Optional Hamiltonian as a dense matrix, a torch
+                sparse COO/CSR tensor, or a list of (coefficient, wires)
+                Pauli-Z terms
             
         Returns:
-            Quantum gradient
+            Quantum gradient with the same shape as `params`
         """
-        # Compute expectation values
-        exp_vals = torch.tensor(self.circuit(params))
-        
-        # If Hamiltonian is provided, use it for evolution
-        if hamiltonian is not None:
-            evolved_state = torch.matmul(hamiltonian, exp_vals)
-        else:
-            # Use default evolution
-            evolved_state = -torch.log(exp_vals + 1e-8)
-        
-        # Compute gradient using parameter shift rule
-        grad = torch.zeros_like(params)
-        epsilon = 0.01
-        
-        for i in range(len(params)):
-            params_plus = params.clone()
-            params_minus = params.clone()
-            params_plus[i] += epsilon
-            params_minus[i] -= epsilon
-            
-            exp_plus = torch.tensor(self.circuit(params_plus))
-            exp_minus = torch.tensor(self.circuit(params_minus))
-            
-            grad[i] = torch.sum(evolved_state * (exp_plus - exp_minus)) / (2 * epsilon)
+        batch = params.detach().reshape(-1, params.shape[-1])
+        _, grad = self._evolution_terms(batch, hamiltonian)
+        
+        # Mean over members when called with a batch
+        self.gradient_norm = torch.linalg.norm(grad, dim=-1).mean().item()
+        instrumentation.record("qite.gradient_norm", self.gradient_norm)
+        
+        return grad.reshape(params.shape)
+        
+    def reset_refinement(self):
+        """Forget the refined gradient and curvature history."""
+        self.refined = None
+        self.curvature.clear()
+        
+    def _loss_and_grad(
+        self,
+        classical_loss: Callable,
+        x: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Evaluate the refinement loss and its gradient at x."""
+        x = x.detach().requires_grad_(True)
+        with torch.enable_grad():
+            loss = classical_loss(x)
+            grad, = torch.autograd.grad(loss, x)
+        return loss.detach(), grad
         
-        return grad
+    def _lbfgs_direction(self, grad: torch.Tensor) -> torch.Tensor:
+        """Two-loop recursion: -H grad for the stored curvature pairs."""
+        q = -grad
+        alphas = []
+        for s, y in reversed(self.curvature):
+            rho = 1 / torch.sum(y * s)
+            alpha = rho * torch.sum(s * q)
+            q = q - alpha * y
+            alphas.append((alpha, rho, s, y))
+        if self.curvature:
+            s, y = self.curvature[-1]
+            q = q * (torch.sum(s * y) / torch.sum(y * y))
+        for alpha, rho, s, y in reversed(alphas):
+            q = q + s * (alpha - rho * torch.sum(y * q))
+        return q
         
     def refine_gradient(
         self,
@@ -116,30 +197,126 @@ class QITEOptimizer:
         """
         Refine quantum gradient using classical optimization.
         
+        Runs up to `refine_iters` L-BFGS iterations with a backtracking
+        line search, minimising `classical_loss` over a refined gradient.
+        The refined gradient and the curvature pairs persist between
+        calls, so every call starts from the previous solution with the
+        previous curvature estimate; pairs are only formed within a call,
+        as the loss changes between calls. A change of gradient shape
+        restarts from `quantum_grad`.
+        
         Args:
             quantum_grad: Quantum gradient
-            classical_loss: Classical loss function
+            classical_loss: Classical loss function of the refined gradient
             
         Returns:
             Refined gradient
         """
-        def closure():
-            self.classical_opt.zero_grad()
-            loss = classical_loss(quantum_grad)
-            loss.backward()
-            return loss
+        with instrumentation.timer("qite.classical"):
+            if self.refine_iters > 0:
+                if self.refined is None or self.refined.shape != quantum_grad.shape:
+                    self.reset_refinement()
+                    self.refined = quantum_grad.detach().clone()
+                
+                x = self.refined
+                loss, grad = self._loss_and_grad(classical_loss, x)
+                evaluations = 1
+                for _ in range(self.refine_iters):
+                    if grad.abs().max() <= 1e-7:
+                        break
+                    direction = self._lbfgs_direction(grad)
+                    slope = torch.sum(grad * direction)
+                    if slope >= 0:
+                        # Stale curvature from earlier calls: fall back to descent
+                        self.curvature.clear()
+                        direction, slope = -grad, -torch.sum(grad * grad)
+                    step = 1.0 if self.curvature else min(1.0, 1.0 / grad.abs().sum().item())
+                    
+                    # Backtracking line search with the Armijo condition
+                    for _ in range(20):
+                        new_x = x + step * direction
+                        new_loss, new_grad = self._loss_and_grad(classical_loss, new_x)
+                        evaluations += 1
+                        if new_loss <= loss + 1e-4 * step * slope:
+                            break
+                        step *= 0.5
+                    else:
+                        break
+                    
+                    s, y = new_x - x, new_grad - grad
+                    if torch.sum(s * y) > 1e-10:
+                        self.curvature.append((s, y))
+                    change = abs(loss - new_loss)
+                    x, loss, grad = new_x, new_loss, new_grad
+                    if s.abs().max() <= 1e-9 or change <= 1e-9:
+                        break
+                
+                self.refined = x.detach()
+                self.refine_evaluations += evaluations
+                instrumentation.count("qite.refine_evaluations", evaluations)
+                refined_grad = self.refined.clone()
+            else:
+                refined_grad = quantum_grad.detach()
             
-        self.classical_opt.step(closure)
+            # Apply error control
+            refined_grad = refined_grad * (1 - self.beta * torch.norm(refined_grad))
         
-        # Apply error control
-        refined_grad = quantum_grad * (1 - self.beta * torch.norm(quantum_grad))
+        self.refined_gradient_norm = torch.norm(refined_grad).item()
+        instrumentation.record("qite.refined_gradient_norm", self.refined_gradient_norm)
         
         return refined_grad
         
+    def state_dict(self) -> Dict:
+        """Get optimizer state for checkpointing."""
+        return {
+            "n_qubits": self.n_qubits,
+            "depth": self.depth,
+            "lr": self.lr,
+            "beta": self.beta,
+            "refine_iters": self.refine_iters,
+            "refined": None if self.refined is None else self.refined.clone(),
+            "curvature": [(s.clone(), y.clone()) for s, y in self.curvature],
+            "circuit_executions": self.circuit_executions,
+            "gradient_evaluations": self.gradient_evaluations,
+            "gradient_norm": self.gradient_norm,
+            "refined_gradient_norm": self.refined_gradient_norm,
+            "refine_evaluations": self.refine_evaluations
+        }
+        
+    def load_state_dict(self, state: Dict):
+        """
+        Restore optimizer state.
+        
+        Args:
+            state: State from `state_dict` of an optimizer with the same shape
+        """
+        if (state["n_qubits"], state["depth"]) != (self.n_qubits, self.depth):
+            raise ValueError(
+                f"Checkpoint is for n_qubits={state['n_qubits']}, depth={state['depth']}; "
+                f"optimizer has n_qubits={self.n_qubits}, depth={self.depth}"
+            )
+        self.lr = state["lr"]
+        self.beta = state["beta"]
+        self.refine_iters = state.get("refine_iters", self.refine_iters)
+        self.refined = state.get("refined")
+        self.curvature = deque(
+            ((s, y) for s, y in state.get("curvature", [])), maxlen=REFINE_HISTORY
+        )
+        self.circuit_executions = state["circuit_executions"]
+        self.gradient_evaluations = state["gradient_evaluations"]
+        self.gradient_norm = state["gradient_norm"]
+        self.refined_gradient_norm = state["refined_gradient_norm"]
+        self.refine_evaluations = state.get("refine_evaluations", 0)
+        
     def get_metrics(self) -> Dict:
         """Get optimization metrics."""
         return {
             "circuit_depth": self.depth,
-            "gradient_norm": self.beta,
-            "qubit_count": self.n_qubits
+            "gradient_norm": self.gradient_norm,
+            "refined_gradient_norm": self.refined_gradient_norm,
+            "qubit_count": self.n_qubits,
+            "beta": self.beta,
+            "circuit_executions": self.circuit_executions,
+            "gradient_evaluations": self.gradient_evaluations,
+            "refine_evaluations": self.refine_evaluations
         } 
\ No newline at end of file
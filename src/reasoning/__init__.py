@@ -0,0 +1 @@
+"""Neuro-symbolic reasoning."""
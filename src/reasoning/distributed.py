@@ -0,0 +1,191 @@
+"""
+Data-parallel training of NeuroSymbolicReasoner over CPU processes.
+Each process trains a replica on its shard of the data; gradients of the
+mapper, refinement network and rule weights are averaged with bucketed
+gloo all-reduces by DistributedDataParallel.
+"""
+
+import socket
+import time
+import numpy as np
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+from torch.nn.parallel import DistributedDataParallel
+from torch.utils.data import DataLoader, TensorDataset
+from torch.utils.data.distributed import DistributedSampler
+from typing import Dict, Optional
+from .neuro_symbolic import NeuroSymbolicReasoner
+
+def find_free_port() -> int:
+    """Pick a free TCP port on localhost for the process group rendezvous."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def init_process_group(rank: int, world_size: int, port: int, backend: str = "gloo"):
+    """
+    Join the process group of a local data-parallel run.
+
+    Args:
+        rank: Rank of this process
+        world_size: Number of processes
+        port: Rendezvous port on localhost
+        backend: torch.distributed backend
+    """
+    dist.init_process_group(
+        backend,
+        init_method=f"tcp://127.0.0.1:{port}",
+        rank=rank,
+        world_size=world_size
+    )
+
+def wrap_reasoner(
+    reasoner: NeuroSymbolicReasoner,
+    bucket_cap_mb: float = 25.0
+) -> DistributedDataParallel:
+    """
+    Wrap a reasoner for data-parallel training.
+
+    Parameters and rule weights are broadcast from rank 0 on construction
+    and gradients are all-reduced in buckets of `bucket_cap_mb` while
+    backward is still running.
+
+    Args:
+        reasoner: Reasoner replica of this process
+        bucket_cap_mb: Gradient bucket size in MB
+
+    Returns:
+        DistributedDataParallel module; the reasoner is its `module`
+    """
+    return DistributedDataParallel(
+        reasoner,
+        bucket_cap_mb=bucket_cap_mb,
+        # Without rules the (empty) rule weights never receive a gradient
+        find_unused_parameters=not reasoner.logic.rules
+    )
+
+def _train_worker(
+    rank: int,
+    world_size: int,
+    port: int,
+    reasoner_kwargs: Dict,
+    inputs: torch.Tensor,
+    targets: torch.Tensor,
+    epochs: int,
+    batch_size: int,
+    lr: float,
+    bucket_cap_mb: float,
+    seed: int,
+    threads: int,
+    results
+):
+    """Train one replica and report its results through the queue."""
+    torch.set_num_threads(threads)
+    torch.manual_seed(seed)
+    init_process_group(rank, world_size, port)
+    try:
+        reasoner = NeuroSymbolicReasoner(**reasoner_kwargs)
+        model = wrap_reasoner(reasoner, bucket_cap_mb)
+        optimizer = torch.optim.Adam(model.parameters(), lr=lr)
+
+        dataset = TensorDataset(inputs, targets)
+        sampler = DistributedSampler(dataset, world_size, rank, shuffle=True, seed=seed)
+        loader = DataLoader(dataset, batch_size=batch_size, sampler=sampler)
+
+        losses = []
+        samples = 0
+        dist.barrier()
+        start = time.perf_counter()
+        for epoch in range(epochs):
+            sampler.set_epoch(epoch)
+            for batch_inputs, batch_targets in loader:
+                outputs, symbolic = model(batch_inputs, return_symbolic=True)
+                loss = reasoner.compute_loss(outputs, batch_targets, symbolic)["total_loss"]
+                optimizer.zero_grad()
+                loss.backward()
+                optimizer.step()
+                losses.append(loss.item())
+                samples += len(batch_inputs)
+        dist.barrier()
+        elapsed = time.perf_counter() - start
+
+        result = {
+            "rank": rank,
+            "samples": samples,
+            "elapsed_s": elapsed,
+            "losses": losses,
+            "parameter_checksum": sum(p.detach().double().sum().item() for p in reasoner.parameters())
+        }
+        if rank == 0:
+            # Numpy copies: shared-memory tensors would not outlive this process
+            result["state_dict"] = {k: v.detach().numpy().copy() if torch.is_tensor(v) else v
+                                    for k, v in reasoner.state_dict().items()}
+        results.put(result)
+    finally:
+        dist.destroy_process_group()
+
+def train_data_parallel(
+    reasoner_kwargs: Dict,
+    inputs: torch.Tensor,
+    targets: torch.Tensor,
+    world_size: int = 2,
+    epochs: int = 1,
+    batch_size: int = 32,
+    lr: float = 1e-3,
+    bucket_cap_mb: float = 25.0,
+    seed: int = 0,
+    threads_per_process: int = 1,
+    port: Optional[int] = None
+) -> Dict:
+    """
+    Train a NeuroSymbolicReasoner on several local CPU processes.
+
+    Args:
+        reasoner_kwargs: Constructor arguments of the reasoner
+        inputs: Training inputs of shape (N, input_dim)
+        targets: Training targets of shape (N, input_dim)
+        world_size: Number of processes
+        epochs: Passes over the data
+        batch_size: Batch size per process
+        lr: Adam learning rate
+        bucket_cap_mb: Gradient all-reduce bucket size in MB
+        seed: Seed for initialisation and shuffling
+        threads_per_process: torch intra-op threads of every process
+        port: Rendezvous port (a free one if None)
+
+    Returns:
+        Dictionary with the trained state_dict (from rank 0), per-rank
+        results and throughput in samples per second
+    """
+    port = port or find_free_port()
+    results = mp.get_context("spawn").SimpleQueue()
+    context = mp.spawn(
+        _train_worker,
+        args=(world_size, port, reasoner_kwargs, inputs, targets, epochs,
+              batch_size, lr, bucket_cap_mb, seed, threads_per_process, results),
+        nprocs=world_size,
+        join=False
+    )
+    # Drain results while joining: a worker blocks on a full result pipe
+    ranks = []
+    done = False
+    while not done:
+        done = context.join(timeout=0.1)
+        while not results.empty():
+            ranks.append(results.get())
+    if len(ranks) != world_size:
+        raise RuntimeError(f"Received results from {len(ranks)} of {world_size} processes")
+    ranks.sort(key=lambda r: r["rank"])
+    elapsed = max(r["elapsed_s"] for r in ranks)
+    samples = sum(r["samples"] for r in ranks)
+    state_dict = {k: torch.from_numpy(v) if isinstance(v, np.ndarray) else v
+                  for k, v in ranks[0].pop("state_dict").items()}
+    return {
+        "state_dict": state_dict,
+        "ranks": ranks,
+        "world_size": world_size,
+        "samples": samples,
+        "elapsed_s": elapsed,
+        "samples_per_s": samples / elapsed if elapsed > 0 else float("inf")
+    }
@@ -7,6 +7,7 @@ import torch
 import torch.nn as nn
 from typing import Dict, List, Tuple, Optional
 import numpy as np
+from ..metrics import instrumentation
 
 class SymbolicMapper(nn.Module):
     def __init__(
@@ -39,7 +40,7 @@ class SymbolicMapper(nn.Module):
         """Map neural representations to symbolic space."""
         return self.network(x)
 
-class LogicEngine:
+class LogicEngine(nn.Module):
     def __init__(
         self,
         n_symbols: int,
@@ -48,14 +49,28 @@ class LogicEngine:
         """
         Initialize logic reasoning engine.
         
+        Rule weights are a registered parameter, so they are trained,
+        checkpointed and synchronised by distributed wrappers together
+        with the rest of the model.
+        
         Args:
             n_symbols: Number of symbolic concepts
             rules: List of logical rules in string format
         """
+        super().__init__()
         self.n_symbols = n_symbols
         self.rules = rules or []
         self.rule_weights = nn.Parameter(torch.ones(len(self.rules)))
         
+    def get_extra_state(self) -> Dict:
+        """Rules are part of the state so checkpoints can be validated."""
+        return {"rules": list(self.rules), "n_symbols": self.n_symbols}
+        
+    def set_extra_state(self, state: Dict):
+        if list(state["rules"]) != list(self.rules):
+            raise ValueError("Checkpoint rules do not match the engine's rules")
+        self.n_symbols = state["n_symbols"]
+        
     def parse_rule(self, rule: str) -> callable:
         """Parse logical rule string into executable function."""
         # Simple rule parser (can be extended for more complex logic)
@@ -68,6 +83,7 @@ class LogicEngine:
         else:
             return lambda x: x[:, int(rule)]
             
+    @instrumentation.timed("logic.infer")
     def infer(
         self,
         symbolic_input: torch.Tensor
@@ -89,8 +105,12 @@ class LogicEngine:
         if results:
             return torch.stack(results, dim=1)
         return symbolic_input
+        
+    def forward(self, symbolic_input: torch.Tensor) -> torch.Tensor:
+        """Perform logical inference (see `infer`)."""
+        return self.infer(symbolic_input)
 
-class NeuroSymbolicReasoner:
+class NeuroSymbolicReasoner(nn.Module):
     def __init__(
         self,
         input_dim: int,
@@ -109,6 +129,7 @@ class NeuroSymbolicReasoner:
             rules: List of logical rules
             temperature: Temperature for knowledge distillation
         """
+        super().__init__()
         self.mapper = SymbolicMapper(input_dim, n_symbols, hidden_dim)
         self.logic = LogicEngine(n_symbols, rules)
         self.temperature = temperature
@@ -120,6 +141,7 @@ class NeuroSymbolicReasoner:
             nn.Linear(hidden_dim, input_dim)
         )
         
+    @instrumentation.timed("reasoner.forward")
     def forward(
         self,
         inputs: torch.Tensor,
@@ -153,6 +175,7 @@ class NeuroSymbolicReasoner:
             return student_out, symbolic
         return student_out, None
         
+    @instrumentation.timed("reasoner.loss")
     def compute_loss(
         self,
         outputs: torch.Tensor,
@@ -198,6 +221,13 @@ class NeuroSymbolicReasoner:
             "total_loss": task_loss + 0.1 * distill_loss + 0.01 * consistency_loss
         }
         
+    def get_extra_state(self) -> Dict:
+        """Non-parameter state stored by `state_dict`."""
+        return {"temperature": self.temperature}
+        
+    def set_extra_state(self, state: Dict):
+        self.temperature = state["temperature"]
+        
     def get_metrics(self) -> Dict:
         """Get reasoning metrics."""
         return {
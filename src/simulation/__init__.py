@@ -0,0 +1 @@
+"""Vectorised multi-agent policy simulation."""
@@ -0,0 +1,121 @@
+"""
+Policy interventions for the simulation engine.
+A policy maps the positions of all agents to a driving force in one
+batched call; composite policies add the forces of their members.
+"""
+
+import torch
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+from ..manifolds.policy_manifold import PolicyManifold
+
+class Policy(ABC):
+    def __init__(
+        self,
+        intervention_time: int = 0,
+        strength: float = 1.0,
+        duration: Optional[int] = None
+    ):
+        """
+        Initialize policy intervention.
+        
+        Args:
+            intervention_time: First step at which the policy acts
+            strength: Scale of the driving force
+            duration: Number of steps the policy stays active (forever if None)
+        """
+        self.intervention_time = intervention_time
+        self.strength = strength
+        self.duration = duration
+        
+    def is_active(self, t: int) -> bool:
+        """Whether the policy acts at step t."""
+        if t < self.intervention_time:
+            return False
+        return self.duration is None or t < self.intervention_time + self.duration
+        
+    @abstractmethod
+    def direction(self, positions: torch.Tensor, t: int,
+                  manifold: PolicyManifold) -> torch.Tensor:
+        """
+        Unscaled force on every agent while the policy is active.
+        
+        Args:
+            positions: Agent positions of shape (n_agents, dim)
+            t: Current step
+            manifold: Manifold the agents live on
+            
+        Returns:
+            Tangent vectors of shape (n_agents, dim)
+        """
+        
+    def force(self, positions: torch.Tensor, t: int,
+              manifold: PolicyManifold) -> torch.Tensor:
+        """
+        Driving force on every agent at step t.
+        
+        Args:
+            positions: Agent positions of shape (n_agents, dim)
+            t: Current step
+            manifold: Manifold the agents live on
+            
+        Returns:
+            Tangent vectors of shape (n_agents, dim), zero while inactive
+        """
+        if not self.is_active(t):
+            return torch.zeros_like(positions)
+        return self.strength * self.direction(positions, t, manifold)
+
+class BasicPolicy(Policy):
+    def __init__(
+        self,
+        intervention_time: int = 0,
+        strength: float = 0.5,
+        target: Optional[Sequence[float]] = None,
+        duration: Optional[int] = None
+    ):
+        """
+        Initialize policy pulling every agent towards a target point.
+        
+        Args:
+            intervention_time: First step at which the policy acts
+            strength: Scale of the pull
+            target: Target point on the manifold (origin if None)
+            duration: Number of steps the policy stays active (forever if None)
+        """
+        super().__init__(intervention_time, strength, duration)
+        self.target = None if target is None else torch.as_tensor(target)
+        
+    def direction(self, positions: torch.Tensor, t: int,
+                  manifold: PolicyManifold) -> torch.Tensor:
+        """Tangent vector from every agent towards the target."""
+        if self.target is None:
+            target = torch.zeros_like(positions[:1])
+        else:
+            target = self.target.to(positions.dtype).expand_as(positions[:1])
+        return manifold.metric.log_map(positions, target)
+
+class MultiPolicy(Policy):
+    def __init__(self, policies: Sequence[Policy]):
+        """
+        Initialize combination of policies acting at the same time.
+        
+        Args:
+            policies: Policies whose forces are summed
+        """
+        super().__init__(
+            intervention_time=min((p.intervention_time for p in policies), default=0)
+        )
+        self.policies = list(policies)
+        
+    def is_active(self, t: int) -> bool:
+        return any(p.is_active(t) for p in self.policies)
+        
+    def direction(self, positions: torch.Tensor, t: int,
+                  manifold: PolicyManifold) -> torch.Tensor:
+        """Sum of the forces of the active member policies."""
+        total = torch.zeros_like(positions)
+        for policy in self.policies:
+            if policy.is_active(t):
+                total = total + policy.force(positions, t, manifold)
+        return total
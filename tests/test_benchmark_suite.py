@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _suite(*args):
+    return subprocess.run(
+        [sys.executable, "benchmarks/suite.py", "--quick", "--min-time", "0.01",
+         "--repeats", "2", "--groups", "logic_infer", "batch_sizer", *args],
+        cwd=ROOT, capture_output=True, text=True
+    )
+
+def test_suite_flags_regressions_against_baseline(tmp_path):
+    """Test the suite saves a baseline and flags cases slower than it"""
+    baseline = tmp_path / "baseline.json"
+    result = _suite("--output", str(baseline))
+    assert result.returncode == 0, result.stderr
+    saved = json.loads(baseline.read_text())
+    assert set(saved["results"]) == {
+        "logic_infer[rules=4,batch=256]", "logic_infer[rules=16,batch=256]",
+        "batch_sizer[history_size=100]"
+    }
+
+    # A baseline 100x faster than this machine must fail the comparison
+    for record in saved["results"].values():
+        record["median_s"] /= 100
+    fast = tmp_path / "fast.json"
+    fast.write_text(json.dumps(saved))
+    result = _suite("--compare", str(fast))
+    assert result.returncode == 1
+    assert "logic_infer[rules=4,batch=256]" in result.stderr
+
+    # And pass against one 100x slower
+    for record in saved["results"].values():
+        record["median_s"] *= 10000
+    slow = tmp_path / "slow.json"
+    slow.write_text(json.dumps(saved))
+    result = _suite("--compare", str(slow))
+    assert result.returncode == 0, result.stderr
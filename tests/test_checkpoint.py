@@ -0,0 +1,77 @@
+import torch
+import pytest
+from src.optimizers.checkpoint import AsyncCheckpointer, load_checkpoint
+from src.optimizers.dynamic_batch import DynamicBatchSizer
+from src.quantum.qite_optimizer import QITEOptimizer
+from src.quantum.population import QITEPopulation
+from src.reasoning.neuro_symbolic import NeuroSymbolicReasoner
+
+HAMILTONIAN = [(0.5, (0, 1)), (-1.0, (1,))]
+
+def _population(seed=0):
+    torch.manual_seed(seed)
+    optimizer = QITEOptimizer(n_qubits=2, depth=1, learning_rate=0.1)
+    return QITEPopulation(optimizer, torch.rand(4, 4) * 3)
+
+def test_resumed_population_reproduces_trajectory(tmp_path):
+    """Test a run resumed from checkpoint matches the uninterrupted run"""
+    uninterrupted = _population()
+    for _ in range(6):
+        uninterrupted.step(HAMILTONIAN)
+
+    first_half = _population()
+    with AsyncCheckpointer() as checkpointer:
+        for _ in range(3):
+            first_half.step(HAMILTONIAN)
+        checkpointer.save(
+            {"population": first_half.state_dict(),
+             "optimizer": first_half.optimizer.state_dict()},
+            tmp_path / "run.pt"
+        )
+        # Later in-place updates must not leak into the queued snapshot
+        first_half.params.add_(100.0)
+
+    state = load_checkpoint(tmp_path / "run.pt")
+    resumed = _population(seed=1)
+    resumed.load_state_dict(state["population"])
+    resumed.optimizer.load_state_dict(state["optimizer"])
+    for _ in range(3):
+        resumed.step(HAMILTONIAN)
+
+    assert resumed.step_count == 6
+    assert torch.equal(resumed.params, uninterrupted.params)
+    assert torch.equal(resumed.energies, uninterrupted.energies)
+
+def test_batch_sizer_and_reasoner_round_trip(tmp_path):
+    """Test state_dict/load_state_dict restore sizer and reasoner state"""
+    sizer = DynamicBatchSizer(warmup_steps=3)
+    expected = [sizer.compute_batch_size(0.1 * s, 1.0, 32) for s in range(20)]
+
+    sizer = DynamicBatchSizer(warmup_steps=3)
+    resumed = [sizer.compute_batch_size(0.1 * s, 1.0, 32) for s in range(12)]
+    reasoner = NeuroSymbolicReasoner(4, 3, hidden_dim=8, rules=["0 AND 1", "2", "1 OR 2"])
+    with torch.no_grad():
+        reasoner.logic.rule_weights.mul_(0.5)
+
+    with AsyncCheckpointer() as checkpointer:
+        checkpointer.save(
+            {"sizer": sizer.state_dict(), "reasoner": reasoner.state_dict()},
+            tmp_path / "state.pt"
+        )
+    state = load_checkpoint(tmp_path / "state.pt")
+
+    sizer = DynamicBatchSizer()
+    sizer.load_state_dict(state["sizer"])
+    resumed += [sizer.compute_batch_size(0.1 * s, 1.0, 32) for s in range(12, 20)]
+    assert resumed == expected
+
+    restored = NeuroSymbolicReasoner(4, 3, hidden_dim=8, rules=["0 AND 1", "2", "1 OR 2"])
+    restored.load_state_dict(state["reasoner"])
+    reasoner.mapper.eval()
+    restored.mapper.eval()
+    inputs = torch.rand(5, 4)
+    assert torch.allclose(restored.forward(inputs)[0], reasoner.forward(inputs)[0])
+    assert torch.equal(restored.logic.rule_weights, reasoner.logic.rule_weights)
+
+    with pytest.raises(ValueError):
+        NeuroSymbolicReasoner(4, 3, hidden_dim=8, rules=["0"]).load_state_dict(state["reasoner"])
@@ -0,0 +1,71 @@
+import torch
+import pytest
+import pennylane as qml
+from src.quantum.circuit_cache import (
+    Gate, cache_info, clear_cache, fuse_single_qubit_rotations, get_circuit
+)
+from src.quantum.qite_optimizer import QITEOptimizer
+
+def _reference_qite(n_qubits, depth):
+    """Unfused QITE circuit as originally written"""
+    @qml.qnode(qml.device("default.qubit", wires=n_qubits))
+    def circuit(params):
+        for i in range(n_qubits):
+            qml.RY(params[i], wires=i)
+        for d in range(depth):
+            for i in range(0, n_qubits-1, 2):
+                qml.CNOT(wires=[i, i+1])
+            for i in range(n_qubits):
+                qml.RZ(params[n_qubits + d*n_qubits + i], wires=i)
+            for i in range(1, n_qubits-1, 2):
+                qml.CNOT(wires=[i, i+1])
+        return qml.state()
+
+    return circuit
+
+def test_rotation_fusion():
+    """Test consecutive rotations collapse to one gate per wire"""
+    gates = [
+        Gate("RY", (0,), (((0, 0),),)),
+        Gate("RZ", (0,), (((0, 1),),)),
+        Gate("RZ", (0,), (((0, 2),),)),
+        Gate("RY", (1,), (((0, 3),),)),
+        Gate("CNOT", (0, 1)),
+        Gate("RZ", (1,), (((0, 4),),)),
+    ]
+    fused = fuse_single_qubit_rotations(gates)
+
+    assert [g.name for g in fused] == ["Rot", "RY", "CNOT", "RZ"]
+    # RY then two RZ: Rot(0, y, z1 + z2)
+    assert fused[0].terms == ((), ((0, 0),), ((0, 1), (0, 2)))
+
+@pytest.mark.parametrize("n_qubits,depth", [(1, 2), (3, 1), (4, 2)])
+def test_fused_circuit_matches_reference(n_qubits, depth):
+    """Test fused compiled circuit reproduces the unfused state"""
+    torch.manual_seed(0)
+    params = torch.rand(n_qubits * (depth + 1)) * 3
+
+    compiled = get_circuit("qite", n_qubits, depth)
+
+    # Compare full states, since PauliZ expectations ignore the RZ phases
+    @qml.qnode(compiled.device)
+    def fused_state(p):
+        compiled._queue(p)
+        return qml.state()
+
+    reference_state = _reference_qite(n_qubits, depth)(params)
+
+    assert torch.allclose(fused_state(params), reference_state, atol=1e-6)
+    assert len(compiled.gates) < n_qubits * (depth + 1) + n_qubits * depth
+
+def test_cache_shares_compiled_circuit():
+    """Test optimizers of the same shape reuse one compiled circuit"""
+    clear_cache()
+    first = QITEOptimizer(n_qubits=3, depth=2)
+    second = QITEOptimizer(n_qubits=3, depth=2)
+    other = QITEOptimizer(n_qubits=3, depth=1)
+
+    assert first.circuit is second.circuit
+    assert first.circuit is not other.circuit
+    assert cache_info()["hits"] == 1
+    assert cache_info()["misses"] == 2
@@ -0,0 +1,82 @@
+import torch
+import pytest
+from src.manifolds.clifford import CliffordAlgebra, ConformalMetric
+
+def test_vector_products():
+    """Test geometric, inner and outer products of vectors"""
+    algebra = CliffordAlgebra([1.0, 1.0, 1.0])
+    a = algebra.vector(torch.tensor([1.0, 2.0, 3.0]))
+    b = algebra.vector(torch.tensor([4.0, 5.0, 6.0]))
+    
+    inner = (a | b).component(0)
+    assert torch.allclose(inner, torch.tensor(32.0))
+    
+    # ab = a.b + a^b
+    geometric = (a * b).to_dense()
+    assert torch.allclose(geometric, ((a | b) + (a ^ b)).to_dense())
+    
+    # e1 e2 = -e2 e1
+    e1 = algebra.multivector(torch.tensor([1.0]), (1,))
+    e2 = algebra.multivector(torch.tensor([1.0]), (2,))
+    assert torch.allclose((e1 * e2).to_dense(), (-(e2 * e1)).to_dense())
+
+def test_signature_and_associativity():
+    """Test negative signature squares and associativity of the product"""
+    algebra = CliffordAlgebra([1.0, 1.0, -1.0])
+    e3 = algebra.multivector(torch.tensor([1.0]), (4,))
+    assert torch.allclose((e3 * e3).component(0), torch.tensor(-1.0))
+    
+    torch.manual_seed(0)
+    blades = tuple(range(algebra.n_blades))
+    x, y, z = (algebra.multivector(torch.randn(5, 8), blades) for _ in range(3))
+    assert torch.allclose(((x * y) * z).to_dense(), (x * (y * z)).to_dense(), atol=1e-5)
+
+def test_sparse_product_blades():
+    """Test that products only store reachable blades"""
+    algebra = CliffordAlgebra([1.0] * 4)
+    a = algebra.vector(torch.randn(10, 4))
+    b = algebra.vector(torch.randn(10, 4))
+    wedge = a ^ b
+    assert wedge.blades == algebra.blades_of_grade(2)
+    assert wedge.values.shape == (10, 6)
+
+def test_conformal_embedding():
+    """Test null embedding, distance and translation"""
+    metric = ConformalMetric(3)
+    torch.manual_seed(0)
+    p = torch.randn(1000, 3, dtype=torch.float64)
+    q = torch.randn(1000, 3, dtype=torch.float64)
+    
+    P = metric.up(p)
+    assert torch.allclose((P | P).component(0), torch.zeros(1000, dtype=torch.float64), atol=1e-10)
+    assert torch.allclose(metric.down(P), p, atol=1e-6)
+    assert torch.allclose(metric.distance(p, q), torch.linalg.norm(p - q, dim=-1), atol=1e-6)
+    
+    moved = metric.exp_map(p, metric.log_map(p, q))
+    assert torch.allclose(moved, q, atol=1e-10)
+
+def test_metric_tensor():
+    """Test pullback metric of the conformal embedding"""
+    metric = ConformalMetric(2)
+    points = torch.randn(7, 2)
+    assert torch.allclose(metric.compute_metric_tensor(points), torch.eye(2).expand(7, 2, 2))
+    assert metric.metric_derivatives(points).shape == (7, 2, 2, 2)
+
+def test_unknown_product():
+    """Test rejection of unknown product kinds"""
+    algebra = CliffordAlgebra([1.0, 1.0])
+    a = algebra.vector(torch.ones(2))
+    with pytest.raises(ValueError):
+        algebra.product(a, a, "cross")
+
+def test_cayley_table():
+    """Test that sparse product tables agree with the full Cayley table"""
+    algebra = CliffordAlgebra([1.0, -1.0, 1.0])
+    sign, index = algebra.cayley_table()
+    blades = tuple(range(algebra.n_blades))
+    eye = torch.eye(algebra.n_blades)
+    for a in blades:
+        x = algebra.multivector(eye[a], blades)
+        for b in blades:
+            y = algebra.multivector(eye[b], blades)
+            assert torch.allclose((x * y).to_dense(), sign[a, b] * eye[index[a, b]])
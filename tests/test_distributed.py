@@ -0,0 +1,25 @@
+import torch
+from src.reasoning.distributed import train_data_parallel
+from src.reasoning.neuro_symbolic import NeuroSymbolicReasoner
+
+REASONER = {"input_dim": 4, "n_symbols": 3, "hidden_dim": 8,
+            "rules": ["0 AND 1", "2", "1 OR 2"]}
+
+def test_data_parallel_replicas_stay_in_sync():
+    """Test ranks end with identical parameters, including rule weights"""
+    torch.manual_seed(0)
+    inputs = torch.rand(64, 4)
+    targets = torch.softmax(torch.rand(64, 4), dim=1)
+
+    result = train_data_parallel(
+        REASONER, inputs, targets, world_size=2, epochs=2, batch_size=8, lr=1e-2
+    )
+
+    checksums = [r["parameter_checksum"] for r in result["ranks"]]
+    assert checksums[0] == checksums[1]
+    assert result["samples"] == 2 * len(inputs)
+    assert all(len(r["losses"]) == 8 for r in result["ranks"])
+
+    trained = NeuroSymbolicReasoner(**REASONER)
+    trained.load_state_dict(result["state_dict"])
+    assert not torch.equal(trained.logic.rule_weights, torch.ones(3))
@@ -0,0 +1,126 @@
+import os
+import numpy as np
+import pytest
+from src.experiments.registry import anneal_experiment, get_experiment, qite_experiment
+from src.experiments.run import (
+    ResultCache, collect, expand_sweep, job_key, main, run_jobs, save_results
+)
+
+def test_expand_sweep():
+    """Test Cartesian sweep expansion with base and explicit points"""
+    config = {
+        "base": {"steps": 5, "depth": 1},
+        "sweep": {"n_qubits": [2, 3], "depth": [1, 2]},
+        "points": [{"n_qubits": 6}]
+    }
+    jobs = expand_sweep(config)
+    assert len(jobs) == 5
+    assert jobs[0] == {"steps": 5, "depth": 1, "n_qubits": 2}
+    assert jobs[-1] == {"steps": 5, "depth": 1, "n_qubits": 6}
+    assert expand_sweep({"base": {"a": 1}}) == [{"a": 1}]
+
+def test_job_key():
+    """Test that cache keys depend on parameters and code version only"""
+    key = job_key("qite", {"a": 1, "b": 2}, "v1")
+    assert key == job_key("qite", {"b": 2, "a": 1}, "v1")
+    assert key != job_key("qite", {"a": 1, "b": 3}, "v1")
+    assert key != job_key("qite", {"a": 1, "b": 2}, "v2")
+
+def test_unknown_experiment():
+    """Test resolving experiment names"""
+    assert get_experiment("src.experiments.registry:qite_experiment") is get_experiment("qite")
+    with pytest.raises(KeyError):
+        get_experiment("missing")
+
+def test_run_jobs_cache_and_failures(tmp_path):
+    """Test parallel jobs, error isolation and cache reuse"""
+    cache = ResultCache(tmp_path / "cache")
+    jobs = [
+        {"agents": 20, "time_steps": 3, "strength": 0.5},
+        {"agents": 20, "time_steps": 3, "unknown": 1}
+    ]
+    records = run_jobs("simulation", jobs, workers=2, cache=cache)
+    records += run_jobs("simulation", [{"time_steps": 10 ** 9}], limits={"timeout_s": 3})
+    assert [r["status"] for r in records] == ["ok", "error", "timeout"]
+    assert "unexpected keyword" in records[1]["error"]
+    assert records[0]["result"]["final_mean_distance"] > 0
+    
+    rerun = run_jobs("simulation", jobs[:1], cache=cache)
+    assert rerun[0]["cached"]
+    assert rerun[0]["result"] == records[0]["result"]
+    
+    columns = collect(records)
+    assert columns["status"].tolist() == ["ok", "error", "timeout"]
+    assert columns["time_steps"].dtype == np.int64
+    assert np.isnan(columns["agents"][2])
+    assert np.isnan(columns["final_mean_distance"][1:]).all()
+    
+    save_results(columns, tmp_path / "out" / "results.npz")
+    loaded = np.load(tmp_path / "out" / "results.npz")
+    assert set(loaded.files) == set(columns)
+
+def _crash():
+    os._exit(3)
+
+def _spin():
+    while True:
+        pass
+
+def _threads():
+    import torch
+    return {"threads": torch.get_num_threads(), "omp": int(os.environ["OMP_NUM_THREADS"])}
+
+def test_run_jobs_hard_crash_and_cpu_limit():
+    """Test workers dying without a result fail only their job"""
+    crash, = run_jobs(f"{__name__}:_crash", [{}], limits={"timeout_s": 30})
+    assert crash["status"] == "error"
+    assert "code 3" in crash["error"]
+    
+    spin, = run_jobs(f"{__name__}:_spin", [{}], limits={"cpu_s": 1, "timeout_s": 30})
+    assert spin["status"] == "error"
+    assert spin["elapsed_s"] < 30
+
+def test_run_jobs_thread_limit():
+    """Test the thread limit reaches libraries imported by the worker"""
+    record, = run_jobs(f"{__name__}:_threads", [{}], limits={"threads": 1})
+    assert record["result"] == {"threads": 1, "omp": 1}
+
+def test_experiment_results_are_measured():
+    """Test built-in experiments report measured, parameter-dependent values"""
+    assert qite_experiment(n_qubits=2, depth=1, steps=3, population=2)["gradient_norm"] > 0
+    energies = [
+        anneal_experiment(n_qubits=3, steps=30, schedule_power=power)["energy"]
+        for power in (0.5, 2.0)
+    ]
+    # The field-free chain keeps every <Z_i> at zero, but not <Z_i Z_j>
+    assert abs(energies[0]) > 0.1
+    assert abs(energies[0] - energies[1]) > 1e-3
+
+def test_external_experiment_edit_invalidates_cache(tmp_path, monkeypatch):
+    """Test editing a module:function experiment invalidates its cached results"""
+    module = tmp_path / "external_experiment.py"
+    module.write_text("def run():\n    return {'value': 1}\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    cache = ResultCache(tmp_path / "cache")
+
+    first, = run_jobs("external_experiment:run", [{}], cache=cache)
+    assert first["result"] == {"value": 1}
+    assert run_jobs("external_experiment:run", [{}], cache=cache)[0]["cached"]
+
+    module.write_text("def run():\n    return {'value': 1 + 1}\n")
+    edited, = run_jobs("external_experiment:run", [{}], cache=cache)
+    assert not edited["cached"]
+    assert edited["result"] == {"value": 2}
+
+def test_main_dry_run(tmp_path, capsys):
+    """Test listing the jobs of a YAML config"""
+    config = tmp_path / "sweep.yaml"
+    config.write_text(
+        "experiment: qite\n"
+        "base: {steps: 2}\n"
+        "sweep:\n"
+        "  n_qubits: [2, 3]\n"
+        "  beta: [0.01, 0.03]\n"
+    )
+    assert main([str(config), "--dry-run"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 4
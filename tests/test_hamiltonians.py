@@ -0,0 +1,40 @@
+import torch
+import pytest
+from src.quantum.hamiltonians import PauliTerms, apply_hamiltonian
+from src.quantum.qite_optimizer import QITEOptimizer
+
+def test_pauli_terms_match_dense():
+    """Test term-wise evaluation agrees with the equivalent dense matrix"""
+    terms = PauliTerms.nearest_neighbour(5, coupling=0.7, field=-0.3, periodic=True)
+    dense = terms.to_dense()
+    exp_vals = torch.rand(8, 5, dtype=torch.float64)
+
+    assert torch.allclose(dense, dense.T)
+    assert terms.nnz == 2 * 5 + 5
+    assert torch.allclose(terms.apply(exp_vals), exp_vals @ dense.T)
+    assert torch.allclose(PauliTerms.from_dense(dense).to_dense(), dense)
+
+@pytest.mark.parametrize("layout", ["dense", "coo", "csr", "terms", "list"])
+def test_qite_hamiltonian_dispatch(layout):
+    """Test every Hamiltonian format yields the dense-matrix gradient"""
+    torch.manual_seed(0)
+    term_list = [(0.5, (0, 1)), (0.5, (1, 2)), (0.5, (2, 3)), (-1.0, (2,))]
+    terms = PauliTerms(term_list, n_qubits=4)
+    hamiltonian = {
+        "dense": terms.to_dense(),
+        "coo": terms.to_sparse(),
+        "csr": terms.to_sparse(torch.sparse_csr),
+        "terms": terms,
+        "list": term_list,
+    }[layout]
+
+    optimizer = QITEOptimizer(n_qubits=4, depth=1)
+    params = torch.rand(3, 8)
+    expected = optimizer.compute_imaginary_time_evolution(params, terms.to_dense())
+    grad = optimizer.compute_imaginary_time_evolution(params, hamiltonian)
+
+    assert torch.allclose(grad, expected, atol=1e-6)
+    assert torch.allclose(
+        apply_hamiltonian(hamiltonian, params[:, :4].double()),
+        params[:, :4].double() @ terms.to_dense().T
+    )
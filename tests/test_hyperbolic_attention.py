@@ -0,0 +1,71 @@
+import torch
+from src.manifolds.hyperbolic_attention import (
+    HyperbolicAttention, mobius_add, expmap0, logmap0,
+    distance, pairwise_distance, project
+)
+
+def _points(*shape, scale=0.3, dtype=torch.float64):
+    return expmap0(scale * torch.randn(*shape, dtype=dtype))
+
+def test_mobius_operations():
+    """Test Möbius identity, inverse and exp/log round trip"""
+    torch.manual_seed(0)
+    x = _points(10, 4)
+    assert torch.allclose(mobius_add(x, torch.zeros_like(x)), x)
+    assert torch.allclose(mobius_add(-x, x), torch.zeros_like(x), atol=1e-12)
+    assert torch.allclose(expmap0(logmap0(x)), x)
+
+def test_pairwise_distance():
+    """Test pairwise distances against the arcosh formula"""
+    torch.manual_seed(0)
+    x = _points(6, 3)
+    y = _points(5, 3)
+    d = pairwise_distance(x, y)
+    
+    sq = ((x[:, None] - y[None]) ** 2).sum(-1)
+    x2 = (x ** 2).sum(-1)[:, None]
+    y2 = (y ** 2).sum(-1)[None]
+    expected = torch.acosh(1 + 2 * sq / ((1 - x2) * (1 - y2)))
+    assert torch.allclose(d, expected)
+    assert torch.allclose(distance(x[:, None], y[None]), expected)
+    assert torch.allclose(torch.diagonal(pairwise_distance(x, x)), torch.zeros(6, dtype=torch.float64), atol=1e-6)
+
+def test_distance_near_boundary():
+    """Test stability for float32 points close to the boundary"""
+    x = project(torch.tensor([[0.999999, 0.0], [0.0, -0.999999]], requires_grad=True))
+    d = pairwise_distance(x, x)
+    d.sum().backward()
+    assert torch.isfinite(d).all()
+
+def test_chunked_attention_matches_single_block():
+    """Test that chunking does not change outputs or gradients"""
+    torch.manual_seed(0)
+    x = _points(2, 37, 4, dtype=torch.float32).requires_grad_()
+    layer = HyperbolicAttention(4, chunk_size=64)
+    reference = layer(x)
+    reference.sum().backward()
+    grad = x.grad.clone()
+    
+    x.grad = None
+    layer.chunk_size = 8
+    chunked = layer(x)
+    chunked.sum().backward()
+    
+    assert chunked.shape == (2, 37, 4)
+    assert torch.allclose(chunked, reference, atol=1e-6)
+    assert torch.allclose(x.grad, grad, atol=1e-5)
+    assert (chunked.norm(dim=-1) < 1).all()
+
+def test_key_mask():
+    """Test that masked keys do not affect the output"""
+    torch.manual_seed(0)
+    layer = HyperbolicAttention(3, chunk_size=4).eval()
+    q = _points(5, 3, dtype=torch.float32)
+    k = _points(9, 3, dtype=torch.float32)
+    mask = torch.arange(9) < 6
+    
+    out = layer(q, k, key_mask=mask)
+    k_changed = k.clone()
+    k_changed[6:] = _points(3, 3, dtype=torch.float32)
+    assert torch.allclose(layer(q, k_changed, key_mask=mask), out)
+    assert torch.allclose(out, layer(q, k[:6]), atol=1e-6)
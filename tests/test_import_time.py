@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_import_time_budgets():
+    """Test cold-start imports stay within budget and avoid heavy backends"""
+    result = subprocess.run(
+        [sys.executable, "benchmarks/bench_import.py", "--check", "--repeats", "2"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+def test_lazy_package_exports():
+    """Test public classes resolve lazily from the package root"""
+    code = (
+        "import sys, src\n"
+        "assert 'torch' not in sys.modules\n"
+        "from src import DynamicBatchSizer\n"
+        "assert 'torch' not in sys.modules\n"
+        "assert 'QITEOptimizer' in dir(src)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
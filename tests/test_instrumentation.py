@@ -0,0 +1,63 @@
+import json
+import torch
+import pytest
+from src.metrics import instrumentation
+from src.quantum.qite_optimizer import QITEOptimizer
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    instrumentation.reset()
+    yield
+    instrumentation.reset()
+
+def test_disabled_collects_nothing():
+    """Test disabled instrumentation records no measurements"""
+    instrumentation.disable()
+    optimizer = QITEOptimizer(n_qubits=2, depth=1)
+    optimizer.compute_imaginary_time_evolution(torch.rand(4), torch.eye(2))
+
+    assert instrumentation.timer("anything") is instrumentation.timer("other")
+    assert instrumentation.snapshot() == {"counters": {}, "timers": {}, "values": {}}
+
+def test_qite_counts_and_measured_gradient_norm(tmp_path):
+    """Test QNode executions and gradient norms are actually measured"""
+    optimizer = QITEOptimizer(n_qubits=2, depth=1)
+    params = torch.rand(3, 4)
+
+    with instrumentation.collecting():
+        grad = optimizer.compute_imaginary_time_evolution(params, torch.eye(2))
+    stats = instrumentation.snapshot()
+
+    # One broadcast call covering K * (2P + 1) circuits
+    assert stats["counters"]["qnode.calls"] == 1
+    assert stats["counters"]["qnode.executions"] == 3 * (2 * 4 + 1)
+    assert stats["timers"]["qnode.qite"]["calls"] == 1
+    assert stats["timers"]["qite.classical"]["total_s"] > 0
+
+    expected_norm = torch.linalg.norm(grad, dim=1).mean().item()
+    metrics = optimizer.get_metrics()
+    assert metrics["gradient_norm"] == pytest.approx(expected_norm)
+    assert metrics["circuit_executions"] == 27
+    assert stats["values"]["qite.gradient_norm"] == pytest.approx(expected_norm)
+
+    sink = tmp_path / "metrics.jsonl"
+    instrumentation.export_jsonl(sink, run="test", step=1)
+    instrumentation.export_jsonl(sink, run="test", step=2)
+    lines = [json.loads(line) for line in sink.read_text().splitlines()]
+    assert [line["step"] for line in lines] == [1, 2]
+    assert lines[0]["counters"]["qnode.executions"] == 27
+
+def test_population_step_records_gradient_norm():
+    """Test batched population steps measure the mean active gradient norm"""
+    from src.quantum.population import QITEPopulation
+
+    optimizer = QITEOptimizer(n_qubits=2, depth=1)
+    population = QITEPopulation(optimizer, torch.rand(4, 4) * 3)
+    population.active[0] = False
+
+    with instrumentation.collecting():
+        population.step(torch.eye(2))
+    expected_norm = population.grad_norms[1:].mean().item()
+    assert expected_norm > 0
+    assert optimizer.get_metrics()["gradient_norm"] == pytest.approx(expected_norm)
+    assert instrumentation.snapshot()["values"]["qite.gradient_norm"] == pytest.approx(expected_norm)
@@ -36,4 +36,45 @@ def test_christoffel_symbols():
     assert symbols.shape == (2, 2, 2)
     
     # For flat manifold at origin, all symbols should be zero
-    assert torch.allclose(symbols, torch.zeros_like(symbols)) 
\ No newline at end of file
+    assert torch.allclose(symbols, torch.zeros_like(symbols)) 
+
+
+class _PolarMetric:
+    """Flat plane in polar coordinates (r, theta): g = diag(1, r^2)"""
+    
+    def compute_metric_tensor(self, point):
+        ones = torch.ones_like(point[..., 0])
+        return torch.diag_embed(torch.stack([ones, point[..., 0] ** 2], dim=-1))
+    
+    def metric_derivatives(self, point):
+        grad = torch.zeros(point.shape[:-1] + (2, 2, 2))
+        grad[..., 1, 1, 0] = 2 * point[..., 0]
+        return grad
+
+def test_christoffel_symbols_curved():
+    """Test Christoffel symbols of a non-Euclidean metric"""
+    manifold = PolicyManifold(dim=2)
+    manifold.metric = _PolarMetric()
+    points = torch.tensor([[2.0, 0.3], [0.5, 1.0]])
+    
+    symbols = manifold._compute_christoffel_symbols(points)
+    r = points[:, 0]
+    
+    expected = torch.zeros(2, 2, 2, 2)
+    expected[:, 1, 1, 0] = -r
+    expected[:, 0, 1, 1] = 1 / r
+    expected[:, 1, 0, 1] = 1 / r
+    assert torch.allclose(symbols, expected)
+
+def test_parallel_transport_batched():
+    """Test batched transport against per-sample transport"""
+    manifold = PolicyManifold(dim=3)
+    tensors = torch.randn(5, 3)
+    starts = torch.randn(5, 3)
+    ends = torch.randn(5, 3)
+    
+    batched = manifold.parallel_transport(tensors, starts, ends)
+    assert batched.shape == (5, 3)
+    for k in range(5):
+        single = manifold.parallel_transport(tensors[k], starts[k], ends[k])
+        assert torch.allclose(batched[k], single, atol=1e-6)
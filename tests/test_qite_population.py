@@ -0,0 +1,102 @@
+import torch
+import pytest
+from src.quantum.qite_optimizer import QITEOptimizer
+from src.quantum.population import QITEPopulation
+
+def _serial_gradient(optimizer, params, hamiltonian, epsilon=0.01):
+    """Reference per-parameter loop of the original implementation"""
+    exp_vals = torch.stack(list(optimizer.circuit(params)))
+    evolved_state = torch.matmul(hamiltonian.double(), exp_vals)
+    grad = torch.zeros_like(params)
+    for i in range(len(params)):
+        params_plus = params.clone()
+        params_minus = params.clone()
+        params_plus[i] += epsilon
+        params_minus[i] -= epsilon
+        exp_plus = torch.stack(list(optimizer.circuit(params_plus)))
+        exp_minus = torch.stack(list(optimizer.circuit(params_minus)))
+        grad[i] = torch.sum(evolved_state * (exp_plus - exp_minus)) / (2 * epsilon)
+    return grad
+
+@pytest.fixture
+def hamiltonian():
+    return torch.tensor([[1.0, 0.5, 0.0], [0.5, -1.0, 0.5], [0.0, 0.5, 1.0]])
+
+def test_batched_gradient_matches_serial(hamiltonian):
+    """Test a (K, P) call reproduces K serial gradient evaluations"""
+    torch.manual_seed(0)
+    optimizer = QITEOptimizer(n_qubits=3, depth=1)
+    params = torch.rand(4, 6)
+
+    batched = optimizer.compute_imaginary_time_evolution(params, hamiltonian)
+
+    assert batched.shape == params.shape
+    for k in range(len(params)):
+        single = optimizer.compute_imaginary_time_evolution(params[k], hamiltonian)
+        reference = _serial_gradient(optimizer, params[k], hamiltonian)
+        assert torch.allclose(batched[k], single, atol=1e-6)
+        assert torch.allclose(single, reference, atol=1e-6)
+
+def test_population_early_termination_and_culling(hamiltonian):
+    """Test members stop independently and culling keeps the best member"""
+    torch.manual_seed(0)
+    optimizer = QITEOptimizer(n_qubits=3, depth=1, learning_rate=0.2)
+    population = QITEPopulation(optimizer, torch.rand(8, 6) * 3, tol=1e-2)
+
+    # A member sitting on a stationary point stops immediately
+    population.params[0] = 0.0
+    population.patience = 1
+    population.step(hamiltonian)
+    assert population.converged[0]
+    assert not population.active[0]
+
+    population.step(hamiltonian)
+    energies = population.energies.clone()
+    culled = population.cull(fraction=0.5)
+    assert len(culled) == 3
+    assert energies[population.active].max() <= energies[culled].min()
+
+    best_params, best_energy = population.run(5, hamiltonian)
+    assert best_params.shape == (6,)
+    assert best_energy == population.energies[~population.culled].min().item()
+
+def _refinement_errors(optimizer, A, gradients, warm=True):
+    errors = []
+    for quantum_grad in gradients:
+        if not warm:
+            optimizer.reset_refinement()
+        refined = optimizer.refine_gradient(
+            quantum_grad, lambda x: 0.5 * x @ A @ x - quantum_grad @ x
+        )
+        errors.append(torch.linalg.norm(refined - torch.linalg.solve(A, quantum_grad)).item())
+    return errors
+
+def test_refine_gradient_warm_starts_across_calls():
+    """Test refinement keeps its curvature history between calls"""
+    torch.manual_seed(0)
+    A = torch.randn(6, 6, dtype=torch.float64)
+    A = A @ A.T + 0.1 * torch.eye(6, dtype=torch.float64)
+    gradients = [torch.randn(6, dtype=torch.float64) for _ in range(6)]
+
+    warm = QITEOptimizer(n_qubits=2, depth=2, beta=0.0, refine_iters=4)
+    cold = QITEOptimizer(n_qubits=2, depth=2, beta=0.0, refine_iters=4)
+    warm_errors = _refinement_errors(warm, A, gradients)
+    cold_errors = _refinement_errors(cold, A, gradients, warm=False)
+    # With the same budget only the warm-started refinement converges
+    assert warm_errors[-1] < 1e-3
+    assert cold_errors[-1] > 100 * warm_errors[-1]
+    assert 0 < len(warm.curvature) <= 20
+
+    restored = QITEOptimizer(n_qubits=2, depth=2)
+    restored.load_state_dict(warm.state_dict())
+    assert restored.refine_iters == 4
+    assert torch.equal(restored.refined, warm.refined)
+    assert _refinement_errors(restored, A, gradients[:1]) == _refinement_errors(warm, A, gradients[:1])
+
+def test_refine_gradient_without_budget_only_applies_error_control():
+    """Test refine_iters=0 skips L-BFGS"""
+    optimizer = QITEOptimizer(n_qubits=2, depth=1, beta=0.1, refine_iters=0)
+    quantum_grad = torch.tensor([3.0, 4.0, 0.0, 0.0])
+    refined = optimizer.refine_gradient(quantum_grad, lambda x: (x ** 2).sum())
+    assert torch.allclose(refined, quantum_grad * 0.5)
+    assert optimizer.refined is None
@@ -0,0 +1,44 @@
+import torch
+from src.quantum.optimizer import QuantumOptimizer
+
+HAMILTONIAN = [(0.5, (0, 1)), (0.5, (1, 2)), (-1.0, (1,))]
+
+def test_annealing_evolves_state_across_steps():
+    """Test the result depends on the path through the schedule, not only its end"""
+    optimizer = QuantumOptimizer(n_qubits=3)
+    coarse = optimizer.optimize(HAMILTONIAN, steps=20)
+    fine = optimizer.optimize(HAMILTONIAN, steps=200)
+    slow = QuantumOptimizer(n_qubits=3, anneal_time=40.0).optimize(HAMILTONIAN, steps=200)
+
+    assert not torch.allclose(coarse, fine, atol=1e-3)
+    assert not torch.allclose(fine, slow, atol=1e-3)
+    # Annealing lowers the middle spin towards the problem's ground state
+    assert fine[1] < -0.9
+
+def test_adaptive_schedule_tracks_fixed_schedule():
+    """Test adaptive annealing approaches the fixed result as steps get finer"""
+    optimizer = QuantumOptimizer(n_qubits=3)
+    fixed = optimizer.optimize(HAMILTONIAN, steps=200)
+    loose = optimizer.optimize(HAMILTONIAN, steps=200, adaptive=True, max_change=0.02)
+    loose_evaluations = optimizer.last_run["evaluations"]
+    tight = optimizer.optimize(HAMILTONIAN, steps=200, adaptive=True, max_change=0.005)
+
+    metrics = optimizer.get_metrics()
+    loose_error = torch.max(torch.abs(loose - fixed))
+    tight_error = torch.max(torch.abs(tight - fixed))
+    assert tight_error < loose_error < 0.05
+    assert loose_evaluations < metrics["evaluations"] < 200
+    assert metrics["evaluations_saved"] == 200 - metrics["evaluations"]
+    assert metrics["circuit_executions"] == 200 + loose_evaluations + metrics["evaluations"]
+
+def test_adaptive_schedule_stops_early():
+    """Test annealing stops once the schedule can no longer move the result"""
+    optimizer = QuantumOptimizer(n_qubits=3, schedule_fn=lambda t: min(1.0, 2 * t))
+    # Same problem as a dense coupling matrix
+    coupling = torch.tensor([[0.0, 0.5, 0.0], [0.5, -1.0, 0.5], [0.0, 0.5, 0.0]])
+    fixed = optimizer.optimize(coupling, steps=200)
+    adaptive = optimizer.optimize(HAMILTONIAN, steps=200, adaptive=True)
+
+    assert optimizer.last_run["converged"]
+    assert optimizer.last_run["final_t"] < 0.75
+    assert torch.allclose(adaptive, fixed, atol=0.05)
@@ -0,0 +1,69 @@
+import pytest
+import torch
+from src.metrics.trajectory import TrajectoryRecorder, load_trajectory
+from src.simulation.policies import BasicPolicy, MultiPolicy, Policy
+from src.simulation.simulator import PolicySimulator
+
+def test_state_layout():
+    """Test struct-of-arrays agent state"""
+    sim = PolicySimulator(agents=1000, dim=3, random_seed=0)
+    assert sim.positions.shape == (1000, 3)
+    assert sim.velocities.shape == (1000, 3)
+    assert sim.susceptibility.shape == (1000,)
+    assert sim.memory_bytes() == 1000 * 7 * 4
+
+def test_policy_intervention_time():
+    """Test that policies only act from their intervention time"""
+    sim = PolicySimulator(agents=10, random_seed=0)
+    policy = BasicPolicy(intervention_time=5, strength=0.5, duration=3)
+    x = sim.positions
+    
+    assert torch.count_nonzero(policy.force(x, 4, sim.manifold)) == 0
+    assert torch.allclose(policy.force(x, 5, sim.manifold), -0.5 * x)
+    assert not policy.is_active(8)
+    
+    multi = MultiPolicy([policy, BasicPolicy(intervention_time=6, target=[1.0, 0.0])])
+    assert torch.allclose(multi.force(x, 5, sim.manifold), policy.force(x, 5, sim.manifold))
+    assert multi.is_active(20) and not multi.is_active(2)
+    
+    with pytest.raises(TypeError):
+        Policy()
+
+def test_chunking_does_not_change_results():
+    """Test that block size does not affect the trajectory"""
+    policy = BasicPolicy(intervention_time=2)
+    results = [
+        PolicySimulator(agents=100, random_seed=1, chunk_size=chunk).run(policy, time_steps=5)
+        for chunk in (7, 1000)
+    ]
+    # Chunks straddling the boundaries of the noise blocks
+    results += [
+        PolicySimulator(agents=10000, random_seed=1, chunk_size=chunk).run(policy, time_steps=3)
+        for chunk in (3000, 10000)
+    ]
+    for name in results[0]:
+        assert torch.allclose(results[0][name], results[1][name], atol=1e-6)
+        assert torch.allclose(results[2][name], results[3][name], atol=1e-6)
+
+def test_policy_pulls_agents_to_target():
+    """Test that an active policy moves the population towards its target"""
+    free = PolicySimulator(agents=2000, random_seed=0).run(time_steps=30)
+    driven = PolicySimulator(agents=2000, random_seed=0).run(
+        BasicPolicy(intervention_time=10, strength=1.0), time_steps=30
+    )
+    assert torch.allclose(free["mean_distance"][:10], driven["mean_distance"][:10])
+    assert driven["mean_distance"][-1] < free["mean_distance"][-1]
+
+def test_run_recorder(tmp_path):
+    """Test streaming run statistics to a trajectory recorder"""
+    sim = PolicySimulator(agents=50, random_seed=0)
+    path = tmp_path / "sim.npy"
+    with TrajectoryRecorder(path, sim.trajectory_fields()) as recorder:
+        results = sim.run(BasicPolicy(intervention_time=3), time_steps=6, recorder=recorder)
+    
+    trajectory = load_trajectory(path)
+    assert len(trajectory) == 6
+    assert trajectory["policy_active"].tolist() == [False] * 3 + [True] * 3
+    assert torch.allclose(
+        torch.from_numpy(trajectory["mean_distance"].copy()).float(), results["mean_distance"]
+    )
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from src.metrics.trajectory import TrajectoryRecorder, load_trajectory
+from src.optimizers.dynamic_batch import DynamicBatchSizer
+
+def test_recorder_round_trip(tmp_path):
+    """Test chunked appends are readable through a memory map"""
+    path = tmp_path / "run.npy"
+    fields = {"step": "i8", "s": "f8", "expvals": ("f4", (3,))}
+
+    with TrajectoryRecorder(path, fields, chunk_size=4) as recorder:
+        for t in range(10):
+            recorder.append(step=t, s=t / 10, expvals=[t, -t, 0.5])
+        recorder.extend(
+            step=np.arange(10, 25),
+            s=np.linspace(1, 2, 15),
+            expvals=np.ones((15, 3))
+        )
+        # Completed chunks are readable before the run finishes
+        assert len(load_trajectory(path)) == 24
+        assert len(recorder) == 25
+
+    trajectory = load_trajectory(path)
+    assert isinstance(trajectory, np.memmap)
+    assert trajectory.shape == (25,)
+    assert np.array_equal(trajectory["step"], np.arange(25))
+    assert np.allclose(trajectory["expvals"][3], [3, -3, 0.5])
+    assert trajectory["s"][-1] == pytest.approx(2.0)
+
+def test_batch_sizer_streams_full_history(tmp_path):
+    """Test in-memory history stays bounded while every step is recorded"""
+    path = tmp_path / "batch.npy"
+    sizer = DynamicBatchSizer(warmup_steps=5, history_size=20)
+    sizer.recorder = TrajectoryRecorder(path, sizer.trajectory_fields(), chunk_size=16)
+
+    for step in range(100):
+        sizer.compute_batch_size(0.1 * (step % 7), 1.0 / (step + 1), 64)
+    sizer.recorder.close()
+
+    assert len(sizer.grad_history) == 20
+    trajectory = load_trajectory(path)
+    assert len(trajectory) == 100
+    assert trajectory["step"][-1] == 100
+    assert trajectory["grad_norm"][-20:] == pytest.approx(list(sizer.grad_history))
+    # Efficiency is relative to the configured history size
+    sizer.batch_history.extend(range(20))
+    assert sizer.get_metrics()["batch_efficiency"] == pytest.approx(1.0)